@@ -1,6 +1,23 @@
 """Core STL specification and evaluation components."""
 
 from .specification import STLSpecification
-from .robustness import compute_robustness
+from .bundle import SpecificationBundle
+from .robustness import (
+    RobustnessConfig,
+    Signal,
+    as_signal_array,
+    compute_robustness,
+    compute_robustness_array,
+    parallel_robustness
+)
 
-__all__ = ['STLSpecification', 'compute_robustness']
+__all__ = [
+    'STLSpecification',
+    'SpecificationBundle',
+    'RobustnessConfig',
+    'Signal',
+    'as_signal_array',
+    'compute_robustness',
+    'compute_robustness_array',
+    'parallel_robustness',
+]
@@ -0,0 +1,111 @@
+"""
+Numba-compiled kernels for temporal robustness reductions.
+
+numba is an optional dependency. When it is not installed, NUMBA_AVAILABLE
+is False and robustness.py and bundle.py fall back to their NumPy
+implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # 'nnan'/'ninf' are deliberately left out so the NaN checks below and inf
+    # samples are not optimized away
+    @njit(cache=True, nogil=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def temporal_reduce(values, threshold, is_lt, is_max):
+        """
+        Single-pass min/max of the predicate robustness over signal values.
+
+        Args:
+            values: 1-D array of sample values (non-empty)
+            threshold: Threshold of the predicate
+            is_lt: True for '<'/'<=' predicates, False for '>'/'>='
+            is_max: True for 'eventually' (max), False for 'always' (min)
+
+        Returns:
+            float: Reduced robustness (NaN if any sample is NaN, like ndarray.min/max)
+        """
+        if is_lt:
+            result = threshold - values[0]
+        else:
+            result = values[0] - threshold
+        if result != result:
+            return np.nan
+        for i in range(1, values.shape[0]):
+            if is_lt:
+                rob = threshold - values[i]
+            else:
+                rob = values[i] - threshold
+            if rob != rob:
+                return np.nan
+            if is_max:
+                if rob > result:
+                    result = rob
+            elif rob < result:
+                result = rob
+        return result
+
+    @njit(cache=True, nogil=True)
+    def sliding_reduce(values, lo, hi, is_max):
+        """
+        Min/max of values[lo[i]:hi[i]] for every i with a monotonic deque.
+
+        Window bounds must be non-decreasing in i, as they are for a fixed
+        [a, b] interval over increasing sample times. Each sample enters and
+        leaves the deque at most once, so the cost is O(N) for any window
+        width. Empty windows give +inf for min and -inf for max; windows
+        containing a NaN give NaN.
+
+        Args:
+            values: 1-D array of robustness values
+            lo: Window start index per sample (inclusive)
+            hi: Window end index per sample (exclusive)
+            is_max: True for 'eventually' (max), False for 'always' (min)
+
+        Returns:
+            np.ndarray: Reduced robustness signal
+        """
+        n = values.shape[0]
+        out = np.empty(n, dtype=values.dtype)
+
+        # nan_count[j] = number of NaN samples in values[:j]
+        nan_count = np.zeros(n + 1, dtype=np.int64)
+        for j in range(n):
+            nan_count[j + 1] = nan_count[j] + (1 if values[j] != values[j] else 0)
+
+        # Indices of candidate extrema, values monotonic from head to tail
+        deque = np.empty(n, dtype=np.int64)
+        head = 0
+        tail = 0
+        pushed = 0
+        for i in range(n):
+            while pushed < hi[i]:
+                v = values[pushed]
+                if v == v:
+                    if is_max:
+                        while tail > head and values[deque[tail - 1]] <= v:
+                            tail -= 1
+                    else:
+                        while tail > head and values[deque[tail - 1]] >= v:
+                            tail -= 1
+                    deque[tail] = pushed
+                    tail += 1
+                pushed += 1
+            while tail > head and deque[head] < lo[i]:
+                head += 1
+
+            if lo[i] >= hi[i]:
+                out[i] = -np.inf if is_max else np.inf
+            elif nan_count[hi[i]] - nan_count[lo[i]] > 0:
+                out[i] = np.nan
+            else:
+                out[i] = values[deque[head]]
+        return out
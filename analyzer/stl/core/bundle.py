@@ -0,0 +1,380 @@
+"""
+Shared evaluation of a set of STL specifications.
+
+Specifications monitored together often share subformulas, e.g.
+always(latency < 0.01) and eventually[0:100](latency < 0.01) both contain the
+predicate latency < 0.01. SpecificationBundle parses every formula into a DAG
+with hash-consed nodes, so each distinct subformula is evaluated once per
+signal trace.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import re
+import numpy as np
+from .robustness import as_signal_array
+from ._robustness_numba import NUMBA_AVAILABLE
+if NUMBA_AVAILABLE:
+    from ._robustness_numba import sliding_reduce
+from .specification import STLSpecification
+from ..utils.logger import get_logger
+
+
+_TOKEN_PATTERN = re.compile(
+    r'\s*(?:'
+    r'(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'|(?P<op>->|<=|>=|==|!=|<|>|\(|\)|\[|\]|:|&|\||!|-)'
+    r'|(?P<name>[A-Za-z_]\w*)'
+    r')'
+)
+
+_TEMPORAL_KEYWORDS = {'always': 'always', 'G': 'always', 'eventually': 'eventually', 'F': 'eventually'}
+
+
+class _FormulaParser:
+    """
+    Recursive-descent parser for the STL subset used by the constraint libraries.
+
+    Supports predicates (signal < / <= / > / >= number), not, and, or, ->,
+    and always/eventually with optional [a:b] bounds. Nodes are registered in
+    a shared table under canonical keys, so subformulas that are equal up to
+    and/or operand order, nesting or strictness of a comparison map to the
+    same node id.
+    """
+
+    def __init__(self, formula: str, nodes: Dict[tuple, int], node_list: List[tuple]):
+        self.tokens = self._tokenize(formula)
+        self.pos = 0
+        self.nodes = nodes
+        self.node_list = node_list
+
+    @staticmethod
+    def _tokenize(formula: str) -> List[Tuple[str, str]]:
+        tokens = []
+        pos = 0
+        formula = formula.rstrip()
+        while pos < len(formula):
+            match = _TOKEN_PATTERN.match(formula, pos)
+            if match is None or match.end() == pos:
+                raise ValueError(f"Unexpected character at {pos} in '{formula}'")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of formula")
+        self.pos += 1
+        return token
+
+    def _expect(self, value: str):
+        token = self._next()
+        if token[1] != value:
+            raise ValueError(f"Expected '{value}', got '{token[1]}'")
+
+    def _node(self, key: tuple) -> int:
+        """Return the id of the node with this key, creating it if needed."""
+        node_id = self.nodes.get(key)
+        if node_id is None:
+            node_id = len(self.node_list)
+            self.nodes[key] = node_id
+            self.node_list.append(key)
+        return node_id
+
+    def parse(self) -> int:
+        node_id = self._implies()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected token '{self._peek()[1]}'")
+        return node_id
+
+    def _implies(self) -> int:
+        left = self._or()
+        token = self._peek()
+        if token is not None and token[1] == '->':
+            self._next()
+            right = self._implies()
+            return self._nary('or', [self._negate(left), right])
+        return left
+
+    def _nary(self, op: str, children: List[int]) -> int:
+        """
+        Canonical and/or node: nested same-op children are flattened and the
+        child ids deduplicated and sorted, so (a and b) and (b and a) share a node.
+        """
+        flat = set()
+        for child in children:
+            key = self.node_list[child]
+            if key[0] == op:
+                flat.update(key[1])
+            else:
+                flat.add(child)
+        if len(flat) == 1:
+            return flat.pop()
+        return self._node((op, tuple(sorted(flat))))
+
+    def _negate(self, child: int) -> int:
+        """Negation node; not(not(x)) is x itself."""
+        key = self.node_list[child]
+        return key[1] if key[0] == 'not' else self._node(('not', child))
+
+    def _or(self) -> int:
+        children = [self._and()]
+        while self._peek() is not None and self._peek()[1] in ('or', '|'):
+            self._next()
+            children.append(self._and())
+        return children[0] if len(children) == 1 else self._nary('or', children)
+
+    def _and(self) -> int:
+        children = [self._unary()]
+        while self._peek() is not None and self._peek()[1] in ('and', '&'):
+            self._next()
+            children.append(self._unary())
+        return children[0] if len(children) == 1 else self._nary('and', children)
+
+    def _unary(self) -> int:
+        kind, value = self._peek() or (None, None)
+        if value in ('not', '!'):
+            self._next()
+            return self._negate(self._unary())
+        if kind == 'name' and value in _TEMPORAL_KEYWORDS:
+            self._next()
+            interval = None
+            if self._peek() is not None and self._peek()[1] == '[':
+                self._next()
+                lo = self._number()
+                self._expect(':')
+                hi = self._number()
+                self._expect(']')
+                interval = (lo, hi)
+            return self._node((_TEMPORAL_KEYWORDS[value], interval, self._unary()))
+        return self._primary()
+
+    def _primary(self) -> int:
+        kind, value = self._next()
+        if value == '(':
+            node_id = self._implies()
+            self._expect(')')
+            return node_id
+        if kind == 'name':
+            comparison = self._next()[1]
+            if comparison not in ('<', '<=', '>', '>='):
+                raise ValueError(f"Unsupported comparison operator: {comparison}")
+            # Strict and non-strict comparisons have the same robustness
+            return self._node(('pred', value, comparison[0], self._number()))
+        raise ValueError(f"Unexpected token '{value}'")
+
+    def _number(self) -> float:
+        sign = 1.0
+        if self._peek() is not None and self._peek()[1] == '-':
+            self._next()
+            sign = -1.0
+        kind, value = self._next()
+        if kind != 'num':
+            raise ValueError(f"Expected a number, got '{value}'")
+        return sign * float(value)
+
+
+def _window_bounds(times: np.ndarray, interval: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample index range [lo, hi) covering [t + a, t + b] for every sample time t."""
+    lo = np.searchsorted(times, times + interval[0], side='left')
+    hi = np.searchsorted(times, times + interval[1], side='right')
+    return lo, hi
+
+
+def _range_reduce(values: np.ndarray, lo: np.ndarray, hi: np.ndarray, is_max: bool) -> np.ndarray:
+    """
+    Min/max of values[lo[i]:hi[i]] for every i.
+
+    With numba this is an O(N) monotonic-deque sweep; otherwise a sparse
+    table of power-of-two window extrema is built with NumPy. Empty windows
+    give +inf for min and -inf for max.
+    """
+    if NUMBA_AVAILABLE:
+        return sliding_reduce(values, lo, hi, is_max)
+
+    ufunc = np.maximum if is_max else np.minimum
+    empty_value = -np.inf if is_max else np.inf
+
+    # table[k][i] = reduce(values[i:i + 2**k])
+    table = [values]
+    width = 1
+    while width * 2 <= values.shape[0]:
+        previous = table[-1]
+        table.append(ufunc(previous[:-width], previous[width:]))
+        width *= 2
+
+    lengths = hi - lo
+    result = np.full(values.shape[0], empty_value)
+    nonempty = lengths > 0
+    if np.any(nonempty):
+        levels = np.floor(np.log2(lengths[nonempty])).astype(np.int64)
+        starts = lo[nonempty]
+        ends = hi[nonempty]
+        reduced = np.empty(levels.shape[0])
+        for k in np.unique(levels):
+            select = levels == k
+            level = table[k]
+            reduced[select] = ufunc(level[starts[select]], level[ends[select] - (1 << k)])
+        result[nonempty] = reduced
+    return result
+
+
+class SpecificationBundle:
+    """
+    Evaluates several STL specifications with common subformulas shared.
+
+    Formulas outside the supported subset (see _FormulaParser) are evaluated
+    individually with STLSpecification.evaluate().
+
+    Example:
+        bundle = SpecificationBundle([
+            STLSpecification("always(latency < 0.01)", ['latency']),
+            STLSpecification("eventually[0:100](latency < 0.01)", ['latency']),
+        ])
+        robustness = bundle.evaluate(signals)  # {spec.name: robustness}
+    """
+
+    def __init__(self, specs: List[STLSpecification]):
+        """
+        Build the shared subformula DAG.
+
+        Args:
+            specs: List of STL specifications
+        """
+        logger = get_logger()
+
+        self.specs = specs
+        self._nodes = {}
+        self._node_list = []
+        # Root node id per specification, None for formulas evaluated separately
+        self._roots = []
+
+        for spec in specs:
+            try:
+                self._roots.append(_FormulaParser(spec.formula, self._nodes, self._node_list).parse())
+            except ValueError as e:
+                logger.debug(f"  Bundle: evaluating '{spec.name}' separately ({e})")
+                self._roots.append(None)
+
+        self._signal_names = sorted({key[1] for key in self._node_list if key[0] == 'pred'})
+
+        num_bundled = sum(1 for root in self._roots if root is not None)
+        logger.debug(f"  Bundle: {num_bundled} specifications share {len(self._node_list)} subformulas")
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of distinct subformulas in the bundle."""
+        return len(self._node_list)
+
+    def evaluate(self, signals: Dict[str, np.ndarray]) -> Dict[str, float]:
+        """
+        Evaluate all specifications on the given signals.
+
+        Bundled formulas require their signals to share one time grid; if they
+        do not, every specification is evaluated separately.
+
+        Args:
+            signals: Dictionary mapping signal names to time-series data
+
+        Returns:
+            Dictionary mapping specification names to robustness values
+
+        Raises:
+            KeyError: If a signal used by a bundled formula is missing
+        """
+        return {spec.name: rho for spec, rho in zip(self.specs, self.evaluate_all(signals))}
+
+    def evaluate_all(self, signals: Dict[str, np.ndarray]) -> List[float]:
+        """
+        Evaluate all specifications, returning robustness values in spec order.
+
+        Unlike evaluate(), results are not keyed by name, so specifications
+        sharing a name are kept apart.
+
+        Args:
+            signals: Dictionary mapping signal names to time-series data
+
+        Returns:
+            List of robustness values, one per specification
+        """
+        values = None
+        if self._node_list:
+            arrays = {name: as_signal_array(signals[name]) for name in self._signal_names}
+            grids = [array[:, 0] for array in arrays.values()]
+            if all(g.shape == grids[0].shape and np.array_equal(g, grids[0]) for g in grids[1:]):
+                values = self._evaluate_nodes(arrays, grids[0])
+
+        results = []
+        for spec, node_id in zip(self.specs, self._roots):
+            if node_id is None or values is None:
+                results.append(spec.evaluate(signals))
+            else:
+                series = values[node_id]
+                if isinstance(series, float):
+                    results.append(series)
+                else:
+                    results.append(float(series[0]) if series.size else 0.0)
+        return results
+
+    def _evaluate_nodes(self, arrays: Dict[str, np.ndarray], times: np.ndarray) -> List:
+        """
+        Compute the robustness signal of every node, children first.
+
+        Signals that hold one value throughout (e.g. every signal extracted
+        from aggregate statistics) are kept as a Python float instead of an
+        array, and so is every node computed only from such signals:
+        predicates, boolean operators and unbounded always/eventually of a
+        constant are constant. Constants broadcast against arrays, so mixed
+        nodes need no special case; only bounded operators expand a constant
+        child, since their window may be empty near the end of the trace.
+        """
+        constants = {}
+        for name, array in arrays.items():
+            series = array[:, 1]
+            if series.size and (series == series[0]).all():
+                constants[name] = float(series[0])
+
+        values = []
+        # Nodes are created after their children, so list order is a topological order
+        for key in self._node_list:
+            op = key[0]
+            if op == 'pred':
+                _, name, comparison, threshold = key
+                series = constants[name] if name in constants else arrays[name][:, 1]
+                values.append(threshold - series if comparison == '<' else series - threshold)
+            elif op == 'not':
+                values.append(-values[key[1]])
+            elif op in ('and', 'or'):
+                ufunc = np.minimum if op == 'and' else np.maximum
+                children = [values[child] for child in key[1]]
+                # Fold the constant children first, so all-constant nodes stay scalar
+                scalars = [child for child in children if isinstance(child, float)]
+                operands = [child for child in children if not isinstance(child, float)]
+                if scalars:
+                    operands.insert(0, min(scalars) if op == 'and' else max(scalars))
+                result = operands[0]
+                for operand in operands[1:]:
+                    result = ufunc(result, operand)
+                values.append(result)
+            else:
+                _, interval, child = key
+                is_max = op == 'eventually'
+                series = values[child]
+                if interval is None:
+                    # Unbounded future: suffix min/max, the value itself for a constant
+                    if isinstance(series, float):
+                        values.append(series)
+                    else:
+                        ufunc = np.maximum if is_max else np.minimum
+                        values.append(ufunc.accumulate(series[::-1])[::-1])
+                else:
+                    lo, hi = _window_bounds(times, interval)
+                    if isinstance(series, float):
+                        values.append(np.where(lo < hi, series, -np.inf if is_max else np.inf))
+                    else:
+                        values.append(_range_reduce(series, lo, hi, is_max))
+        return values
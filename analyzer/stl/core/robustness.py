@@ -5,27 +5,83 @@ Robustness provides a quantitative measure of how well a specification
 is satisfied or violated.
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, Union, Iterable, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
 import math
+import os
+import numpy as np
+
+from ._robustness_numba import NUMBA_AVAILABLE
+if NUMBA_AVAILABLE:
+    from ._robustness_numba import temporal_reduce
+
+
+class RobustnessConfig:
+    """
+    Numeric settings for robustness computation.
+
+    precision selects the floating-point type used when signals are built or
+    converted: 'fp64' (default) or 'fp32'. FP32 halves memory and bandwidth
+    for large DSE sweeps and is ample for filtering and ranking designs.
+    """
+
+    precision = 'fp64'
+
+    _DTYPES = {'fp64': np.float64, 'fp32': np.float32}
+
+    @classmethod
+    def set_precision(cls, precision: str):
+        """
+        Set the global precision.
+
+        Args:
+            precision: 'fp64' or 'fp32'
+        """
+        if precision not in cls._DTYPES:
+            raise ValueError(f"Unknown precision: {precision}. Use 'fp64' or 'fp32'")
+        cls.precision = precision
+
+    @classmethod
+    def dtype(cls):
+        """Return the NumPy dtype for the current precision."""
+        return cls._DTYPES[cls.precision]
+
+
+# Below this many values, builtin min/max/sum beat converting to an ndarray
+_NUMPY_REDUCTION_THRESHOLD = 256
+
+# A time-series signal: an (N, 2) float64 array of (time, value) rows, or the
+# equivalent list of (time, value) tuples (converted on entry)
+Signal = Union[np.ndarray, List[Tuple[float, float]]]
 
 
 def compute_robustness(
-    values: List[float],
+    values: Iterable[float],
     operator: str = 'min'
 ) -> float:
     """
     Compute aggregate robustness over multiple values.
 
+    Large inputs (and NumPy arrays) are reduced with NumPy; small lists use
+    the builtins, where array creation would dominate.
+
     Args:
-        values: List of robustness values
+        values: Robustness values (list, array or any iterable)
         operator: Aggregation operator ('min', 'max', 'avg')
 
     Returns:
         float: Aggregated robustness value
     """
-    if not values:
+    if not hasattr(values, '__len__'):
+        values = list(values)
+
+    if len(values) == 0:
         return 0.0
 
+    if isinstance(values, np.ndarray) or len(values) > _NUMPY_REDUCTION_THRESHOLD:
+        return compute_robustness_array(np.asarray(values, dtype=np.float64), operator)
+
     if operator == 'min':
         return min(values)
     elif operator == 'max':
@@ -64,8 +120,149 @@ def robustness_distance(
         raise ValueError(f"Unsupported comparison operator: {comparison}")
 
 
+def robustness_distance_array(
+    values: np.ndarray,
+    threshold: float,
+    comparison: str
+) -> np.ndarray:
+    """
+    Vectorized counterpart of robustness_distance().
+
+    Uses the branchless form sign * (value - threshold), with sign = -1 for
+    '<'/'<=' and +1 for '>'/'>='. Works on arrays of any shape and keeps the
+    floating-point precision of the input.
+
+    Args:
+        values: Array of signal values
+        threshold: Threshold for comparison
+        comparison: Type of comparison ('<', '<=', '>', '>=')
+
+    Returns:
+        np.ndarray: Robustness degree per value
+    """
+    if comparison in ['<', '<=']:
+        sign = -1.0
+    elif comparison in ['>', '>=']:
+        sign = 1.0
+    else:
+        raise ValueError(f"Unsupported comparison operator: {comparison}")
+
+    values = np.asarray(values)
+    if values.dtype.kind != 'f':
+        values = values.astype(RobustnessConfig.dtype())
+
+    # Keep the threshold in the values' precision so fp32 input stays fp32
+    return sign * (values - values.dtype.type(threshold))
+
+
+def compute_robustness_array(
+    values: np.ndarray,
+    operator: str = 'min'
+) -> float:
+    """
+    Compute aggregate robustness over a NumPy array of values.
+
+    Vectorized counterpart of compute_robustness().
+
+    Args:
+        values: 1-D array of robustness values
+        operator: Aggregation operator ('min', 'max', 'avg')
+
+    Returns:
+        float: Aggregated robustness value
+    """
+    if values.size == 0:
+        return 0.0
+
+    if operator == 'min':
+        return float(values.min())
+    elif operator == 'max':
+        return float(values.max())
+    elif operator == 'avg':
+        return float(values.mean())
+    else:
+        raise ValueError(f"Unknown aggregation operator: {operator}")
+
+
+def as_signal_array(signal: Signal, dtype=None) -> np.ndarray:
+    """
+    Return a signal in its canonical (N, 2) array form.
+
+    Floating-point arrays are returned as-is unless a dtype is requested;
+    lists of (time, value) tuples are converted.
+
+    Args:
+        signal: Time-series signal
+        dtype: Optional NumPy dtype (default: RobustnessConfig.dtype())
+
+    Returns:
+        np.ndarray: Array of (time, value) rows
+    """
+    if isinstance(signal, np.ndarray) and dtype is None and signal.dtype.kind == 'f':
+        return signal
+    dtype = dtype if dtype is not None else RobustnessConfig.dtype()
+    return np.asarray(signal, dtype=dtype).reshape(-1, 2)
+
+
+def _signal_columns(
+    signal: Signal,
+    time_interval: Tuple[float, float] = None
+) -> np.ndarray:
+    """
+    Split a signal into its value column, restricted to an optional interval.
+
+    The time column must be sorted in increasing order.
+
+    Args:
+        signal: Time-series signal as [(time, value), ...] or an (N, 2) array
+        time_interval: Optional (start, end) time bounds
+
+    Returns:
+        np.ndarray: Signal values within the interval
+    """
+    signal = as_signal_array(signal)
+
+    if time_interval:
+        # Signals are sampled in increasing time order, so the interval maps
+        # to a contiguous slice found by binary search
+        start, end = time_interval
+        times = signal[:, 0]
+        lo = np.searchsorted(times, start, side='left')
+        hi = np.searchsorted(times, end, side='right')
+        return signal[lo:hi, 1]
+
+    return signal[:, 1]
+
+
+def _temporal_robustness(
+    signal: Signal,
+    threshold: float,
+    comparison: str,
+    time_interval: Tuple[float, float],
+    is_max: bool
+) -> float:
+    """Shared implementation of the 'always' (min) and 'eventually' (max) operators."""
+    if comparison in ['<', '<=']:
+        is_lt = True
+    elif comparison in ['>', '>=']:
+        is_lt = False
+    else:
+        raise ValueError(f"Unsupported comparison operator: {comparison}")
+
+    values = _signal_columns(signal, time_interval)
+
+    if values.size == 0:
+        return 0.0
+
+    if NUMBA_AVAILABLE:
+        return float(temporal_reduce(values, float(threshold), is_lt, is_max))
+
+    robustness_values = robustness_distance_array(values, threshold, comparison)
+    return float(robustness_values.max() if is_max else robustness_values.min())
+
+
 def temporal_robustness_always(
-    signal: List[Tuple[float, float]],
+    signal: Signal,
     threshold: float,
     comparison: str,
     time_interval: Tuple[float, float] = None
@@ -76,7 +273,7 @@ def temporal_robustness_always(
     The robustness of G[a,b](φ) is the minimum robustness of φ over [a,b].
 
     Args:
-        signal: Time-series signal as [(time, value), ...]
+        signal: Time-series signal as [(time, value), ...] or an (N, 2) array
         threshold: Threshold value
         comparison: Comparison operator
         time_interval: Optional (start, end) time bounds
@@ -84,25 +281,11 @@ def temporal_robustness_always(
     Returns:
         float: Minimum robustness over the interval
     """
-    if time_interval:
-        start, end = time_interval
-        filtered_signal = [(t, v) for t, v in signal if start <= t <= end]
-    else:
-        filtered_signal = signal
-
-    if not filtered_signal:
-        return 0.0
-
-    robustness_values = [
-        robustness_distance(value, threshold, comparison)
-        for _, value in filtered_signal
-    ]
-
-    return min(robustness_values)
+    return _temporal_robustness(signal, threshold, comparison, time_interval, is_max=False)
 
 
 def temporal_robustness_eventually(
-    signal: List[Tuple[float, float]],
+    signal: Signal,
     threshold: float,
     comparison: str,
     time_interval: Tuple[float, float] = None
@@ -113,7 +296,7 @@ def temporal_robustness_eventually(
     The robustness of F[a,b](φ) is the maximum robustness of φ over [a,b].
 
     Args:
-        signal: Time-series signal as [(time, value), ...]
+        signal: Time-series signal as [(time, value), ...] or an (N, 2) array
         threshold: Threshold value
         comparison: Comparison operator
         time_interval: Optional (start, end) time bounds
@@ -121,21 +304,7 @@ def temporal_robustness_eventually(
     Returns:
         float: Maximum robustness over the interval
     """
-    if time_interval:
-        start, end = time_interval
-        filtered_signal = [(t, v) for t, v in signal if start <= t <= end]
-    else:
-        filtered_signal = signal
-
-    if not filtered_signal:
-        return 0.0
-
-    robustness_values = [
-        robustness_distance(value, threshold, comparison)
-        for _, value in filtered_signal
-    ]
-
-    return max(robustness_values)
+    return _temporal_robustness(signal, threshold, comparison, time_interval, is_max=True)
 
 
 def combine_robustness_and(
@@ -154,7 +323,8 @@ def combine_robustness_and(
     Returns:
         float: Combined robustness
     """
-    return min(robustness1, robustness2)
+    # Inline comparison avoids the call overhead of builtin min()
+    return robustness2 if robustness2 < robustness1 else robustness1
 
 
 def combine_robustness_or(
@@ -173,7 +343,381 @@ def combine_robustness_or(
     Returns:
         float: Combined robustness
     """
-    return max(robustness1, robustness2)
+    return robustness2 if robustness2 > robustness1 else robustness1
+
+
+def predicate_robustness(
+    signal: Signal,
+    comparison: str,
+    threshold: float,
+    temporal_op: Optional[str] = None,
+    time_interval: Optional[Tuple[float, float]] = None
+) -> float:
+    """
+    Robustness at the first sample of [temporal_op[a:b]](signal ~ threshold).
+
+    Covers the single-predicate formulas produced by the constraint
+    factories: always(...), eventually(...), their bounded variants and a
+    bare predicate. Bounds are relative to the first sample time, matching
+    the robustness an rtamt offline monitor reports at the start of the trace.
+
+    Args:
+        signal: Time-series signal
+        comparison: Comparison operator ('<', '<=', '>', '>=')
+        threshold: Threshold value
+        temporal_op: 'always', 'eventually', or None for a bare predicate
+        time_interval: Optional (a, b) bounds of the temporal operator
+
+    Returns:
+        float: Robustness degree (0.0 for an empty signal)
+    """
+    signal = as_signal_array(signal)
+
+    if signal.shape[0] == 0:
+        return 0.0
+
+    if temporal_op is None:
+        return float(robustness_distance_array(signal[0, 1], threshold, comparison))
+
+    if time_interval:
+        t0 = signal[0, 0]
+        time_interval = (t0 + time_interval[0], t0 + time_interval[1])
+
+    if temporal_op == 'always':
+        return temporal_robustness_always(signal, threshold, comparison, time_interval)
+    elif temporal_op == 'eventually':
+        return temporal_robustness_eventually(signal, threshold, comparison, time_interval)
+    else:
+        raise ValueError(f"Unsupported temporal operator: {temporal_op}")
+
+
+def conjunction_robustness(
+    signals: Dict[str, Signal],
+    clauses: Tuple[Tuple[str, str, float], ...]
+) -> float:
+    """
+    Robustness of always((s1 ~ c1) and (s2 ~ c2) and ...) in one fused pass.
+
+    Flat conjunctions of threshold predicates (as built by the composite
+    constraints) reduce to the minimum over all clauses and all samples of
+    sign * (value - threshold). When the signals have equal length they are
+    stacked and reduced by a single NumPy sweep.
+
+    Args:
+        signals: Dictionary mapping signal names to time-series data
+        clauses: Tuple of (signal_name, comparison, threshold) predicates
+
+    Returns:
+        float: Robustness of the conjunction (0.0 for empty signals)
+    """
+    rows = [as_signal_array(signals[signal_name])[:, 1] for signal_name, _, _ in clauses]
+
+    if any(row.size == 0 for row in rows):
+        return 0.0
+
+    if len({row.size for row in rows}) == 1:
+        signs = np.array([-1.0 if comparison in ('<', '<=') else 1.0
+                          for _, comparison, _ in clauses])
+        thresholds = np.array([threshold for _, _, threshold in clauses])
+        values = np.stack(rows)
+        return float((signs[:, None] * (values - thresholds[:, None])).min())
+
+    # Unequal lengths: always distributes over and, so reduce clause by clause
+    return float(min(
+        robustness_distance_array(row, threshold, comparison).min()
+        for row, (_, comparison, threshold) in zip(rows, clauses)
+    ))
+
+
+def stack_signals(
+    signal_dicts: List[Dict[str, Signal]],
+    signal_names: List[str]
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Stack the same signals of several designs into (N, T) value matrices.
+
+    All signals are assumed to be sampled on a common time grid starting at
+    the same time (as produced by SignalExtractor); shorter signals are
+    padded at the end. The per-row lengths tell the batch kernels where the
+    padding starts, so NaN samples of the signals themselves still propagate.
+
+    Args:
+        signal_dicts: One signal dictionary per design
+        signal_names: Names of the signals to stack
+
+    Returns:
+        tuple: (dict mapping signal names to (N, T) arrays, (T,) time grid,
+               dict mapping signal names to (N,) numbers of valid samples)
+    """
+    arrays = [
+        [as_signal_array(signals[name]) for name in signal_names]
+        for signals in signal_dicts
+    ]
+
+    longest = None
+    for row in arrays:
+        for signal in row:
+            if longest is None or signal.shape[0] > longest.shape[0]:
+                longest = signal
+    times = longest[:, 0].copy() if longest is not None else np.empty(0)
+
+    signals_batch = {}
+    lengths = {}
+    for j, name in enumerate(signal_names):
+        batch = np.full((len(arrays), times.size), np.nan, dtype=RobustnessConfig.dtype())
+        row_lengths = np.empty(len(arrays), dtype=np.int64)
+        for i, row in enumerate(arrays):
+            batch[i, :row[j].shape[0]] = row[j][:, 1]
+            row_lengths[i] = row[j].shape[0]
+        signals_batch[name] = batch
+        lengths[name] = row_lengths
+
+    return signals_batch, times, lengths
+
+
+def _reduce_rows(
+    robustness: np.ndarray,
+    is_max: bool,
+    lengths: Optional[np.ndarray] = None,
+    start: int = 0
+) -> np.ndarray:
+    """
+    Row-wise min/max over the valid samples; rows without any give 0.0.
+
+    Args:
+        robustness: (N, W) robustness values of columns start .. start + W - 1
+        is_max: True for max ('eventually'), False for min ('always')
+        lengths: Optional (N,) numbers of valid samples per row (default: all)
+        start: Column of the full signal the first column corresponds to
+
+    Returns:
+        np.ndarray: (N,) reduced robustness; NaN samples propagate
+    """
+    width = robustness.shape[1]
+    if lengths is None:
+        if width == 0:
+            return np.zeros(robustness.shape[0])
+        return robustness.max(axis=1) if is_max else robustness.min(axis=1)
+
+    valid = np.clip(lengths - start, 0, width)
+    if width == 0:
+        return np.zeros(robustness.shape[0])
+    # Padding is replaced by the identity of the reduction
+    padding = np.arange(width) >= valid[:, None]
+    robustness = np.where(padding, -np.inf if is_max else np.inf, robustness)
+    reduced = robustness.max(axis=1) if is_max else robustness.min(axis=1)
+    return np.where(valid > 0, reduced, 0.0)
+
+
+def batch_predicate_robustness(
+    values: np.ndarray,
+    times: np.ndarray,
+    comparison: str,
+    threshold: float,
+    temporal_op: Optional[str] = None,
+    time_interval: Optional[Tuple[float, float]] = None,
+    lengths: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Batched predicate_robustness() over the rows of an (N, T) value matrix.
+
+    Args:
+        values: (N, T) signal values, one row per design
+        times: (T,) shared time grid
+        comparison: Comparison operator ('<', '<=', '>', '>=')
+        threshold: Threshold value
+        temporal_op: 'always', 'eventually', or None for a bare predicate
+        time_interval: Optional (a, b) bounds relative to the first sample
+        lengths: Optional (N,) numbers of valid samples per row; the rest of
+                 each row is padding (default: every sample is valid)
+
+    Returns:
+        np.ndarray: (N,) robustness values
+    """
+    if temporal_op is None:
+        if values.shape[1] == 0:
+            return np.zeros(values.shape[0])
+        first = robustness_distance_array(values[:, 0], threshold, comparison)
+        return first if lengths is None else np.where(lengths > 0, first, 0.0)
+
+    if temporal_op not in ('always', 'eventually'):
+        raise ValueError(f"Unsupported temporal operator: {temporal_op}")
+
+    lo = 0
+    if time_interval and times.size:
+        t0 = times[0]
+        lo = np.searchsorted(times, t0 + time_interval[0], side='left')
+        hi = np.searchsorted(times, t0 + time_interval[1], side='right')
+        values = values[:, lo:hi]
+
+    robustness = robustness_distance_array(values, threshold, comparison)
+    return _reduce_rows(robustness, is_max=(temporal_op == 'eventually'), lengths=lengths, start=int(lo))
+
+
+def batch_conjunction_robustness(
+    signals_batch: Dict[str, np.ndarray],
+    clauses: Tuple[Tuple[str, str, float], ...],
+    lengths: Optional[Dict[str, np.ndarray]] = None
+) -> np.ndarray:
+    """
+    Batched conjunction_robustness() over the rows of (N, T) value matrices.
+
+    Args:
+        signals_batch: Dictionary mapping signal names to (N, T) arrays
+        clauses: Tuple of (signal_name, comparison, threshold) predicates
+        lengths: Optional dictionary mapping signal names to (N,) numbers of
+                 valid samples per row (default: every sample is valid)
+
+    Returns:
+        np.ndarray: (N,) robustness values
+    """
+    result = None
+    empty = None
+    for signal_name, comparison, threshold in clauses:
+        values = signals_batch[signal_name]
+        row_lengths = (lengths[signal_name] if lengths is not None
+                       else np.full(values.shape[0], values.shape[1]))
+        robustness = robustness_distance_array(values, threshold, comparison)
+        reduced = _reduce_rows(robustness, is_max=False, lengths=row_lengths)
+        if result is None:
+            result, empty = reduced, row_lengths == 0
+        else:
+            result, empty = np.minimum(result, reduced), empty | (row_lengths == 0)
+    # Like the unbatched kernel, a design with an empty signal scores 0.0
+    return np.where(empty, 0.0, result)
+
+
+def fold_and_early(
+    robustness_fns: Iterable[Callable[[], float]],
+    threshold: float = -math.inf
+) -> Tuple[float, int]:
+    """
+    AND-fold lazily computed robustness values, stopping early.
+
+    The running minimum can only decrease, so once it drops below threshold
+    the conjunction is known to be at most that bad and the remaining
+    callables are not evaluated.
+
+    Args:
+        robustness_fns: Zero-argument callables returning robustness values
+        threshold: Stop as soon as the running minimum is below this value
+
+    Returns:
+        tuple: (running minimum, number of callables evaluated);
+               (0.0, 0) if there was nothing to evaluate
+    """
+    running_min = None
+    evaluated = 0
+    for fn in robustness_fns:
+        robustness = fn()
+        evaluated += 1
+        if running_min is None or robustness < running_min:
+            running_min = robustness
+        if running_min < threshold:
+            break
+
+    return (running_min if running_min is not None else 0.0), evaluated
+
+
+def spec_cost(spec) -> Tuple[int, int, int]:
+    """
+    Static evaluation-cost estimate used to order specifications cheapest-first.
+
+    Fused conjunctions (spec.clauses) need no rtamt call; otherwise fewer
+    signals and shorter formulas are assumed cheaper.
+
+    Args:
+        spec: STLSpecification
+
+    Returns:
+        tuple: Sort key (lower is cheaper)
+    """
+    return (
+        0 if getattr(spec, 'clauses', None) else 1,
+        len(spec.signal_names),
+        len(spec.formula)
+    )
+
+
+def fold_and(
+    specs: List,
+    signals_dict: Dict[str, Signal],
+    early_exit_threshold: float = -math.inf
+) -> Tuple[float, int]:
+    """
+    AND-combine specifications, cheapest first, with early exit.
+
+    Args:
+        specs: List of STLSpecification objects
+        signals_dict: Dictionary mapping signal names to time-series data
+        early_exit_threshold: Stop once the running minimum is below this value
+
+    Returns:
+        tuple: (combined robustness, number of specifications evaluated)
+    """
+    ordered = sorted(specs, key=spec_cost)
+    return fold_and_early(
+        (functools.partial(spec.evaluate, signals_dict) for spec in ordered),
+        early_exit_threshold
+    )
+
+
+def parallel_robustness(
+    specs: List,
+    signals_dict: Dict[str, Signal],
+    num_threads: Optional[int] = None,
+    operator: str = 'and'
+) -> Tuple[Dict[str, float], float]:
+    """
+    Evaluate independent specifications concurrently on a thread pool.
+
+    Each specification is submitted as its own task; results are collected
+    as they complete and reduced with AND (min) or OR (max) semantics.
+
+    Args:
+        specs: List of STLSpecification objects
+        signals_dict: Dictionary mapping signal names to time-series data
+        num_threads: Number of worker threads (default: os.cpu_count())
+        operator: How to combine the results ('and' or 'or')
+
+    Returns:
+        tuple: (robustness per specification name, combined robustness)
+    """
+    if operator not in ('and', 'or'):
+        raise ValueError(f"Unknown operator: {operator}")
+
+    if not specs:
+        return {}, 0.0
+
+    num_threads = num_threads if num_threads else (os.cpu_count() or 1)
+    num_threads = min(num_threads, len(specs))
+
+    robustness_dict = {}
+    if num_threads == 1:
+        for spec in specs:
+            robustness_dict[spec.name] = spec.evaluate(signals_dict)
+    else:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = {executor.submit(spec.evaluate, signals_dict): spec for spec in specs}
+            results = {}
+            for future in as_completed(futures):
+                results[id(futures[future])] = future.result()
+        # Keep the output in specification order regardless of completion order
+        for spec in specs:
+            robustness_dict[spec.name] = results[id(spec)]
+
+    # Fold with a local instead of calling combine_robustness_* per spec
+    combined = None
+    if operator == 'and':
+        for robustness in robustness_dict.values():
+            if combined is None or robustness < combined:
+                combined = robustness
+    else:
+        for robustness in robustness_dict.values():
+            if combined is None or robustness > combined:
+                combined = robustness
+
+    return robustness_dict, combined
 
 
 def normalize_robustness(
@@ -224,13 +768,27 @@ def robustness_summary(
             'total': 0
         }
 
-    values = list(robustness_dict.values())
+    # Single pass over the values
+    minimum = math.inf
+    maximum = -math.inf
+    total = 0.0
+    num_satisfied = 0
+    for v in robustness_dict.values():
+        if v < minimum:
+            minimum = v
+        if v > maximum:
+            maximum = v
+        total += v
+        if v >= 0:
+            num_satisfied += 1
+
+    count = len(robustness_dict)
 
     return {
-        'min': min(values),
-        'max': max(values),
-        'avg': sum(values) / len(values),
-        'num_satisfied': sum(1 for v in values if v >= 0),
-        'num_violated': sum(1 for v in values if v < 0),
-        'total': len(values)
+        'min': minimum,
+        'max': maximum,
+        'avg': total / count,
+        'num_satisfied': num_satisfied,
+        'num_violated': count - num_satisfied,
+        'total': count
     }
@@ -3,9 +3,54 @@ STL Specification class for defining and evaluating Signal Temporal Logic formul
 """
 
 from typing import Dict, List, Tuple, Union, Optional
+import re
+from itertools import chain
 import warnings
 from ..utils.logger import get_logger
 from ..utils.debug import get_debugger
+import numpy as np
+from .robustness import (
+    as_signal_array,
+    batch_conjunction_robustness,
+    batch_predicate_robustness,
+    conjunction_robustness,
+    predicate_robustness
+)
+
+
+# Parsed rtamt specifications keyed on (formula, signal_names). Offline
+# evaluation does not keep state between calls, so one parsed object can be
+# shared by every STLSpecification with the same formula and signals.
+_PARSE_CACHE: Dict[Tuple[str, Tuple[str, ...]], object] = {}
+
+def _warn_tuple_signals(signals: Dict, signal_names: Tuple[str, ...]):
+    """
+    Emit a DeprecationWarning if any signal is not an ndarray.
+
+    List-of-(time, value) signals are still accepted but deprecated. The
+    warning points at the caller of evaluate(), so the warnings filters
+    (once per location by default) decide how often it is shown.
+    """
+    for name in signal_names:
+        if not isinstance(signals[name], np.ndarray):
+            warnings.warn(
+                "list-of-(time, value) signals are deprecated; "
+                "pass (N, 2) float64 arrays (see as_signal_array) or use evaluate_arrays()",
+                DeprecationWarning,
+                stacklevel=3
+            )
+            return
+
+
+# Single-predicate formulas that evaluate() computes directly with NumPy:
+#   always(x < c), eventually[a:b](x >= c), x > c, ...
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+_PREDICATE = rf'(\w+)\s*(<=|>=|<|>)\s*({_NUMBER})'
+# One alternation compiled at import time, so matching costs a single call
+_SIMPLE_FORMULA_PATTERN = re.compile(
+    rf'\s*(?:(always|eventually)\s*(?:\[\s*({_NUMBER})\s*:\s*({_NUMBER})\s*\])?\s*'
+    rf'\(\s*{_PREDICATE}\s*\)|{_PREDICATE})\s*'
+)
 
 
 class STLSpecification:
@@ -38,30 +83,58 @@ class STLSpecification:
         )
     """
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'formula', 'signal_names', 'time_bounds', 'name', 'clauses',
+        '_fast_plan', '_spec', '_parsed', '_sig_name_set', '_validated',
+        '__weakref__'
+    )
+
+    # Share parsed rtamt specifications between instances with the same
+    # formula and signals (see _PARSE_CACHE)
+    enable_parse_cache = True
+
     def __init__(
         self,
         formula: str,
         signal_names: List[str],
         time_bounds: Optional[Tuple[float, float]] = None,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        clauses: Optional[Tuple[Tuple[str, str, float], ...]] = None
     ):
         """
         Initialize an STL specification.
 
         Args:
             formula: STL formula as a string (e.g., "always(latency < 0.01)")
-            signal_names: List of signal variable names used in the formula
+            signal_names: Signal variable names used in the formula (stored as a sorted tuple)
             time_bounds: Optional (min_time, max_time) bounds for temporal operators
             name: Optional descriptive name for the specification
+            clauses: Optional (signal_name, comparison, threshold) predicates when the
+                     formula is exactly always(clause1 and clause2 and ...). Such
+                     specifications are evaluated by a fused NumPy kernel instead of rtamt.
         """
         self.formula = formula
-        self.signal_names = signal_names
-        self.time_bounds = time_bounds if time_bounds else (0, float('inf'))
+        # Frozen and canonically ordered, so specifications can be hashed and cached
+        self.signal_names = tuple(sorted(set(signal_names)))
+        self.time_bounds = tuple(time_bounds) if time_bounds else (0, float('inf'))
         self.name = name if name else formula
+        self.clauses = tuple(clauses) if clauses else None
+
+        # (temporal_op, signal, comparison, threshold, interval) for simple
+        # formulas, () if rtamt is needed, None until first evaluated
+        self._fast_plan = None
 
         # Parsed specification (populated when using rtamt)
         self._spec = None
         self._parsed = False
+        self._sig_name_set = frozenset(self.signal_names)
+        self._validated = False
+
+    @property
+    def signal_name_set(self) -> frozenset:
+        """Signal names as a frozen set, built once at construction."""
+        return self._sig_name_set
 
     def __str__(self):
         return f"STLSpec(name='{self.name}', formula='{self.formula}')"
@@ -69,6 +142,29 @@ class STLSpecification:
     def __repr__(self):
         return self.__str__()
 
+    def __eq__(self, other):
+        if not isinstance(other, STLSpecification):
+            return NotImplemented
+        return (self.formula, self.signal_names, self.time_bounds) == \
+            (other.formula, other.signal_names, other.time_bounds)
+
+    def __hash__(self):
+        return hash((self.formula, self.signal_names, self.time_bounds))
+
+    def _validate(self):
+        """
+        Run the debugger's specification checks and remember success.
+
+        Raises:
+            ValueError: If the specification is invalid
+        """
+        spec_validation = get_debugger().validate_specification(self)
+        if not spec_validation['valid']:
+            error_msg = f"Invalid specification '{self.name}': {spec_validation['issues']}"
+            get_logger().error(error_msg)
+            raise ValueError(error_msg)
+        self._validated = True
+
     def parse(self):
         """
         Parse the STL formula using rtamt library.
@@ -79,11 +175,29 @@ class STLSpecification:
         logger = get_logger()
         debugger = get_debugger()
 
-        logger.debug(f"Parsing STL specification: {self.name}")
-        logger.trace(f"  Formula: {self.formula}")
-        logger.trace(f"  Signals: {self.signal_names}")
+        trace_enabled = logger.is_trace_enabled()
+
+        if logger.is_debug_enabled():
+            logger.debug(f"Parsing STL specification: {self.name}")
+        if trace_enabled:
+            logger.trace(f"  Formula: {self.formula}")
+            logger.trace(f"  Signals: {self.signal_names}")
+
+        use_cache = STLSpecification.enable_parse_cache
+        cache_key = (self.formula, self.signal_names)
+        cached_spec = _PARSE_CACHE.get(cache_key) if use_cache else None
+        if cached_spec is not None:
+            if trace_enabled:
+                logger.trace(f"  Reusing cached parse for: {self.formula}")
+            self._spec = cached_spec
+            self._parsed = True
+            return True
 
         try:
+            # Checked once here, so evaluate() does not repeat it per call
+            if not self._validated:
+                self._validate()
+
             import rtamt
 
             # Create discrete-time specification
@@ -92,7 +206,8 @@ class STLSpecification:
             # Declare all signal variables
             for signal_name in self.signal_names:
                 spec.declare_var(signal_name, 'float')
-                logger.trace(f"  Declared variable: {signal_name}")
+                if trace_enabled:
+                    logger.trace(f"  Declared variable: {signal_name}")
 
             # Set the specification formula
             spec.spec = self.formula
@@ -102,6 +217,8 @@ class STLSpecification:
 
             logger.debug(f"  Successfully parsed: {self.name}")
 
+            if use_cache:
+                _PARSE_CACHE[cache_key] = spec
             self._spec = spec
             self._parsed = True
             return True
@@ -123,6 +240,32 @@ class STLSpecification:
             warnings.warn(error_msg)
             return False
 
+    def _get_fast_plan(self) -> tuple:
+        """
+        Match the formula against the single-predicate templates.
+
+        Returns:
+            tuple: (temporal_op, signal_name, comparison, threshold, time_interval),
+                   or () if the formula needs the full rtamt evaluator
+        """
+        if self._fast_plan is None:
+            match = _SIMPLE_FORMULA_PATTERN.fullmatch(self.formula)
+            if match is None:
+                self._fast_plan = ()
+            elif match.group(1):
+                temporal_op, lo, hi, signal_name, comparison, threshold = match.groups()[:6]
+                time_interval = (float(lo), float(hi)) if lo is not None else None
+                self._fast_plan = (temporal_op, signal_name, comparison, float(threshold), time_interval)
+            else:
+                signal_name, comparison, threshold = match.groups()[6:]
+                self._fast_plan = (None, signal_name, comparison, float(threshold), None)
+        return self._fast_plan
+
+    @staticmethod
+    def clear_parse_cache():
+        """Drop all cached rtamt parses (e.g. after changing rtamt settings)."""
+        _PARSE_CACHE.clear()
+
     def evaluate(
         self,
         signals: Dict[str, List[Tuple[float, float]]]
@@ -132,7 +275,8 @@ class STLSpecification:
 
         Args:
             signals: Dictionary mapping signal names to time-series data
-                    Each signal is a list of (time, value) tuples
+                    Each signal is an (N, 2) array of (time, value) rows
+                    (lists of (time, value) tuples are deprecated)
 
         Returns:
             float: Robustness degree
@@ -145,19 +289,20 @@ class STLSpecification:
         """
         logger = get_logger()
         debugger = get_debugger()
+        # Skip building log messages when they would be discarded
+        debug_enabled = logger.is_debug_enabled()
 
-        logger.debug(f"Evaluating STL specification: {self.name}")
+        if debug_enabled:
+            logger.debug(f"Evaluating STL specification: {self.name}")
 
-        # Validate specification first
-        spec_validation = debugger.validate_specification(self)
-        if not spec_validation['valid']:
-            error_msg = f"Invalid specification '{self.name}': {spec_validation['issues']}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        # Validate specification once per instance
+        if not self._validated:
+            self._validate()
 
-        # Validate signals
-        signal_validation = debugger.validate_signals(signals, self.signal_names)
-        if not signal_validation['valid']:
+        # Cheap presence check; the full signal validation only runs on failure
+        missing = self._sig_name_set.difference(signals.keys())
+        if missing:
+            signal_validation = debugger.validate_signals(signals, self.signal_names)
             error_msg = f"Signal validation failed for '{self.name}'"
             logger.error(error_msg)
             logger.error(f"  Issues: {signal_validation['issues']}")
@@ -173,10 +318,30 @@ class STLSpecification:
                 f"Missing: {signal_validation['missing_signals']}. "
                 f"Available signals: {list(signals.keys())}"
             )
+        else:
+            _warn_tuple_signals(signals, self.signal_names)
+
+        # Flat always-conjunctions are evaluated directly, without rtamt
+        if self.clauses is not None:
+            robustness = conjunction_robustness(signals, self.clauses)
+            if debug_enabled:
+                logger.debug(f"  Fast-path result: robustness = {robustness:.6f}")
+            return robustness
+
+        # Single-predicate formulas are evaluated directly, without rtamt
+        fast_plan = self._get_fast_plan()
+        if fast_plan:
+            temporal_op, signal_name, comparison, threshold, time_interval = fast_plan
+            robustness = predicate_robustness(
+                signals[signal_name], comparison, threshold, temporal_op, time_interval
+            )
+            if debug_enabled:
+                logger.debug(f"  Fast-path result: robustness = {robustness:.6f}")
+            return robustness
 
         # Parse if not already done
         if not self._parsed:
-            logger.debug(f"  Specification not parsed, parsing now...")
+            logger.debug("  Specification not parsed, parsing now...")
             success = self.parse()
             if not success:
                 error_msg = "Cannot evaluate STL specification: parsing failed. Ensure rtamt is installed."
@@ -185,17 +350,31 @@ class STLSpecification:
 
         # Evaluate using rtamt
         try:
-            # Build argument list: alternating signal names and data
-            eval_args = []
-            for signal_name in self.signal_names:
-                eval_args.append(signal_name)
-                eval_args.append(signals[signal_name])
-                logger.trace(f"  Signal {signal_name}: {len(signals[signal_name])} points")
+            # Look each signal up once
+            paired = [(signal_name, signals[signal_name]) for signal_name in self.signal_names]
+
+            if logger.is_trace_enabled():
+                for signal_name, signal in paired:
+                    logger.trace(f"  Signal {signal_name}: {len(signal)} points")
+
+            # Build argument list: alternating signal names and data. rtamt
+            # consumes [time, value] sequences; ndarray.tolist() unboxes the
+            # whole buffer in one call
+            eval_args = list(chain.from_iterable(
+                (signal_name, signal.tolist() if isinstance(signal, np.ndarray) else signal)
+                for signal_name, signal in paired
+            ))
 
             robustness = self._spec.evaluate(*eval_args)
 
-            logger.debug(f"  Evaluation result: robustness = {robustness:.6f}")
-            logger.debug(f"  Satisfied: {robustness >= 0}")
+            # Offline rtamt returns the robustness signal [[t, rho], ...];
+            # the specification's robustness is its value at the first sample
+            if isinstance(robustness, list):
+                robustness = robustness[0][1]
+
+            if debug_enabled:
+                logger.debug(f"  Evaluation result: robustness = {robustness:.6f} "
+                             f"(satisfied: {robustness >= 0})")
 
             return robustness
 
@@ -208,6 +387,95 @@ class STLSpecification:
 
             raise RuntimeError(error_msg)
 
+    def evaluate_arrays(
+        self,
+        signals: Dict[str, np.ndarray],
+        times: Optional[np.ndarray] = None
+    ) -> float:
+        """
+        Evaluate the specification on signals given as NumPy arrays.
+
+        Args:
+            signals: Dictionary mapping signal names to either (N, 2) arrays of
+                     (time, value) rows or 1-D value arrays sampled at times
+            times: Time stamps of 1-D value arrays (default: 0, 1, ..., N-1)
+
+        Returns:
+            float: Robustness degree (see evaluate())
+        """
+        arrays = {}
+        for name, signal in signals.items():
+            signal = np.asarray(signal)
+            if signal.ndim == 1:
+                sample_times = times if times is not None else np.arange(signal.shape[0])
+                signal = np.column_stack((sample_times, signal)).astype(np.float64, copy=False)
+            arrays[name] = signal
+        return self.evaluate(arrays)
+
+    def evaluate_batch(
+        self,
+        signals_batch: Dict[str, np.ndarray],
+        times: Optional[np.ndarray] = None,
+        lengths: Optional[Dict[str, np.ndarray]] = None
+    ) -> np.ndarray:
+        """
+        Evaluate the specification for many designs at once.
+
+        Flat conjunctions and single-predicate formulas are computed with
+        vectorized kernels over the batch axis; other formulas fall back to
+        evaluate() per design.
+
+        Args:
+            signals_batch: Dictionary mapping signal names to (N, T) value arrays,
+                           one row per design, padded at the end (see stack_signals)
+            times: Optional (T,) shared time grid (default: 0, 1, ..., T-1)
+            lengths: Optional dictionary mapping signal names to (N,) numbers of
+                     valid samples per row (default: no padding). NaN samples
+                     within the valid range propagate as in evaluate().
+
+        Returns:
+            np.ndarray: (N,) robustness values
+
+        Raises:
+            ValueError: If required signals are missing
+        """
+        if not self._validated:
+            self._validate()
+
+        missing = self._sig_name_set.difference(signals_batch.keys())
+        if missing:
+            raise ValueError(
+                f"Required signal not provided for specification '{self.name}'. "
+                f"Missing: {sorted(missing)}. "
+                f"Available signals: {list(signals_batch.keys())}"
+            )
+
+        first = signals_batch[self.signal_names[0]]
+        if times is None:
+            times = np.arange(first.shape[1], dtype=np.float64)
+
+        if self.clauses is not None:
+            return batch_conjunction_robustness(signals_batch, self.clauses, lengths)
+
+        fast_plan = self._get_fast_plan()
+        if fast_plan:
+            temporal_op, signal_name, comparison, threshold, time_interval = fast_plan
+            return batch_predicate_robustness(
+                signals_batch[signal_name], times, comparison, threshold,
+                temporal_op, time_interval,
+                lengths[signal_name] if lengths is not None else None
+            )
+
+        # General formulas: rebuild per-design signals without the padding
+        robustness = np.empty(first.shape[0])
+        for i in range(first.shape[0]):
+            signals = {}
+            for name in self.signal_names:
+                n = lengths[name][i] if lengths is not None else times.shape[0]
+                signals[name] = np.column_stack((times[:n], signals_batch[name][i, :n]))
+            robustness[i] = self.evaluate(signals)
+        return robustness
+
     def evaluate_simple(
         self,
         signals: Dict[str, List[Tuple[float, float]]]
@@ -270,10 +538,81 @@ class STLSpecification:
             formula = f"{temporal_op}[{start}:{end}]({predicate})"
         else:
             formula = f"{temporal_op}({predicate})"
+        name = f"{temporal_op}_{signal_name}_{operator}_{threshold}"
+
+        if operator in _FastPredicateSpec.OPERATORS and temporal_op in ('always', 'eventually'):
+            return _FastPredicateSpec(formula, name, signal_name, operator, threshold,
+                                      temporal_op, time_interval)
 
         return STLSpecification(
             formula=formula,
-            signal_names=[signal_name],
+            signal_names=(signal_name,),
+            time_bounds=time_interval,
+            name=name
+        )
+
+
+class _FastPredicateSpec(STLSpecification):
+    """
+    always/eventually(signal OP threshold) built by from_simple_predicate().
+
+    Unbounded formulas reduce to one vectorized subtraction and a min/max over
+    the value column, skipping formula matching and rtamt entirely. Bounded
+    formulas use the parent implementation.
+    """
+
+    __slots__ = ('_signal_name', '_threshold', '_temporal_op', '_time_interval', '_sign')
+
+    OPERATORS = ('<', '<=', '>', '>=')
+
+    def __init__(
+        self,
+        formula: str,
+        name: str,
+        signal_name: str,
+        operator: str,
+        threshold: float,
+        temporal_op: str,
+        time_interval: Optional[Tuple[int, int]] = None
+    ):
+        super().__init__(
+            formula=formula,
+            signal_names=(signal_name,),
             time_bounds=time_interval,
-            name=f"{temporal_op}_{signal_name}_{operator}_{threshold}"
+            name=name
         )
+
+        self._signal_name = signal_name
+        self._threshold = float(threshold)
+        self._temporal_op = temporal_op
+        self._time_interval = tuple(time_interval) if time_interval else None
+        # rho = sign * (threshold - value): positive when the predicate holds
+        self._sign = 1.0 if operator in ('<', '<=') else -1.0
+        # The plan is known, no need to match the formula text
+        self._fast_plan = (temporal_op, signal_name, operator, self._threshold,
+                           tuple(map(float, time_interval)) if time_interval else None)
+
+    def evaluate(
+        self,
+        signals: Dict[str, List[Tuple[float, float]]]
+    ) -> float:
+        """
+        Evaluate the predicate robustness against provided signals.
+
+        Args:
+            signals: Dictionary mapping signal names to time-series data
+
+        Returns:
+            float: Robustness degree
+        """
+        signal = signals.get(self._signal_name)
+        if self._time_interval is not None or signal is None or len(signal) == 0:
+            return super().evaluate(signals)
+
+        _warn_tuple_signals(signals, self.signal_names)
+
+        values = as_signal_array(signal)[:, 1]
+        rho = np.subtract(self._threshold, values)
+        if self._sign < 0:
+            np.negative(rho, out=rho)
+        return float(rho.min() if self._temporal_op == 'always' else rho.max())
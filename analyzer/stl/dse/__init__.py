@@ -1,7 +1,8 @@
 """Design Space Exploration utilities with STL constraints."""
 
 from .constraint_checker import ConstraintBasedDSE
-from .pareto_frontier import ParetoFrontier
+from .pareto_frontier import ParetoFrontier, MetricsMatrix
 from .robustness_ranker import RobustnessRanker
+from .result import DSEResult
 
-__all__ = ['ConstraintBasedDSE', 'ParetoFrontier', 'RobustnessRanker']
+__all__ = ['ConstraintBasedDSE', 'ParetoFrontier', 'MetricsMatrix', 'RobustnessRanker', 'DSEResult']
@@ -0,0 +1,82 @@
+"""
+Numba-compiled kernels for Pareto dominance checks.
+
+numba is an optional dependency. When it is not installed, NUMBA_AVAILABLE
+is False and pareto_frontier.py uses its NumPy implementation.
+
+pareto_mask runs its outer loop in parallel over numba's thread pool; set
+NUMBA_NUM_THREADS=1 to run it serially.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # 'nnan'/'ninf' are deliberately left out: missing metrics are inf and
+    # NaN metrics must never count as better or equal
+    @njit(parallel=True, cache=True, boundscheck=False, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def pareto_mask(costs):
+        """
+        Boolean mask of the non-dominated rows of a cost matrix.
+
+        Args:
+            costs: (N, M) float64 array, smaller is better in every column
+
+        Returns:
+            np.ndarray: (N,) boolean mask
+        """
+        n, m = costs.shape
+        mask = np.ones(n, dtype=np.bool_)
+        # Each row i only writes mask[i], so the rows are checked in parallel
+        for i in prange(n):
+            for j in range(n):
+                if i == j:
+                    continue
+                better_equal = True
+                strictly_better = False
+                for k in range(m):
+                    a = costs[j, k]
+                    b = costs[i, k]
+                    if not a <= b:
+                        better_equal = False
+                        break
+                    if a < b:
+                        strictly_better = True
+                if better_equal and strictly_better:
+                    mask[i] = False
+                    break
+        return mask
+
+    @njit(cache=True, boundscheck=False)
+    def skyline_2d(c0, c1):
+        """
+        Dominated flags of 2D cost points sorted lexicographically by (c0, c1).
+
+        One pass keeping the best c1 seen so far and the c0 at which it was
+        first reached; equal points do not dominate each other.
+
+        Args:
+            c0: First objective costs, ascending
+            c1: Second objective costs, ascending within equal c0
+
+        Returns:
+            np.ndarray: (N,) boolean array, True where the point is dominated
+        """
+        n = c0.shape[0]
+        dominated = np.zeros(n, dtype=np.bool_)
+        best_c1 = np.inf
+        best_c0 = np.inf
+        for i in range(n):
+            if best_c1 < c1[i] or (best_c1 == c1[i] and best_c0 < c0[i]):
+                dominated[i] = True
+            elif c1[i] < best_c1 or i == 0:
+                best_c1 = c1[i]
+                best_c0 = c0[i]
+        return dominated
@@ -5,11 +5,148 @@ Automatically evaluates and ranks hardware configurations based on
 STL constraint satisfaction and robustness.
 """
 
-from typing import List, Dict, Callable, Optional, Any
-from ..monitors.offline_monitor import OfflineSTLMonitor
+from typing import List, Dict, Callable, Iterable, Optional, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import copy
+import hashlib
+import heapq
+import os
+import shelve
+import numpy as np
 from ..core.specification import STLSpecification
+from ..core.robustness import stack_signals
+from ..signals.signal_extractor import SignalExtractor
 from ..utils.logger import get_logger
 from ..utils.debug import get_debugger
+from .pareto_frontier import dominates
+from .result import DSEResult
+
+
+def _summarize_stl_results(stl_results: List[Dict]) -> Dict[str, Any]:
+    """
+    Summary in the format of BaseSTLMonitor.get_summary().
+
+    Computed in a single pass; robustness aggregates are 0 for an empty list.
+
+    Args:
+        stl_results: Per-specification results of one configuration
+
+    Returns:
+        Dictionary with summary statistics
+    """
+    min_rho = float('inf')
+    max_rho = float('-inf')
+    total = 0.0
+    violated = 0
+    for r in stl_results:
+        rho = r['robustness']
+        # NaN propagates, as through ndarray.min()/max() in the monitor
+        if rho < min_rho or rho != rho:
+            min_rho = rho
+        if rho > max_rho or rho != rho:
+            max_rho = rho
+        total += rho
+        if not r['satisfied']:
+            violated += 1
+
+    n = len(stl_results)
+    return {
+        'total_specifications': n,
+        'satisfied': n - violated,
+        'violated': violated,
+        'min_robustness': min_rho if n else 0,
+        'max_robustness': max_rho if n else 0,
+        'avg_robustness': total / n if n else 0,
+        'all_satisfied': violated == 0,
+    }
+
+
+def _ranking_key(result) -> float:
+    """Sort key of a result: its min_robustness, with NaN ranked last."""
+    rho = result['min_robustness']
+    return float('-inf') if rho != rho else rho
+
+
+def _simulate_config(
+    model,
+    config,
+    data_bitwidth: int,
+    analyzer_factory: Optional[Callable] = None,
+    seed: Optional[int] = None
+) -> Dict:
+    """
+    Simulate one hardware configuration and return its statistics.
+
+    Defined at module level so it can be shipped to worker processes.
+
+    Args:
+        model: Transformer model to analyze
+        config: Hardware configuration (GenericAccelerator)
+        data_bitwidth: Data bitwidth for analysis
+        analyzer_factory: Optional custom analyzer factory function
+        seed: Optional seed for the simulator's random permutations (random if None)
+
+    Returns:
+        Statistics dictionary from config.get_statistics()
+    """
+    from analyzer.analyzer import Analyzer
+
+    # Create analyzer
+    if analyzer_factory:
+        analyzer = analyzer_factory(model, config, data_bitwidth)
+    else:
+        analyzer = Analyzer(model, config, data_bitwidth=data_bitwidth)
+
+    # Run simulation
+    if seed is None:
+        analyzer.run_simulation_analysis(verbose=False)
+    else:
+        analyzer.run_simulation_analysis(verbose=False, permutation_seed=seed, deterministic_seed=seed)
+    return config.get_statistics()
+
+
+class _ParetoPatience:
+    """
+    Tracks the Pareto frontier of simulated statistics for early stopping.
+
+    Every statistic in objectives is minimized. A configuration improves the
+    frontier if no configuration seen before dominates it; after patience
+    consecutive configurations without improvement the sweep has converged.
+    """
+
+    def __init__(self, objectives: Tuple[str, ...], patience: int):
+        """
+        Args:
+            objectives: Statistics names, all minimized
+            patience: Configurations without improvement before converging
+        """
+        self.objectives = tuple(objectives)
+        self.patience = patience
+        self.frontier = []
+        self.without_improvement = 0
+
+    def update(self, stats: Dict) -> bool:
+        """
+        Add the statistics of one configuration.
+
+        Args:
+            stats: Statistics dictionary of the configuration
+
+        Returns:
+            True once the frontier has not improved for patience configurations
+        """
+        # Missing statistics are the worst cost, as in ParetoFrontier
+        costs = tuple(stats.get(obj, float('inf')) for obj in self.objectives)
+        if any(dominates(other, costs) for other in self.frontier):
+            self.without_improvement += 1
+        else:
+            self.frontier = [
+                other for other in self.frontier
+                if not dominates(costs, other)
+            ]
+            self.frontier.append(costs)
+            self.without_improvement = 0
+        return self.without_improvement >= self.patience
 
 
 class ConstraintBasedDSE:
@@ -47,7 +184,9 @@ class ConstraintBasedDSE:
         self,
         model,
         constraints: List[STLSpecification],
-        data_bitwidth: int = 8
+        data_bitwidth: int = 8,
+        stats_cache_file: Optional[str] = None,
+        seed: Optional[int] = None
     ):
         """
         Initialize DSE engine.
@@ -56,28 +195,98 @@ class ConstraintBasedDSE:
             model: Transformer model to analyze
             constraints: List of STL specifications to enforce
             data_bitwidth: Data bitwidth for analysis (default: 8)
+            stats_cache_file: Optional shelve file storing simulation statistics
+                              across runs, keyed by configuration content, model
+                              content, data bitwidth and seed (not by constraints).
+                              Only used with a seed, since unseeded simulations
+                              are not reproducible, and not for runs with a
+                              custom analyzer_factory.
+            seed: Optional simulator seed making every simulation reproducible
+                  (default: None, a random seed per simulation)
         """
         self.model = model
-        self.constraints = constraints
+        # Ordered dedup on (name, specification). Specifications compare equal
+        # on (formula, signal_names, time_bounds) only, and results are keyed
+        # by name, so distinctly named copies of one formula are all kept
+        unique = {}
+        for spec in constraints:
+            unique.setdefault((spec.name, spec), spec)
+        self.constraints = list(unique.values())
+        if len(self.constraints) < len(constraints):
+            get_logger().warning(
+                f"Dropped {len(constraints) - len(self.constraints)} duplicate constraint(s) "
+                f"from the DSE constraint set"
+            )
         self.data_bitwidth = data_bitwidth
+        # Results by config name (see compare_configs) and by content hash
+        # (see _cache_key), so repeated configurations are not re-simulated
         self.results_cache = {}
+        self.stats_cache_file = stats_cache_file
+        if stats_cache_file is not None and seed is None:
+            get_logger().warning("stats_cache_file is ignored without a seed: "
+                                 "unseeded simulations are not reproducible")
+        self.seed = seed
+        # Model content description, refreshed by every explore_design_space call
+        self._model_description = None
+        # Running (count, mean, M2) of each constraint's robustness across
+        # evaluated configurations, used to order constraints for early exit
+        self._robustness_stats = {}
 
     def explore_design_space(
         self,
-        hw_configs: List,
+        hw_configs: Iterable,
         analyzer_factory: Optional[Callable] = None,
-        verbose: bool = False
-    ) -> List[Dict]:
+        verbose: bool = False,
+        n_jobs: Optional[int] = 1,
+        top_k: Optional[int] = None,
+        early_exit: str = 'none',
+        static_metrics: Optional[Callable[[Any], Dict[str, float]]] = None,
+        patience: Optional[int] = None,
+        patience_objectives: Tuple[str, ...] = ('latency', 'energy'),
+        convergence_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[DSEResult]:
         """
         Evaluate multiple hardware configurations.
 
         Args:
-            hw_configs: List of GenericAccelerator instances
+            hw_configs: GenericAccelerator instances; any iterable, e.g. a
+                        generator over itertools.product() of design parameters
             analyzer_factory: Optional custom analyzer factory function
             verbose: Print progress information
+            n_jobs: Number of worker processes for the simulations (default: 1,
+                    in-process). None or -1 uses os.cpu_count(). With more than
+                    one job, configurations, the model and analyzer_factory must
+                    be picklable; simulations run on copies of the configurations.
+            top_k: Optional number of best results to return (default: all)
+            early_exit: Stop evaluating a configuration's remaining constraints once
+                        it cannot matter: 'unsatisfied' prunes it at the first
+                        violated constraint, 'topk' (requires top_k) once its
+                        robustness falls below the top_k-th best min_robustness,
+                        so it cannot be among the returned results. 'none'
+                        (default) evaluates all. Pruned results carry
+                        'pruned': True, only the constraints evaluated so far,
+                        and are not cached.
+            static_metrics: Optional function returning metrics of a configuration
+                            known without simulating it (e.g. {'area': ...}).
+                            Constraints reading only these signals are checked
+                            first, as constant signals; a configuration violating
+                            one is not simulated. Its result carries 'pruned': True,
+                            'simulated': False and only those constraints.
+            patience: Optional number of consecutive simulated configurations
+                      that do not improve the Pareto frontier of
+                      patience_objectives, after which the remaining
+                      configurations are not simulated (default: simulate all).
+                      Their results carry 'skipped': True, 'simulated': False
+                      and no constraints. With n_jobs > 1 configurations count
+                      in completion order.
+            patience_objectives: Statistics (all minimized) spanning the frontier
+                                 tracked for patience
+            convergence_callback: Optional function called as
+                                  callback(num_simulated, num_skipped) when
+                                  patience stops the sweep
 
         Returns:
-            List of results sorted by robustness (best first)
+            List of DSEResult instances sorted by robustness (best first)
             Each result contains:
             - config: Hardware configuration
             - stats: Simulation statistics
@@ -85,10 +294,20 @@ class ConstraintBasedDSE:
             - min_robustness: Minimum robustness across all constraints
             - satisfies_all: Boolean flag
         """
-        from analyzer.analyzer import Analyzer
-
         logger = get_logger()
-        debugger = get_debugger()
+
+        assert early_exit in ('none', 'unsatisfied', 'topk'), \
+            f"early_exit must be 'none', 'unsatisfied' or 'topk', got '{early_exit}'"
+        assert top_k is None or top_k >= 1, "top_k must be at least 1"
+        assert early_exit != 'topk' or top_k is not None, "early_exit='topk' requires top_k"
+        assert patience is None or patience >= 1, "patience must be at least 1"
+
+        # Generators are consumed once here; results keep their configurations
+        if not isinstance(hw_configs, (list, tuple)):
+            hw_configs = list(hw_configs)
+
+        # The model may have changed since the last exploration
+        self._model_description = None
 
         logger.info(f"Starting design space exploration")
         logger.info(f"  Configurations to evaluate: {len(hw_configs)}")
@@ -104,86 +323,697 @@ class ConstraintBasedDSE:
 
         results = []
 
+        # Phase 1: simulate every configuration
+        if n_jobs is None or n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+
+        # Reuse results of configurations evaluated before
+        pending = []
         for i, config in enumerate(hw_configs):
-            logger.info(f"\n[{i+1}/{len(hw_configs)}] Evaluating configuration: {config.name}")
+            cached = self.results_cache.get(self._cache_key(config))
+            if cached is not None:
+                logger.info(f"  {config.name}: reusing cached result")
+                result = self._copy_result(cached)
+                result['config'] = config
+                result['config_name'] = config.name
+                results.append(result)
+                self.results_cache[config.name] = result
+            else:
+                pending.append((i, config))
 
-            if verbose:
-                print(f"Evaluating configuration {i+1}/{len(hw_configs)}: {config.name}")
+        # Reject configurations violating a statically known constraint
+        if static_metrics is not None and pending:
+            pending, rejected = self._check_static_constraints(pending, static_metrics, verbose)
+            results.extend(rejected)
 
-            try:
-                # Create analyzer
-                if analyzer_factory:
-                    analyzer = analyzer_factory(self.model, config, self.data_bitwidth)
+        simulated = []
+
+        # Reuse statistics simulated by earlier runs
+        stats_store = None
+        num_stored = 0
+        if self.stats_cache_file is not None and self.seed is not None and analyzer_factory is None:
+            stats_store = shelve.open(self.stats_cache_file)
+        try:
+            if stats_store is not None:
+                to_simulate = []
+                for i, config in pending:
+                    stats = stats_store.get(self._stats_key(config))
+                    if stats is not None:
+                        logger.info(f"  {config.name}: reusing stored simulation statistics")
+                        simulated.append((i, config, stats))
+                    else:
+                        to_simulate.append((i, config))
+                num_stored = len(simulated)
+                pending = to_simulate
+
+            tracker = None
+            if patience is not None:
+                tracker = _ParetoPatience(patience_objectives, patience)
+                for _, _, stats in simulated:
+                    tracker.update(stats)
+
+            skipped = self._simulate_pending(pending, simulated, results, len(hw_configs),
+                                             analyzer_factory, verbose, n_jobs, tracker)
+            if skipped:
+                message = (f"Pareto frontier unchanged for {patience} configurations, "
+                           f"skipped the remaining {len(skipped)}")
+                if verbose:
+                    print(f"Stopping early: {message}")
                 else:
-                    analyzer = Analyzer(self.model, config, data_bitwidth=self.data_bitwidth)
-
-                logger.debug(f"  Running simulation...")
-                # Run simulation
-                analyzer.run_simulation_analysis(verbose=False)
-                stats = config.get_statistics()
-
-                logger.debug(f"  Simulation complete. Evaluating STL constraints...")
-                # Evaluate STL constraints
-                monitor = OfflineSTLMonitor(self.constraints, config)
-                stl_results = monitor.evaluate(stats)
-
-                # Compute aggregate robustness
-                robustness_values = [r['robustness'] for r in stl_results]
-                min_robustness = min(robustness_values) if robustness_values else 0
-                avg_robustness = sum(robustness_values) / len(robustness_values) if robustness_values else 0
-
-                result = {
-                    'config': config,
-                    'config_name': config.name,
-                    'stats': stats,
-                    'stl_results': stl_results,
-                    'min_robustness': min_robustness,
-                    'avg_robustness': avg_robustness,
-                    'satisfies_all': all(r['satisfied'] for r in stl_results),
-                    'num_violations': sum(1 for r in stl_results if not r['satisfied']),
-                    'monitor_summary': monitor.get_summary()
-                }
+                    logger.info(f"  {message}")
+                # Like statically rejected configurations, skipped ones keep a result
+                for i, config in skipped:
+                    results.append(DSEResult(
+                        config=config,
+                        config_name=config.name,
+                        stl_results=[],
+                        min_robustness=float('-inf'),
+                        avg_robustness=float('-inf'),
+                        satisfies_all=False,
+                        num_violations=0,
+                        simulated=False,
+                        skipped=True
+                    ))
+                if convergence_callback is not None:
+                    convergence_callback(len(simulated), len(skipped))
 
-                results.append(result)
+            if stats_store is not None:
+                for i, config, stats in simulated[num_stored:]:
+                    stats_store[self._stats_key(config)] = stats
+        finally:
+            if stats_store is not None:
+                stats_store.close()
 
-                # Cache result
-                self.results_cache[config.name] = result
+        # Completion order is arbitrary; keep the input order
+        simulated.sort(key=lambda item: item[0])
+
+        # Phase 2: evaluate each constraint once over the whole batch
+        logger.debug(f"  Simulations complete. Evaluating STL constraints on {len(simulated)} configurations...")
+        results.extend(self._evaluate_batch(simulated, verbose, early_exit, top_k))
 
-                logger.info(f"  Result: min_ρ={min_robustness:.6f}, satisfies_all={result['satisfies_all']}")
+        # Summary counts cover every configuration, also when only top_k are returned
+        total_count = len(results)
+        satisfying_count = sum(1 for r in results if r.get('satisfies_all', False))
+
+        # Sort by robustness (higher is better); only select the best top_k if requested
+        if top_k is not None and top_k < len(results):
+            results = heapq.nlargest(top_k, results, key=_ranking_key)
+        else:
+            results.sort(key=_ranking_key, reverse=True)
+
+        # Summary
+        logger.info(f"\n=== DSE Summary ===")
+        logger.info(f"  Total configurations: {total_count}")
+        logger.info(f"  Satisfying all constraints: {satisfying_count}")
+        logger.info(f"  Best min robustness: {results[0]['min_robustness']:.6f} ({results[0]['config_name']})")
+
+        return results
+
+    def _simulate_pending(
+        self,
+        pending: List,
+        simulated: List,
+        results: List[Dict],
+        num_configs: int,
+        analyzer_factory: Optional[Callable],
+        verbose: bool,
+        n_jobs: int,
+        tracker: Optional[_ParetoPatience] = None
+    ) -> List:
+        """
+        Simulate configurations, in-process or on a process pool.
+
+        Args:
+            pending: List of (index, config) tuples to simulate
+            simulated: List extended with (index, config, stats) tuples
+            results: List extended with error results of failed simulations
+            num_configs: Total number of configurations (for progress messages)
+            analyzer_factory: Optional custom analyzer factory function
+            verbose: Print progress information
+            n_jobs: Number of worker processes
+            tracker: Optional frontier tracker; simulation stops once it converges
+
+        Returns:
+            List of (index, config) tuples skipped because the tracker converged
+        """
+        logger = get_logger()
+
+        if n_jobs == 1 or len(pending) <= 1:
+            for done, (i, config) in enumerate(pending, 1):
+                logger.info(f"\n[{i+1}/{num_configs}] Simulating configuration: {config.name}")
 
                 if verbose:
-                    print(f"  Min robustness: {min_robustness:.6f}")
-                    print(f"  Satisfies all: {result['satisfies_all']}")
+                    print(f"Evaluating configuration {i+1}/{num_configs}: {config.name}")
+
+                try:
+                    logger.debug(f"  Running simulation...")
+                    stats = _simulate_config(self.model, config, self.data_bitwidth, analyzer_factory, self.seed)
+                    simulated.append((i, config, stats))
+                except Exception as e:
+                    results.append(self._error_result(i, config, e, verbose))
+                    continue
+
+                if tracker is not None and tracker.update(stats):
+                    return pending[done:]
+        else:
+            logger.info(f"  Simulating on {n_jobs} worker processes")
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = {
+                    executor.submit(
+                        _simulate_config, self.model, config, self.data_bitwidth, analyzer_factory, self.seed
+                    ): (i, config)
+                    for i, config in pending
+                }
+                completed = set()
+                for future in as_completed(futures):
+                    i, config = futures[future]
+                    completed.add(i)
+                    try:
+                        stats = future.result()
+                        simulated.append((i, config, stats))
+                        if verbose:
+                            print(f"Simulated configuration {i+1}/{num_configs}: {config.name}")
+                    except Exception as e:
+                        results.append(self._error_result(i, config, e, verbose))
+                        continue
+
+                    if tracker is not None and tracker.update(stats):
+                        # Simulations already running finish but are discarded
+                        for other in futures:
+                            other.cancel()
+                        return [(j, other) for j, other in pending if j not in completed]
+
+        return []
+
+    def _config_description(self, config) -> str:
+        """
+        Canonical description of everything in a configuration that affects its simulation.
+
+        Only the accelerator's own name is left out, so an identical design
+        under a different accelerator name has the same description. Block
+        names are kept: they name the extracted signals and the interconnect.
 
+        Args:
+            config: Hardware configuration
+
+        Returns:
+            Description string
+        """
+        if not (hasattr(config, 'matmul_blocks') and hasattr(config, 'memory_blocks')):
+            return str(config)
+
+        def name_of(block):
+            return getattr(block, 'name', None)
+
+        def memory_signature(memory):
+            return (
+                type(memory).__name__, memory.name, memory.width, memory.depth,
+                memory.word_size, memory.bus_bitwidth, memory.action_latency,
+                memory.cycle_time, memory.ports,
+                getattr(memory, '_replacement_strategy', None),
+                getattr(memory, 'banks', None), getattr(memory, 'power_gating', None),
+                getattr(memory, 'prefetch_factor', None), getattr(memory, 'bus_clock_hz', None),
+                getattr(memory, 'burst_length', None),
+                # Interconnect, when set explicitly (auto interconnect assigns it at analysis)
+                name_of(memory.upper_level_memory),
+                tuple(map(name_of, memory.lower_level_memories)),
+                tuple(map(name_of, memory.associated_matmuls)),
+            )
+
+        def matmul_signature(matmul):
+            return (
+                type(matmul).__name__, matmul.name, matmul.rows, matmul.columns,
+                matmul.data_bitwidth, matmul.buffer_length, matmul.cycles_per_mac,
+                matmul.num_pipeline_stages, matmul.cycle_time,
+                name_of(matmul.static_param_memory), name_of(matmul.dynamic_param_memory),
+            )
+
+        return repr((
+            type(config).__name__, config.cycle_time, getattr(config, 'tech_node', None),
+            getattr(config, 'auto_interconnect', None),
+            memory_signature(config.dram),
+            tuple(map(matmul_signature, config.matmul_blocks)),
+            tuple(map(memory_signature, config.memory_blocks)),
+        ))
+
+    def _describe_model(self) -> str:
+        """
+        Canonical description of the model's content.
+
+        Built from the model's public plain-data attributes (hyperparameters,
+        parameter shapes and execution plan); object-valued attributes such as
+        layers are already captured by the plan and have address-based reprs.
+
+        Returns:
+            Description string
+        """
+        model = self.model
+        if not hasattr(model, '__dict__'):
+            return repr(model)
+        fields = tuple(
+            (key, value) for key, value in sorted(vars(model).items())
+            if not key.startswith('_') and isinstance(value, (bool, int, float, str, tuple, dict))
+        )
+        return repr((type(model).__name__, fields))
+
+    def _model_key(self) -> str:
+        """
+        Model description, computed once and reused until the next exploration.
+
+        Returns:
+            Description string
+        """
+        if self._model_description is None:
+            self._model_description = self._describe_model()
+        return self._model_description
+
+    def _cache_key(self, config) -> str:
+        """
+        Content hash of (configuration, constraints, model, data bitwidth, seed).
+
+        Args:
+            config: Hardware configuration
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._config_description(config).encode())
+        digest.update(repr([(spec.name, spec.formula, spec.time_bounds) for spec in self.constraints]).encode())
+        digest.update(self._model_key().encode())
+        digest.update(f"{self.data_bitwidth}|{self.seed}".encode())
+        return digest.hexdigest()
+
+    def _stats_key(self, config) -> str:
+        """
+        Content hash of (configuration, model, data bitwidth, seed) for stats_cache_file.
+
+        Args:
+            config: Hardware configuration
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._config_description(config).encode())
+        digest.update(self._model_key().encode())
+        digest.update(f"{self.data_bitwidth}|{self.seed}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _copy_result(cached: DSEResult) -> DSEResult:
+        """
+        Copy of a cached result that shares no mutable container with it.
+
+        Statistics are deep-copied and the per-constraint results and summary
+        copied; the configuration and specification objects are shared.
+        """
+        result = DSEResult.from_dict(cached.to_dict())
+        result['stats'] = copy.deepcopy(cached['stats'])
+        result['stl_results'] = [dict(stl_result) for stl_result in cached['stl_results']]
+        result['monitor_summary'] = dict(cached['monitor_summary'])
+        return result
+
+    def _error_result(
+        self,
+        index: int,
+        config,
+        error: Exception,
+        verbose: bool
+    ) -> DSEResult:
+        """Record a failed configuration and return its result entry."""
+        logger = get_logger()
+        debugger = get_debugger()
+
+        error_msg = f"Configuration '{config.name}' evaluation failed: {error}"
+        logger.error(error_msg)
+        debugger.add_error(error_msg, context={
+            'config_name': config.name,
+            'config_index': index,
+            'error_type': type(error).__name__
+        })
+
+        if verbose:
+            print(f"  ERROR: {error}")
+
+        return DSEResult(
+            config=config,
+            config_name=config.name,
+            error=str(error),
+            min_robustness=float('-inf'),
+            satisfies_all=False
+        )
+
+    def _check_static_constraints(
+        self,
+        pending: List,
+        static_metrics: Callable[[Any], Dict[str, float]],
+        verbose: bool
+    ) -> Tuple[List, List[Dict]]:
+        """
+        Evaluate the constraints that need no simulation, before simulating.
+
+        Only constraints whose signals are static metrics of every pending
+        configuration are checked; each metric becomes a one-sample constant
+        signal, like the constant signals extracted from statistics.
+
+        Args:
+            pending: List of (index, config) tuples still to be simulated
+            static_metrics: Function returning the static metrics of a configuration
+            verbose: Print progress information
+
+        Returns:
+            Tuple of (configurations to simulate, results of rejected configurations)
+        """
+        logger = get_logger()
+
+        kept = []
+        metrics = []
+        rejected = []
+        for i, config in pending:
+            try:
+                metrics.append(static_metrics(config))
+                kept.append((i, config))
             except Exception as e:
-                error_msg = f"Configuration '{config.name}' evaluation failed: {e}"
-                logger.error(error_msg)
-                debugger.add_error(error_msg, context={
-                    'config_name': config.name,
-                    'config_index': i,
-                    'error_type': type(e).__name__
+                rejected.append(self._error_result(i, config, e, verbose))
+
+        if not kept:
+            return kept, rejected
+
+        available = frozenset.intersection(*(frozenset(m) for m in metrics))
+        static = [j for j, spec in enumerate(self.constraints) if spec.signal_name_set <= available]
+        if not static:
+            return kept, rejected
+
+        names = set().union(*(self.constraints[j].signal_name_set for j in static))
+        signals_batch = {
+            name: np.fromiter((m[name] for m in metrics), dtype=np.float64, count=len(metrics))[:, None]
+            for name in names
+        }
+        times = np.zeros(1)
+        robustness = np.array([self.constraints[j].evaluate_batch(signals_batch, times) for j in static])
+
+        to_simulate = []
+        for col, (i, config) in enumerate(kept):
+            if not (robustness[:, col] < 0).any():
+                to_simulate.append((i, config))
+                continue
+
+            stl_results = []
+            for row, j in enumerate(static):
+                spec = self.constraints[j]
+                rho = float(robustness[row, col])
+                stl_results.append({
+                    'specification': spec.formula,
+                    'name': spec.name,
+                    'robustness': rho,
+                    'satisfied': rho >= 0,
+                    'signals_used': spec.signal_names,
+                    'spec_object': spec
                 })
+            summary = _summarize_stl_results(stl_results)
 
-                if verbose:
-                    print(f"  ERROR: {e}")
-
-                results.append({
-                    'config': config,
-                    'config_name': config.name,
-                    'error': str(e),
-                    'min_robustness': float('-inf'),
-                    'satisfies_all': False
+            # Partial result, as for early exit: not cached
+            rejected.append(DSEResult(
+                config=config,
+                config_name=config.name,
+                stl_results=stl_results,
+                min_robustness=summary['min_robustness'],
+                avg_robustness=summary['avg_robustness'],
+                satisfies_all=False,
+                num_violations=summary['violated'],
+                monitor_summary=summary,
+                pruned=True,
+                simulated=False
+            ))
+
+            logger.info(f"  {config.name}: violates a static constraint, not simulated "
+                        f"(min_ρ<={summary['min_robustness']:.6f})")
+            if verbose:
+                print(f"  {config.name}: violates a static constraint, skipping simulation")
+
+        return to_simulate, rejected
+
+    def _constraint_order(self) -> List[int]:
+        """
+        Constraint indices, most discriminating first.
+
+        Constraints never evaluated come first; the rest are ordered by the
+        variance of their robustness over previously evaluated configurations.
+        """
+        def variance(j):
+            count, _, m2 = self._robustness_stats.get(self.constraints[j], (0, 0.0, 0.0))
+            return m2 / count if count > 1 else float('inf')
+
+        return sorted(range(len(self.constraints)), key=variance, reverse=True)
+
+    def _update_robustness_stats(self, robustness: np.ndarray):
+        """Fold evaluated (non-NaN) robustness values into the running statistics."""
+        # Batch count, mean and M2 of every constraint in whole-matrix reductions
+        finite = np.isfinite(robustness)
+        batch_counts = finite.sum(axis=1)
+        batch_sums = np.where(finite, robustness, 0.0).sum(axis=1)
+        batch_means = batch_sums / np.maximum(batch_counts, 1)
+        deviations = np.where(finite, robustness - batch_means[:, None], 0.0)
+        batch_m2s = np.einsum('ij,ij->i', deviations, deviations)
+
+        for j in np.flatnonzero(batch_counts).tolist():
+            spec = self.constraints[j]
+            # Chan et al. parallel combination of (count, mean, M2)
+            count, mean, m2 = self._robustness_stats.get(spec, (0, 0.0, 0.0))
+            batch_count = int(batch_counts[j])
+            batch_mean = float(batch_means[j])
+            batch_m2 = float(batch_m2s[j])
+            total = count + batch_count
+            delta = batch_mean - mean
+            self._robustness_stats[spec] = (
+                total,
+                mean + delta * batch_count / total,
+                m2 + batch_m2 + delta * delta * count * batch_count / total
+            )
+
+    def _evaluate_constraints(
+        self,
+        signals_batch: Dict[str, np.ndarray],
+        times: np.ndarray,
+        lengths: Dict[str, np.ndarray],
+        early_exit: str,
+        top_k: Optional[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Robustness of every constraint (rows) for every configuration (columns).
+
+        With early exit, constraints run in _constraint_order() and pruned
+        configurations are dropped from the batch; their remaining entries
+        stay NaN and are marked as not evaluated.
+
+        Returns:
+            Tuple of (robustness matrix, boolean matrix of evaluated entries)
+        """
+        num_configs = next(iter(signals_batch.values())).shape[0]
+        robustness = np.full((len(self.constraints), num_configs), np.nan)
+        evaluated = np.zeros(robustness.shape, dtype=bool)
+
+        if early_exit == 'none':
+            for j, spec in enumerate(self.constraints):
+                robustness[j] = spec.evaluate_batch(signals_batch, times, lengths)
+            evaluated[:] = True
+            return robustness, evaluated
+
+        def evaluate(j, rows):
+            subset = {name: values[rows] for name, values in signals_batch.items()}
+            subset_lengths = {name: values[rows] for name, values in lengths.items()}
+            robustness[j, rows] = self.constraints[j].evaluate_batch(subset, times, subset_lengths)
+            evaluated[j, rows] = True
+
+        order = self._constraint_order()
+        active = np.ones(num_configs, dtype=bool)
+        upper = np.full(num_configs, np.inf)
+        threshold = -np.inf
+
+        for step, j in enumerate(order):
+            rows = np.flatnonzero(active & ~evaluated[j])
+            if rows.size:
+                evaluate(j, rows)
+            upper = np.fmin(upper, robustness[j])
+
+            if early_exit == 'unsatisfied':
+                active &= ~(upper < 0)
+            elif step == 0 and num_configs > top_k:
+                # Fully evaluate the top_k most promising configurations; the top_k-th
+                # best of their exact min_robustness bounds the final ranking
+                seeds = np.argsort(-upper, kind='stable')[:top_k]
+                for other in order[1:]:
+                    evaluate(other, seeds)
+                exact = np.fmin.reduce(robustness[:, seeds], axis=0)
+                threshold = exact.min()
+                active &= ~(upper < threshold)
+            else:
+                active &= ~(upper < threshold)
+
+        return robustness, evaluated
+
+    def _robustness_matrix(
+        self,
+        batch: List,
+        signal_dicts: List[Dict],
+        required: List[str],
+        early_exit: str,
+        top_k: Optional[int],
+        verbose: bool
+    ) -> Tuple[np.ndarray, np.ndarray, List[Optional[DSEResult]]]:
+        """
+        Evaluate every constraint for the batch, isolating failing configurations.
+
+        The stacked batch is evaluated first. If that raises, each
+        configuration is evaluated on its own (without early exit), so only
+        the configurations whose evaluation fails get an error result.
+
+        Args:
+            batch: List of (index, config, stats) tuples
+            signal_dicts: Extracted signals of each configuration in batch
+            required: Names of the signals read by the constraints
+            early_exit: Pruning mode (see explore_design_space)
+            top_k: Number of best configurations kept for early_exit='topk'
+            verbose: Print progress information
+
+        Returns:
+            Tuple of (robustness matrix, evaluated mask, error result or None
+            per configuration)
+        """
+        try:
+            signals_batch, times, lengths = stack_signals(signal_dicts, required)
+            robustness, evaluated = self._evaluate_constraints(signals_batch, times, lengths, early_exit, top_k)
+            return robustness, evaluated, [None] * len(batch)
+        except Exception as e:
+            get_logger().warning(f"  Batched constraint evaluation failed ({e}); "
+                                 f"evaluating configurations one by one")
+
+        robustness = np.full((len(self.constraints), len(batch)), np.nan)
+        evaluated = np.zeros(robustness.shape, dtype=bool)
+        errors = []
+        for col, ((i, config, _), signals) in enumerate(zip(batch, signal_dicts)):
+            try:
+                signals_batch, times, lengths = stack_signals([signals], required)
+                column, _ = self._evaluate_constraints(signals_batch, times, lengths, 'none', top_k)
+                robustness[:, col] = column[:, 0]
+                evaluated[:, col] = True
+                errors.append(None)
+            except Exception as e:
+                errors.append(self._error_result(i, config, e, verbose))
+        return robustness, evaluated, errors
+
+    def _evaluate_batch(
+        self,
+        simulated: List,
+        verbose: bool,
+        early_exit: str = 'none',
+        top_k: Optional[int] = None
+    ) -> List[DSEResult]:
+        """
+        Evaluate all constraints for all simulated configurations.
+
+        Signals of every configuration are stacked into (N, T) arrays so each
+        constraint is evaluated by a single evaluate_batch() call.
+
+        Args:
+            simulated: List of (index, config, stats) tuples
+            verbose: Print progress information
+            early_exit: Pruning mode (see explore_design_space)
+            top_k: Number of best configurations kept for early_exit='topk'
+
+        Returns:
+            List of result dictionaries (including error entries)
+        """
+        logger = get_logger()
+        results = []
+
+        extractor = SignalExtractor()
+        required_set = frozenset().union(*(spec.signal_name_set for spec in self.constraints))
+        required = sorted(required_set)
+
+        batch = []
+        signal_dicts = []
+        for i, config, stats in simulated:
+            try:
+                # Only the signals some constraint reads are built; the
+                # availability check scans component names without building any
+                available = extractor.get_available_signal_names(stats)
+                missing = [name for name in required if name not in available]
+                if missing:
+                    raise ValueError(
+                        f"Required signals not available: {missing}. "
+                        f"Available signals: {extractor.get_available_signals(stats)}"
+                    )
+                signals = extractor.extract_signals_filtered(stats, required_set)
+                batch.append((i, config, stats))
+                signal_dicts.append(signals)
+            except Exception as e:
+                results.append(self._error_result(i, config, e, verbose))
+
+        if not batch:
+            return results
+
+        robustness, evaluated, errors = self._robustness_matrix(
+            batch, signal_dicts, required, early_exit, top_k, verbose
+        )
+        self._update_robustness_stats(robustness)
+
+        for col, (i, config, stats) in enumerate(batch):
+            if errors[col] is not None:
+                results.append(errors[col])
+                continue
+
+            stl_results = []
+            for j, spec in enumerate(self.constraints):
+                if not evaluated[j, col]:
+                    # Configuration was pruned before this constraint
+                    continue
+                rho = float(robustness[j, col])
+                stl_results.append({
+                    'specification': spec.formula,
+                    'name': spec.name,
+                    'robustness': rho,
+                    'satisfied': rho >= 0,
+                    'signals_used': spec.signal_names,
+                    'spec_object': spec
                 })
 
-        # Sort by robustness (higher is better)
-        results.sort(key=lambda x: x['min_robustness'], reverse=True)
+            # Aggregate robustness and satisfaction in one pass
+            summary = _summarize_stl_results(stl_results)
+            min_robustness = summary['min_robustness']
 
-        # Summary
-        satisfying_count = sum(1 for r in results if r.get('satisfies_all', False))
-        logger.info(f"\n=== DSE Summary ===")
-        logger.info(f"  Total configurations: {len(results)}")
-        logger.info(f"  Satisfying all constraints: {satisfying_count}")
-        logger.info(f"  Best min robustness: {results[0]['min_robustness']:.6f} ({results[0]['config_name']})")
+            result = DSEResult(
+                config=config,
+                config_name=config.name,
+                stats=stats,
+                stl_results=stl_results,
+                min_robustness=min_robustness,
+                avg_robustness=summary['avg_robustness'],
+                satisfies_all=summary['all_satisfied'],
+                num_violations=summary['violated'],
+                monitor_summary=summary
+            )
+
+            results.append(result)
+
+            if len(stl_results) < len(self.constraints):
+                # Partial result: min_robustness is only an upper bound
+                result['pruned'] = True
+                result['satisfies_all'] = False
+                logger.info(f"  {config.name}: pruned after {len(stl_results)} constraints, "
+                            f"min_ρ<={min_robustness:.6f}")
+                continue
+
+            # Cache result
+            self.results_cache[config.name] = result
+            self.results_cache[self._cache_key(config)] = result
+
+            logger.info(f"  {config.name}: min_ρ={min_robustness:.6f}, satisfies_all={result['satisfies_all']}")
+
+            if verbose:
+                print(f"  {config.name}: min robustness {min_robustness:.6f}, "
+                      f"satisfies all: {result['satisfies_all']}")
 
         return results
 
@@ -219,12 +1049,8 @@ class ConstraintBasedDSE:
         Returns:
             Top-k configurations
         """
-        sorted_results = sorted(
-            results,
-            key=lambda x: x.get(metric, float('-inf')),
-            reverse=True
-        )
-        return sorted_results[:k]
+        # O(N log k) selection instead of sorting every result
+        return heapq.nlargest(k, results, key=lambda x: x.get(metric, float('-inf')))
 
     def compare_configs(
         self,
@@ -259,19 +1085,20 @@ class ConstraintBasedDSE:
             'num_violations'
         ]
 
+        # Each cached result and its stats are looked up once, not once per metric
+        cached = [self.results_cache[config_name] for config_name in config_names]
         for metric in metrics_to_compare:
-            comparison['metrics'][metric] = {
-                config_name: self.results_cache[config_name].get(metric)
-                for config_name in config_names
-            }
+            comparison['metrics'][metric] = dict(zip(
+                config_names, [result.get(metric) for result in cached]
+            ))
 
         # Add stats comparison
         stats_metrics = ['latency', 'energy', 'area', 'avg_throughput']
+        all_stats = [result['stats'] for result in cached]
         for metric in stats_metrics:
-            comparison['metrics'][metric] = {
-                config_name: self.results_cache[config_name]['stats'].get(metric)
-                for config_name in config_names
-            }
+            comparison['metrics'][metric] = dict(zip(
+                config_names, [stats.get(metric) for stats in all_stats]
+            ))
 
         return comparison
 
@@ -298,52 +1125,61 @@ class ConstraintBasedDSE:
 
     def _export_txt(self, results: List[Dict], filename: str):
         """Export results as formatted text."""
-        with open(filename, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write("STL-Guided Design Space Exploration Results\n")
-            f.write("=" * 80 + "\n\n")
+        # Assemble the whole report in memory and write it once
+        parts = [
+            "=" * 80 + "\n",
+            "STL-Guided Design Space Exploration Results\n",
+            "=" * 80 + "\n\n"
+        ]
+
+        for i, result in enumerate(results):
+            parts.append(
+                f"Rank {i+1}: {result['config_name']}\n"
+                f"  Min Robustness: {result['min_robustness']:.6f}\n"
+                f"  Avg Robustness: {result['avg_robustness']:.6f}\n"
+                f"  Satisfies All: {result['satisfies_all']}\n"
+                f"  Violations: {result['num_violations']}\n"
+            )
 
-            for i, result in enumerate(results):
-                f.write(f"Rank {i+1}: {result['config_name']}\n")
-                f.write(f"  Min Robustness: {result['min_robustness']:.6f}\n")
-                f.write(f"  Avg Robustness: {result['avg_robustness']:.6f}\n")
-                f.write(f"  Satisfies All: {result['satisfies_all']}\n")
-                f.write(f"  Violations: {result['num_violations']}\n")
+            if 'stats' in result:
+                stats = result['stats']
+                parts.append(
+                    f"  Latency: {stats.get('latency', 'N/A')} s\n"
+                    f"  Energy: {stats.get('energy', 'N/A')} pJ\n"
+                    f"  Area: {stats.get('area', 'N/A')} mm²\n"
+                )
 
-                if 'stats' in result:
-                    stats = result['stats']
-                    f.write(f"  Latency: {stats.get('latency', 'N/A')} s\n")
-                    f.write(f"  Energy: {stats.get('energy', 'N/A')} pJ\n")
-                    f.write(f"  Area: {stats.get('area', 'N/A')} mm²\n")
+            parts.append("\n")
 
-                f.write("\n")
+        with open(filename, 'w') as f:
+            f.write("".join(parts))
 
     def _export_csv(self, results: List[Dict], filename: str):
         """Export results as CSV."""
         import csv
 
-        with open(filename, 'w', newline='') as f:
-            fieldnames = [
-                'rank', 'config_name', 'min_robustness', 'avg_robustness',
-                'satisfies_all', 'num_violations', 'latency', 'energy', 'area'
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for i, result in enumerate(results):
-                row = {
-                    'rank': i + 1,
-                    'config_name': result['config_name'],
-                    'min_robustness': result['min_robustness'],
-                    'avg_robustness': result['avg_robustness'],
-                    'satisfies_all': result['satisfies_all'],
-                    'num_violations': result['num_violations'],
-                }
-
-                if 'stats' in result:
-                    stats = result['stats']
-                    row['latency'] = stats.get('latency', '')
-                    row['energy'] = stats.get('energy', '')
-                    row['area'] = stats.get('area', '')
+        fieldnames = [
+            'rank', 'config_name', 'min_robustness', 'avg_robustness',
+            'satisfies_all', 'num_violations', 'latency', 'energy', 'area'
+        ]
+        empty_stats = {}
 
-                writer.writerow(row)
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            # Rows are built lazily as flat tuples and written in one writerows() call
+            writer.writerows(
+                (
+                    i + 1,
+                    result['config_name'],
+                    result.get('min_robustness', ''),
+                    result.get('avg_robustness', ''),
+                    result.get('satisfies_all', ''),
+                    result.get('num_violations', ''),
+                    stats.get('latency', ''),
+                    stats.get('energy', ''),
+                    stats.get('area', '')
+                )
+                for i, result in enumerate(results)
+                for stats in (result.get('stats') or empty_stats,)
+            )
@@ -4,6 +4,223 @@ Pareto frontier computation for multi-objective design space exploration.
 
 from typing import List, Dict, Tuple, Callable
 import math
+import numpy as np
+from ._pareto_kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from ._pareto_kernels import pareto_mask as _pareto_mask_numba, skyline_2d as _skyline_2d_numba
+
+# Below this many configurations (or in 2D, where the NumPy sweep is
+# O(N log N)) the compiled pairwise kernel is not worth calling
+_NUMBA_MIN_CONFIGS = 64
+
+
+class MetricsMatrix:
+    """
+    Objective metrics of a set of configurations as one NumPy matrix.
+
+    Column-oriented counterpart of the per-configuration metric dicts: build
+    it once per sweep and pass it to the *_from_matrix methods of
+    ParetoFrontier, instead of re-extracting metrics on every call.
+
+    Example:
+        mm = MetricsMatrix.from_configs(results, ['latency', 'energy'],
+                                        extract_metrics=lambda r: r['stats'])
+        values, pareto_configs = ParetoFrontier.compute_pareto_frontier_from_matrix(mm, [True, True])
+        crowding = ParetoFrontier.crowding_distance_from_matrix(mm)
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        columns: List[str],
+        configs: List[Dict],
+        missing: np.ndarray = None
+    ):
+        """
+        Args:
+            values: (N, M) float64 metric values
+            columns: Metric name of each column
+            configs: The N configurations, in row order
+            missing: Optional (N, M) mask of metrics absent from a configuration
+        """
+        self.values = values
+        self.columns = list(columns)
+        self.cols = {name: k for k, name in enumerate(self.columns)}
+        self.configs = configs
+        self.missing = missing if missing is not None else np.zeros(values.shape, dtype=bool)
+
+    @classmethod
+    def from_configs(
+        cls,
+        configs: List[Dict],
+        objectives: List[str],
+        extract_metrics: Callable[[Dict], Dict[str, float]] = None,
+        default: float = np.nan
+    ) -> 'MetricsMatrix':
+        """
+        Extract the given metrics of every configuration.
+
+        Args:
+            configs: List of configuration dictionaries
+            objectives: Metric names, one column each
+            extract_metrics: Optional function to extract metrics dict from configuration
+            default: Value stored for missing metrics (also flagged in .missing)
+
+        Returns:
+            MetricsMatrix instance
+        """
+        if extract_metrics:
+            points = [extract_metrics(config) for config in configs]
+        else:
+            points = configs
+
+        n = len(points)
+        values = np.empty((n, len(objectives)))
+        for k, obj in enumerate(objectives):
+            values[:, k] = np.fromiter((p.get(obj, default) for p in points), dtype=np.float64, count=n)
+        missing = np.array(
+            [[obj not in p for obj in objectives] for p in points], dtype=bool
+        ).reshape(n, len(objectives))
+
+        return cls(values, objectives, configs, missing)
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def select(self, objectives: List[str] = None, fill_missing=None) -> np.ndarray:
+        """
+        Columns of the given metrics (default: all), in that order.
+
+        Args:
+            objectives: Metric names
+            fill_missing: Optional scalar or per-column values for missing metrics
+
+        Returns:
+            np.ndarray: (N, len(objectives)) copy of the values
+        """
+        index = [self.cols[obj] for obj in objectives] if objectives is not None else list(range(len(self.columns)))
+        values = self.values[:, index]
+        if fill_missing is not None:
+            fill = np.broadcast_to(np.asarray(fill_missing, dtype=np.float64), values.shape)
+            missing = self.missing[:, index]
+            values[missing] = fill[missing]
+        return values
+
+    def costs(self, minimize: List[bool], objectives: List[str] = None) -> np.ndarray:
+        """
+        Cost matrix where smaller is better.
+
+        Maximization columns are negated and missing metrics become +inf (the
+        worst value), matching the defaults used by ParetoFrontier.is_dominated().
+
+        Args:
+            minimize: List of booleans for each objective
+            objectives: Metric names (default: all columns)
+
+        Returns:
+            np.ndarray: float64 cost matrix
+        """
+        signs = np.array([1.0 if is_minimize else -1.0 for is_minimize in minimize])
+        worst = np.array([math.inf if is_minimize else -math.inf for is_minimize in minimize])
+        return self.select(objectives, fill_missing=worst) * signs
+
+
+def dominates(costs1: Tuple[float, ...], costs2: Tuple[float, ...]) -> bool:
+    """
+    Check if costs1 dominates costs2 (smaller is better in every objective).
+
+    costs1 dominates costs2 if it is better or equal in all objectives and
+    strictly better in at least one. Returns as soon as costs1 is worse (or
+    incomparable, e.g. NaN) in any objective.
+
+    Args:
+        costs1: First configuration's sign-normalized costs
+        costs2: Second configuration's sign-normalized costs
+
+    Returns:
+        True if costs1 dominates costs2
+    """
+    strictly_better = False
+
+    for cost1, cost2 in zip(costs1, costs2):
+        if not cost1 <= cost2:
+            return False
+        strictly_better |= cost1 < cost2
+
+    return strictly_better
+
+
+def _pareto_mask(costs: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of the non-dominated rows of a cost matrix (smaller is better).
+
+    Rows are visited in lexicographic order, so every dominator of a row is
+    visited before it. In 2D a running minimum of the second objective decides
+    dominance; otherwise each row is tested against the frontier found so far.
+    Rows containing NaN neither dominate nor are dominated.
+
+    Args:
+        costs: (N, M) float cost matrix
+
+    Returns:
+        np.ndarray: (N,) boolean mask
+    """
+    n, m = costs.shape
+    mask = np.ones(n, dtype=bool)
+
+    valid = ~np.isnan(costs).any(axis=1)
+    rows = np.flatnonzero(valid)
+    if rows.size < 2 or m == 0:
+        return mask
+    pts = costs[rows]
+
+    # Lexicographic order: objective 0 first, ties broken by later objectives
+    order = np.lexsort(pts.T[::-1])
+    sorted_pts = pts[order]
+
+    if m == 1:
+        dominated = sorted_pts[:, 0] > sorted_pts[0, 0]
+    elif m == 2 and NUMBA_AVAILABLE:
+        # The common latency/energy-style case: one compiled skyline pass
+        dominated = _skyline_2d_numba(
+            np.ascontiguousarray(sorted_pts[:, 0]), np.ascontiguousarray(sorted_pts[:, 1])
+        )
+    elif m == 2:
+        c0 = sorted_pts[:, 0]
+        c1 = sorted_pts[:, 1]
+        running_min = np.minimum.accumulate(c1)
+        # Position where each running minimum was first reached (smallest c0)
+        positions = np.arange(c1.shape[0])
+        first_reached = np.maximum.accumulate(
+            np.where(np.r_[True, running_min[1:] < running_min[:-1]], positions, 0)
+        )
+        prev_min = np.r_[np.inf, running_min[:-1]]
+        prev_pos = np.r_[0, first_reached[:-1]]
+        # Earlier points have c0 <= own c0; a smaller c1, or an equal c1 with a
+        # smaller c0, dominates
+        dominated = (prev_min < c1) | ((prev_min == c1) & (c0[prev_pos] < c0))
+        dominated[0] = False
+    else:
+        dominated = np.zeros(sorted_pts.shape[0], dtype=bool)
+        frontier = np.empty((0, m))
+        for i, point in enumerate(sorted_pts):
+            if frontier.shape[0] and np.any(
+                np.all(frontier <= point, axis=1) & np.any(frontier < point, axis=1)
+            ):
+                dominated[i] = True
+            else:
+                frontier = np.vstack((frontier, point))
+
+    mask[rows[order[dominated]]] = False
+    return mask
+
+
+def _frontier_mask(costs: np.ndarray) -> np.ndarray:
+    """Non-dominated mask, using the numba kernel where it pays off."""
+    if NUMBA_AVAILABLE and costs.shape[1] > 2 and costs.shape[0] >= _NUMBA_MIN_CONFIGS:
+        return _pareto_mask_numba(costs)
+    return _pareto_mask(costs)
 
 
 class ParetoFrontier:
@@ -36,30 +253,22 @@ class ParetoFrontier:
         Returns:
             True if point1 is dominated by point2
         """
-        better_or_equal_count = 0
-        strictly_better_count = 0
-
-        for obj, is_minimize in zip(objectives, minimize):
-            val1 = point1.get(obj, float('inf') if is_minimize else float('-inf'))
-            val2 = point2.get(obj, float('inf') if is_minimize else float('-inf'))
-
-            if is_minimize:
-                # For minimization: smaller is better
-                if val2 < val1:
-                    strictly_better_count += 1
-                    better_or_equal_count += 1
-                elif val2 == val1:
-                    better_or_equal_count += 1
-            else:
-                # For maximization: larger is better
-                if val2 > val1:
-                    strictly_better_count += 1
-                    better_or_equal_count += 1
-                elif val2 == val1:
-                    better_or_equal_count += 1
+        # Negate maximized objectives so that smaller is better everywhere;
+        # a missing metric becomes the worst cost (+inf) either way
+        costs1 = tuple(point1.get(obj, float('inf')) if is_minimize else -point1.get(obj, float('-inf'))
+                       for obj, is_minimize in zip(objectives, minimize))
+        costs2 = tuple(point2.get(obj, float('inf')) if is_minimize else -point2.get(obj, float('-inf'))
+                       for obj, is_minimize in zip(objectives, minimize))
+
+        return ParetoFrontier._is_dominated_costs(costs1, costs2)
 
-        # Dominated if point2 is better/equal in all and strictly better in at least one
-        return (better_or_equal_count == len(objectives) and strictly_better_count > 0)
+    @staticmethod
+    def _is_dominated_costs(
+        costs1: Tuple[float, ...],
+        costs2: Tuple[float, ...]
+    ) -> bool:
+        """is_dominated() on sign-normalized costs: True if costs2 dominates costs1."""
+        return dominates(costs2, costs1)
 
     @staticmethod
     def compute_pareto_frontier(
@@ -95,28 +304,37 @@ class ParetoFrontier:
         if not configurations:
             return []
 
-        # Extract metrics from configurations
-        if extract_metrics:
-            points = [extract_metrics(config) for config in configurations]
-        else:
-            points = configurations
+        mm = MetricsMatrix.from_configs(configurations, objectives, extract_metrics)
+        _, pareto_optimal = ParetoFrontier.compute_pareto_frontier_from_matrix(mm, minimize)
+        return pareto_optimal
 
-        pareto_optimal = []
+    @staticmethod
+    def compute_pareto_frontier_from_matrix(
+        mm: MetricsMatrix,
+        minimize: List[bool],
+        objectives: List[str] = None
+    ) -> Tuple[np.ndarray, List[Dict]]:
+        """
+        Compute the Pareto-optimal rows of a metrics matrix.
 
-        for i, (config, point) in enumerate(zip(configurations, points)):
-            is_pareto = True
+        Args:
+            mm: Metrics of the configurations
+            minimize: List of booleans for each objective
+            objectives: Objective names (default: all columns of mm)
 
-            # Check if this point is dominated by any other point
-            for j, (_, other_point) in enumerate(zip(configurations, points)):
-                if i != j:
-                    if ParetoFrontier.is_dominated(point, other_point, objectives, minimize):
-                        is_pareto = False
-                        break
+        Returns:
+            Tuple of (metric values of the Pareto-optimal rows,
+            list of Pareto-optimal configurations)
+        """
+        objectives = objectives if objectives is not None else mm.columns
+        assert len(objectives) == len(minimize), \
+            "objectives and minimize lists must have same length"
 
-            if is_pareto:
-                pareto_optimal.append(config)
+        # Sort-based sweep over a cost matrix instead of pairwise is_dominated()
+        mask = _frontier_mask(mm.costs(minimize, objectives))
+        pareto_idx = np.flatnonzero(mask)
 
-        return pareto_optimal
+        return mm.values[pareto_idx], [mm.configs[i] for i in pareto_idx.tolist()]
 
     @staticmethod
     def rank_by_pareto_layers(
@@ -141,22 +359,27 @@ class ParetoFrontier:
         Returns:
             List of layers, where each layer is a list of configurations
         """
-        remaining = list(configurations)
-        layers = []
+        assert len(objectives) == len(minimize), \
+            "objectives and minimize lists must have same length"
 
-        while remaining:
-            # Compute Pareto frontier of remaining configurations
-            pareto_layer = ParetoFrontier.compute_pareto_frontier(
-                remaining, objectives, minimize, extract_metrics
-            )
+        if not configurations:
+            return []
 
-            if not pareto_layer:
-                break
+        # Metrics are extracted once; layers are peeled off by flipping
+        # flags in an alive mask over a single tuple of configurations
+        configs = tuple(configurations)
+        costs = MetricsMatrix.from_configs(configs, objectives, extract_metrics).costs(minimize)
+        alive = np.ones(len(configs), dtype=bool)
+        layers = []
 
-            layers.append(pareto_layer)
+        while alive.any():
+            # Compute Pareto frontier of remaining configurations
+            remaining = np.flatnonzero(alive)
+            layer_idx = remaining[_frontier_mask(costs[remaining])]
+            layers.append([configs[i] for i in layer_idx.tolist()])
 
             # Remove this layer from remaining
-            remaining = [c for c in remaining if c not in pareto_layer]
+            alive[layer_idx] = False
 
         return layers
 
@@ -191,35 +414,54 @@ class ParetoFrontier:
         if not pareto_front:
             return 0.0
 
-        # Extract metrics
-        if extract_metrics:
-            points = [extract_metrics(config) for config in pareto_front]
-        else:
-            points = pareto_front
+        mm = MetricsMatrix.from_configs(pareto_front, objectives, extract_metrics)
+        if mm.missing.any():
+            raise KeyError(objectives[int(np.flatnonzero(mm.missing.any(axis=0))[0])])
+
+        return ParetoFrontier.hypervolume_from_matrix(mm, reference_point, objectives)
+
+    @staticmethod
+    def hypervolume_from_matrix(
+        mm: MetricsMatrix,
+        reference_point: Dict[str, float],
+        objectives: List[str] = None
+    ) -> float:
+        """
+        Compute the 2D hypervolume indicator of the rows of a metrics matrix.
+
+        Args:
+            mm: Metrics of the Pareto-optimal configurations
+            reference_point: Reference point (worst acceptable values)
+            objectives: 2 objective names (default: all columns of mm)
+
+        Returns:
+            Hypervolume value
+        """
+        objectives = objectives if objectives is not None else mm.columns
+        if len(objectives) != 2:
+            raise NotImplementedError("Hypervolume only implemented for 2 objectives")
+
+        if len(mm) == 0:
+            return 0.0
 
         # Extract 2D points
         obj1, obj2 = objectives
         ref1, ref2 = reference_point[obj1], reference_point[obj2]
+        xs = mm.values[:, mm.cols[obj1]]
+        ys = mm.values[:, mm.cols[obj2]]
 
         # Sort points by first objective
-        sorted_points = sorted(points, key=lambda p: p[obj1])
+        order = np.argsort(xs, kind='stable')
+        xs = xs[order]
+        ys = ys[order]
 
-        # Compute hypervolume
-        hv = 0.0
-        prev_x = ref1
+        # Sum of width * height rectangles, widths measured from the previous point
+        widths = np.empty_like(xs)
+        widths[0] = xs[0] - ref1
+        widths[1:] = xs[1:] - xs[:-1]
 
-        for point in sorted_points:
-            x = point[obj1]
-            y = point[obj2]
-
-            # Width * height
-            width = x - prev_x
-            height = ref2 - y
-
-            hv += width * height
-            prev_x = x
-
-        return hv
+        # cumsum adds in order, so the total matches the original running sum exactly
+        return float(np.cumsum(widths * (ref2 - ys))[-1])
 
     @staticmethod
     def crowding_distance(
@@ -245,41 +487,51 @@ class ParetoFrontier:
         if n <= 2:
             return {i: float('inf') for i in range(n)}
 
-        # Extract metrics
-        if extract_metrics:
-            points = [extract_metrics(config) for config in configurations]
-        else:
-            points = configurations
-
-        # Initialize crowding distances
-        crowding = {i: 0.0 for i in range(n)}
-
-        # For each objective
-        for obj in objectives:
-            # Sort by this objective
-            sorted_indices = sorted(
-                range(n),
-                key=lambda i: points[i].get(obj, 0)
-            )
+        mm = MetricsMatrix.from_configs(configurations, objectives, extract_metrics, default=0.0)
+        crowding = ParetoFrontier.crowding_distance_from_matrix(mm)
 
-            # Boundary points get infinite distance
-            crowding[sorted_indices[0]] = float('inf')
-            crowding[sorted_indices[-1]] = float('inf')
+        return dict(enumerate(crowding.tolist()))
 
-            # Get objective range
-            obj_values = [points[i].get(obj, 0) for i in range(n)]
-            obj_range = max(obj_values) - min(obj_values)
+    @staticmethod
+    def crowding_distance_from_matrix(
+        mm: MetricsMatrix,
+        objectives: List[str] = None
+    ) -> np.ndarray:
+        """
+        Compute crowding distance for each row of a metrics matrix.
 
-            if obj_range == 0:
-                continue
+        Missing metrics count as 0, as in crowding_distance().
 
-            # Compute crowding distance for intermediate points
-            for i in range(1, n - 1):
-                idx = sorted_indices[i]
-                prev_idx = sorted_indices[i - 1]
-                next_idx = sorted_indices[i + 1]
+        Args:
+            mm: Metrics of the configurations
+            objectives: Objective names (default: all columns of mm)
 
-                distance = (points[next_idx][obj] - points[prev_idx][obj]) / obj_range
-                crowding[idx] += distance
+        Returns:
+            np.ndarray: (N,) crowding distances
+        """
+        n = len(mm)
+        if n <= 2:
+            return np.full(n, np.inf)
+
+        pts = mm.select(objectives, fill_missing=0.0)
+        crowding = np.zeros(n)
+        if pts.shape[1] == 0:
+            return crowding
+
+        # Sort every objective column at once; the extremes of each sorted
+        # column give its range, no separate min/max pass
+        orders = np.argsort(pts, axis=0, kind='stable')
+        sorted_values = np.take_along_axis(pts, orders, axis=0)
+        obj_range = sorted_values[-1] - sorted_values[0]
+
+        # Normalized gap between each point's neighbours; objectives with a
+        # zero range only mark their boundary points
+        distance = np.zeros_like(sorted_values)
+        spread = obj_range != 0
+        distance[1:-1, spread] = (sorted_values[2:, spread] - sorted_values[:-2, spread]) / obj_range[spread]
+        distance[0] = distance[-1] = np.inf
+
+        # Scatter-add objective by objective (column-major), as the per-objective loop did
+        np.add.at(crowding, orders.T.ravel(), distance.T.ravel())
 
         return crowding
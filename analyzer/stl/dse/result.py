@@ -0,0 +1,96 @@
+"""
+Compact container for DSE results.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+
+class DSEResult(Mapping):
+    """
+    Result of evaluating one configuration, stored in __slots__.
+
+    ConstraintBasedDSE.explore_design_space returns its results as
+    DSEResult instances. A slotted instance has no per-object __dict__, so
+    large result sets take a fraction of the memory of plain dicts. The
+    class is a Mapping over the fields that are set (plus item assignment),
+    so a DSEResult can be passed wherever a result dict is expected and
+    dict(result) or to_dict() gives a plain dict. Fields that were never set
+    behave like missing dict keys.
+
+    Example:
+        result = dse.explore_design_space(configs)[0]
+        result.min_robustness    # attribute access
+        result.get('stats', {})  # dict-style access
+        dict(result)             # plain dict of the set fields
+    """
+
+    __slots__ = (
+        'config', 'config_name', 'stats', 'stl_results', 'min_robustness',
+        'avg_robustness', 'num_violations', 'satisfies_all', 'monitor_summary',
+        'pruned', 'simulated', 'skipped', 'error'
+    )
+
+    def __init__(self, **fields):
+        """
+        Initialize a result from keyword fields.
+
+        Args:
+            **fields: Values for any of the names in __slots__
+
+        Raises:
+            TypeError: If a field is not one of __slots__
+        """
+        for key, value in fields.items():
+            if key not in self.__slots__:
+                raise TypeError(f"Unknown DSE result field: '{key}'")
+            setattr(self, key, value)
+
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> 'DSEResult':
+        """
+        Create a result from a result dict, ignoring unknown keys.
+
+        Args:
+            result: Result dictionary as produced by ConstraintBasedDSE
+
+        Returns:
+            DSEResult instance
+        """
+        return cls(**{key: result[key] for key in cls.__slots__ if key in result})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a result dict containing only the fields that are set."""
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Field value, or default if it is unset or not a field."""
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(f"Unknown DSE result field: '{key}'")
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ and hasattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self) -> int:
+        return sum(1 for key in self.__slots__ if hasattr(self, key))
+
+    def __repr__(self):
+        name = self.get('config_name', '?')
+        return f"DSEResult({name}, min_robustness={self.get('min_robustness')})"
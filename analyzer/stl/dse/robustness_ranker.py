@@ -3,11 +3,38 @@ Ranking and selection utilities based on STL robustness.
 """
 
 from typing import List, Dict, Callable, Optional
+import numpy as np
+
+
+def _order_by_keys(results: List[Dict], keys: np.ndarray, descending: bool) -> List[Dict]:
+    """
+    Reorder results by precomputed float keys.
+
+    Ties keep their input order in both directions, like sorted().
+
+    Args:
+        results: List of DSE results
+        keys: (N,) array of sort keys
+        descending: If True, largest key first
+
+    Returns:
+        Sorted list of results
+    """
+    order = np.argsort(-keys if descending else keys, kind='stable')
+    return [results[i] for i in order.tolist()]
+
+
+def _metric_keys(results: List[Dict], metric: str, default: float) -> np.ndarray:
+    """Extract one metric of every result into a float64 array."""
+    return np.fromiter((r.get(metric, default) for r in results), dtype=np.float64, count=len(results))
 
 
 class RobustnessRanker:
     """
     Rank and select hardware configurations based on STL robustness metrics.
+
+    Results may be result dicts or DSEResult instances; both support the
+    get/[]/in access used here.
     """
 
     @staticmethod
@@ -28,11 +55,8 @@ class RobustnessRanker:
         Returns:
             Sorted list of results
         """
-        return sorted(
-            results,
-            key=lambda x: x.get('min_robustness', float('-inf')),
-            reverse=not ascending
-        )
+        keys = _metric_keys(results, 'min_robustness', float('-inf'))
+        return _order_by_keys(results, keys, descending=not ascending)
 
     @staticmethod
     def rank_by_avg_robustness(
@@ -49,11 +73,8 @@ class RobustnessRanker:
         Returns:
             Sorted list of results
         """
-        return sorted(
-            results,
-            key=lambda x: x.get('avg_robustness', float('-inf')),
-            reverse=not ascending
-        )
+        keys = _metric_keys(results, 'avg_robustness', float('-inf'))
+        return _order_by_keys(results, keys, descending=not ascending)
 
     @staticmethod
     def rank_by_violation_count(
@@ -70,11 +91,8 @@ class RobustnessRanker:
         Returns:
             Sorted list of results
         """
-        return sorted(
-            results,
-            key=lambda x: x.get('num_violations', float('inf')),
-            reverse=not ascending
-        )
+        keys = _metric_keys(results, 'num_violations', float('inf'))
+        return _order_by_keys(results, keys, descending=not ascending)
 
     @staticmethod
     def rank_by_weighted_robustness(
@@ -93,45 +111,95 @@ class RobustnessRanker:
         Returns:
             Sorted list of results (highest weighted robustness first)
         """
-        def compute_weighted_robustness(result):
-            total_weight = 0.0
-            weighted_sum = 0.0
+        # Flatten every (robustness, weight) pair, tagged with its result index
+        counts = [len(result.get('stl_results', [])) for result in results]
+        total = sum(counts)
+        stl_results = [
+            stl_result for result in results for stl_result in result.get('stl_results', [])
+        ]
+        robustness = np.fromiter((r['robustness'] for r in stl_results), dtype=np.float64, count=total)
+        weights = np.fromiter(
+            (spec_weights.get(r['name'], 1.0) for r in stl_results), dtype=np.float64, count=total
+        )
+        if results and counts.count(counts[0]) == len(counts):
+            # Same number of constraints everywhere (the usual DSE case): a
+            # regular (N, M) matrix, reduced along rows
+            weighted_sum = (robustness * weights).reshape(len(results), counts[0]).sum(axis=1)
+            total_weight = weights.reshape(len(results), counts[0]).sum(axis=1)
+        else:
+            # Ragged: per-result sums in one reduction each
+            owner = np.repeat(np.arange(len(results)), counts)
+            weighted_sum = np.bincount(owner, weights=robustness * weights, minlength=len(results))
+            total_weight = np.bincount(owner, weights=weights, minlength=len(results))
+
+        keys = np.zeros(len(results))
+        has_weight = total_weight > 0
+        keys[has_weight] = weighted_sum[has_weight] / total_weight[has_weight]
+
+        return _order_by_keys(results, keys, descending=True)
+
+    @staticmethod
+    def to_arrays(results: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Numeric columns of a result set used by the filters.
 
-            for stl_result in result.get('stl_results', []):
-                spec_name = stl_result['name']
-                robustness = stl_result['robustness']
-                weight = spec_weights.get(spec_name, 1.0)
+        Compute once and pass as results_arrays to chain several filters over
+        the same results without re-reading the dicts.
 
-                weighted_sum += robustness * weight
-                total_weight += weight
+        Args:
+            results: List of DSE results
 
-            return weighted_sum / total_weight if total_weight > 0 else 0.0
+        Returns:
+            Dictionary with 'min_robustness', 'num_violations' and 'satisfies_all' arrays
+        """
+        return {
+            'min_robustness': _metric_keys(results, 'min_robustness', float('-inf')),
+            'num_violations': _metric_keys(results, 'num_violations', float('inf')),
+            'satisfies_all': np.fromiter(
+                (bool(r.get('satisfies_all', False)) for r in results), dtype=bool, count=len(results)
+            ),
+        }
 
-        return sorted(
-            results,
-            key=compute_weighted_robustness,
-            reverse=True
-        )
+    @staticmethod
+    def _columns(
+        results: List[Dict],
+        results_arrays: Optional[Dict[str, np.ndarray]]
+    ) -> Dict[str, np.ndarray]:
+        """results_arrays if given, else to_arrays(results)."""
+        if results_arrays is None:
+            return RobustnessRanker.to_arrays(results)
+        assert len(results_arrays['satisfies_all']) == len(results), \
+            "results_arrays must come from to_arrays() of the same results"
+        return results_arrays
+
+    @staticmethod
+    def _select(results: List[Dict], mask: np.ndarray) -> List[Dict]:
+        """Results where mask is True, in their original order."""
+        return [results[i] for i in np.flatnonzero(mask).tolist()]
 
     @staticmethod
     def filter_satisfying_all(
-        results: List[Dict]
+        results: List[Dict],
+        results_arrays: Optional[Dict[str, np.ndarray]] = None
     ) -> List[Dict]:
         """
         Filter to only configurations satisfying all constraints.
 
         Args:
             results: List of DSE results
+            results_arrays: Optional output of to_arrays(results)
 
         Returns:
             Filtered list
         """
-        return [r for r in results if r.get('satisfies_all', False)]
+        arrs = RobustnessRanker._columns(results, results_arrays)
+        return RobustnessRanker._select(results, arrs['satisfies_all'])
 
     @staticmethod
     def filter_by_min_robustness(
         results: List[Dict],
-        threshold: float
+        threshold: float,
+        results_arrays: Optional[Dict[str, np.ndarray]] = None
     ) -> List[Dict]:
         """
         Filter configurations with minimum robustness above threshold.
@@ -139,19 +207,19 @@ class RobustnessRanker:
         Args:
             results: List of DSE results
             threshold: Minimum acceptable robustness
+            results_arrays: Optional output of to_arrays(results)
 
         Returns:
             Filtered list
         """
-        return [
-            r for r in results
-            if r.get('min_robustness', float('-inf')) >= threshold
-        ]
+        arrs = RobustnessRanker._columns(results, results_arrays)
+        return RobustnessRanker._select(results, arrs['min_robustness'] >= threshold)
 
     @staticmethod
     def filter_by_max_violations(
         results: List[Dict],
-        max_violations: int
+        max_violations: int,
+        results_arrays: Optional[Dict[str, np.ndarray]] = None
     ) -> List[Dict]:
         """
         Filter configurations with at most max_violations violations.
@@ -159,14 +227,13 @@ class RobustnessRanker:
         Args:
             results: List of DSE results
             max_violations: Maximum number of allowed violations
+            results_arrays: Optional output of to_arrays(results)
 
         Returns:
             Filtered list
         """
-        return [
-            r for r in results
-            if r.get('num_violations', float('inf')) <= max_violations
-        ]
+        arrs = RobustnessRanker._columns(results, results_arrays)
+        return RobustnessRanker._select(results, arrs['num_violations'] <= max_violations)
 
     @staticmethod
     def select_best_tradeoff(
@@ -191,39 +258,46 @@ class RobustnessRanker:
             return None
 
         perf_weight = 1.0 - robustness_weight
+        n = len(results)
 
         # Normalize metrics
-        robustness_values = [r.get('min_robustness', 0) for r in results]
-        perf_values = [r['stats'].get(performance_metric, 0) for r in results if 'stats' in r]
+        robustness_values = _metric_keys(results, 'min_robustness', 0.0)
+        has_stats = np.fromiter(('stats' in r for r in results), dtype=bool, count=n)
 
-        if not perf_values:
+        if not has_stats.any():
             # No performance data, rank by robustness only
-            return max(results, key=lambda r: r.get('min_robustness', float('-inf')))
+            keys = _metric_keys(results, 'min_robustness', float('-inf'))
+            return results[int(np.argmax(keys))]
 
-        rob_min, rob_max = min(robustness_values), max(robustness_values)
-        perf_min, perf_max = min(perf_values), max(perf_values)
+        # Performance of results without stats is ignored below
+        perf_values = np.fromiter(
+            (r['stats'].get(performance_metric, np.nan) if 'stats' in r else np.nan for r in results),
+            dtype=np.float64, count=n
+        )
+        perf_missing = has_stats & np.isnan(perf_values)
+        perf_values[perf_missing] = 0.0
+
+        rob_min, rob_max = robustness_values.min(), robustness_values.max()
+        perf_min, perf_max = perf_values[has_stats].min(), perf_values[has_stats].max()
 
         rob_range = rob_max - rob_min if rob_max != rob_min else 1.0
         perf_range = perf_max - perf_min if perf_max != perf_min else 1.0
 
-        def score(result):
-            # Normalize robustness (higher is better)
-            rob = result.get('min_robustness', rob_min)
-            rob_norm = (rob - rob_min) / rob_range
+        # Normalize robustness (higher is better); a missing value scores as rob_min
+        rob = robustness_values.copy()
+        rob[np.fromiter(('min_robustness' not in r for r in results), dtype=bool, count=n)] = rob_min
+        rob_norm = (rob - rob_min) / rob_range
 
-            # Normalize performance
-            if 'stats' not in result:
-                return robustness_weight * rob_norm
+        # Normalize performance; a missing metric scores as perf_min
+        perf = np.where(perf_missing, perf_min, perf_values)
+        if minimize_performance:
+            perf_norm = 1.0 - (perf - perf_min) / perf_range  # Invert for minimization
+        else:
+            perf_norm = (perf - perf_min) / perf_range
 
-            perf = result['stats'].get(performance_metric, perf_min)
-            if minimize_performance:
-                perf_norm = 1.0 - (perf - perf_min) / perf_range  # Invert for minimization
-            else:
-                perf_norm = (perf - perf_min) / perf_range
+        scores = robustness_weight * rob_norm + np.where(has_stats, perf_weight * perf_norm, 0.0)
 
-            return robustness_weight * rob_norm + perf_weight * perf_norm
-
-        return max(results, key=score)
+        return results[int(np.argmax(scores))]
 
     @staticmethod
     def get_pareto_robustness_performance(
@@ -242,22 +316,27 @@ class RobustnessRanker:
         Returns:
             Pareto-optimal configurations
         """
-        from .pareto_frontier import ParetoFrontier
+        from .pareto_frontier import ParetoFrontier, MetricsMatrix
 
         # Add robustness as an objective (maximize)
         objectives = ['min_robustness'] + performance_metrics
         minimize = [False] + minimize_metrics  # Maximize robustness
 
-        def extract_metrics(result):
-            metrics = {'min_robustness': result.get('min_robustness', float('-inf'))}
-            if 'stats' in result:
-                for metric in performance_metrics:
-                    metrics[metric] = result['stats'].get(metric, float('inf'))
-            return metrics
-
-        return ParetoFrontier.compute_pareto_frontier(
-            results,
-            objectives,
-            minimize,
-            extract_metrics
-        )
+        # Build the metrics matrix directly from the results, without an
+        # intermediate metrics dict per result
+        n = len(results)
+        has_stats = np.fromiter(('stats' in r for r in results), dtype=bool, count=n)
+        values = np.empty((n, len(objectives)))
+        values[:, 0] = _metric_keys(results, 'min_robustness', float('-inf'))
+        for k, metric in enumerate(performance_metrics, start=1):
+            values[:, k] = np.fromiter(
+                (r['stats'].get(metric, float('inf')) if 'stats' in r else np.nan for r in results),
+                dtype=np.float64, count=n
+            )
+        # Results without stats lack the performance metrics altogether
+        missing = np.zeros(values.shape, dtype=bool)
+        missing[:, 1:] = ~has_stats[:, None]
+
+        mm = MetricsMatrix(values, objectives, results, missing)
+        _, pareto_optimal = ParetoFrontier.compute_pareto_frontier_from_matrix(mm, minimize)
+        return pareto_optimal
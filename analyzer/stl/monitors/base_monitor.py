@@ -5,7 +5,9 @@ Provides abstract interface for all STL monitoring implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
+import sys
+import numpy as np
 from ..core.specification import STLSpecification
 
 
@@ -25,12 +27,22 @@ class BaseSTLMonitor(ABC):
             specifications: List of STL specifications to monitor
         """
         assert specifications, "At least one specification must be provided"
-        assert all(isinstance(spec, STLSpecification) for spec in specifications), \
-            "All specifications must be STLSpecification instances"
+        if __debug__:
+            # Skipped entirely under python -O; stops at the first offender
+            bad = next((spec for spec in specifications if not isinstance(spec, STLSpecification)), None)
+            assert bad is None, \
+                f"All specifications must be STLSpecification instances, got {type(bad).__name__}"
 
         self.specifications = specifications
         self.results = None
         self._evaluated = False
+        # Robustness of each result and its satisfaction mask, cached by
+        # _finalize_results() so the summary getters do not rescan the dicts
+        self._robustness_arr: Optional[np.ndarray] = None
+        self._satisfied_mask: Optional[np.ndarray] = None
+        # Results split by satisfaction, cached alongside the mask
+        self._satisfied_list: Optional[List[Dict]] = None
+        self._violated_list: Optional[List[Dict]] = None
 
     def __str__(self):
         return (f"{self.__class__.__name__}"
@@ -52,6 +64,31 @@ class BaseSTLMonitor(ABC):
         """
         pass
 
+    def _finalize_results(self, results: List[Dict]):
+        """
+        Store evaluation results and cache their robustness values.
+
+        Subclasses call this at the end of evaluate().
+
+        Args:
+            results: List of evaluation results, one per specification
+        """
+        self.results = results
+        self._robustness_arr = np.fromiter(
+            (result['robustness'] for result in results), dtype=np.float64, count=len(results)
+        )
+        self._satisfied_mask = self._robustness_arr >= 0
+        self._satisfied_list = []
+        self._violated_list = []
+        for result, satisfied in zip(results, self._satisfied_mask.tolist()):
+            (self._satisfied_list if satisfied else self._violated_list).append(result)
+        self._evaluated = True
+
+    def _ensure_cached(self):
+        """Build the robustness cache for subclasses that set self.results directly."""
+        if self._robustness_arr is None or len(self._robustness_arr) != len(self.results):
+            self._finalize_results(self.results)
+
     def get_violations(self) -> List[Dict]:
         """
         Get list of violated specifications.
@@ -65,10 +102,9 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before getting violations")
 
-        return [
-            result for result in self.results
-            if result['robustness'] < 0
-        ]
+        self._ensure_cached()
+
+        return list(self._violated_list)
 
     def get_satisfied(self) -> List[Dict]:
         """
@@ -83,10 +119,9 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before getting satisfied specs")
 
-        return [
-            result for result in self.results
-            if result['robustness'] >= 0
-        ]
+        self._ensure_cached()
+
+        return list(self._satisfied_list)
 
     def all_satisfied(self) -> bool:
         """
@@ -101,7 +136,9 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before checking satisfaction")
 
-        return all(result['satisfied'] for result in self.results)
+        self._ensure_cached()
+
+        return bool(self._satisfied_mask.all())
 
     def any_violated(self) -> bool:
         """
@@ -116,7 +153,9 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before checking violations")
 
-        return any(not result['satisfied'] for result in self.results)
+        self._ensure_cached()
+
+        return not self._satisfied_mask.all()
 
     def get_min_robustness(self) -> float:
         """
@@ -134,7 +173,9 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before getting robustness")
 
-        return min(result['robustness'] for result in self.results)
+        self._ensure_cached()
+
+        return float(self._robustness_arr.min())
 
     def get_max_robustness(self) -> float:
         """
@@ -149,7 +190,9 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before getting robustness")
 
-        return max(result['robustness'] for result in self.results)
+        self._ensure_cached()
+
+        return float(self._robustness_arr.max())
 
     def get_avg_robustness(self) -> float:
         """
@@ -164,8 +207,9 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before getting robustness")
 
-        robustness_values = [result['robustness'] for result in self.results]
-        return sum(robustness_values) / len(robustness_values)
+        self._ensure_cached()
+
+        return float(self._robustness_arr.mean())
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -180,44 +224,68 @@ class BaseSTLMonitor(ABC):
         if not self._evaluated:
             raise RuntimeError("Call evaluate() before getting summary")
 
+        self._ensure_cached()
+
+        robustness = self._robustness_arr
+        satisfied = int(np.count_nonzero(self._satisfied_mask))
+
         return {
             'total_specifications': len(self.specifications),
-            'satisfied': len(self.get_satisfied()),
-            'violated': len(self.get_violations()),
-            'min_robustness': self.get_min_robustness(),
-            'max_robustness': self.get_max_robustness(),
-            'avg_robustness': self.get_avg_robustness(),
-            'all_satisfied': self.all_satisfied(),
+            'satisfied': satisfied,
+            'violated': len(self.results) - satisfied,
+            'min_robustness': float(robustness.min()),
+            'max_robustness': float(robustness.max()),
+            'avg_robustness': float(robustness.mean()),
+            'all_satisfied': satisfied == len(self.results),
         }
 
-    def print_summary(self):
-        """Print a human-readable summary of evaluation results."""
+    def print_summary(self, file: Optional[TextIO] = None):
+        """
+        Print a human-readable summary of evaluation results.
+
+        The report is assembled first and written with a single call.
+
+        Args:
+            file: Output stream (default: sys.stdout)
+        """
+        file = file if file is not None else sys.stdout
+
         if not self._evaluated:
-            print("Monitor not yet evaluated. Call evaluate() first.")
+            file.write("Monitor not yet evaluated. Call evaluate() first.\n")
             return
 
         summary = self.get_summary()
 
-        print("=" * 60)
-        print(f"STL Monitor Summary - {self.__class__.__name__}")
-        print("=" * 60)
-        print(f"Total specifications: {summary['total_specifications']}")
-        print(f"Satisfied: {summary['satisfied']}")
-        print(f"Violated: {summary['violated']}")
-        print(f"All satisfied: {summary['all_satisfied']}")
-        print(f"\nRobustness Statistics:")
-        print(f"  Min: {summary['min_robustness']:.6f}")
-        print(f"  Max: {summary['max_robustness']:.6f}")
-        print(f"  Avg: {summary['avg_robustness']:.6f}")
-        print("=" * 60)
+        parts = [
+            "=" * 60,
+            f"STL Monitor Summary - {self.__class__.__name__}",
+            "=" * 60,
+            f"Total specifications: {summary['total_specifications']}",
+            f"Satisfied: {summary['satisfied']}",
+            f"Violated: {summary['violated']}",
+            f"All satisfied: {summary['all_satisfied']}",
+            "\nRobustness Statistics:",
+            f"  Min: {summary['min_robustness']:.6f}",
+            f"  Max: {summary['max_robustness']:.6f}",
+            f"  Avg: {summary['avg_robustness']:.6f}",
+            "=" * 60,
+        ]
 
         if summary['violated'] > 0:
-            print("\nViolated Specifications:")
-            for result in self.get_violations():
-                print(f"  - {result['name']}: robustness = {result['robustness']:.6f}")
-                print(f"    Formula: {result['specification']}")
+            parts.append("\nViolated Specifications:")
+            parts.extend(
+                f"  - {result['name']}: robustness = {result['robustness']:.6f}\n"
+                f"    Formula: {result['specification']}"
+                for result in self._violated_list
+            )
+
+        file.write("\n".join(parts) + "\n")
 
     def reset(self):
         """Reset the monitor state."""
         self.results = None
         self._evaluated = False
+        self._robustness_arr = None
+        self._satisfied_mask = None
+        self._satisfied_list = None
+        self._violated_list = None
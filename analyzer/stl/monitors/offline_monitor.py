@@ -5,14 +5,44 @@ Evaluates STL specifications after simulation completes, using
 the statistics dictionary from accelerator.get_statistics().
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import os
 from .base_monitor import BaseSTLMonitor
 from ..core.specification import STLSpecification
+from ..core.bundle import SpecificationBundle
 from ..signals.signal_extractor import SignalExtractor
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, LogLevel
 from ..utils.debug import get_debugger
 
 
+# Below this many specifications, thread pool startup outweighs the gain
+_PARALLEL_MIN_SPECS = 4
+
+
+def _evaluate_group(specs: List[STLSpecification], all_signals: Dict) -> list:
+    """
+    Evaluate specifications in turn, returning (robustness, exception) pairs instead of raising.
+
+    Specifications with the same formula and signals can share one cached
+    rtamt parse, so they are grouped into one task and never run concurrently.
+    """
+    outcomes = []
+    for spec in specs:
+        try:
+            _check_signals(spec, all_signals)
+            outcomes.append((spec.evaluate(all_signals), None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+
+def _check_signals(spec: STLSpecification, all_signals: Dict):
+    """Raise KeyError naming the first signal of spec missing from all_signals."""
+    if not spec.signal_name_set.issubset(all_signals.keys()):
+        raise KeyError(next(name for name in spec.signal_names if name not in all_signals))
+
+
 class OfflineSTLMonitor(BaseSTLMonitor):
     """
     Post-simulation STL monitoring.
@@ -44,7 +74,8 @@ class OfflineSTLMonitor(BaseSTLMonitor):
     def __init__(
         self,
         specifications: List[STLSpecification],
-        hw_arch=None
+        hw_arch=None,
+        n_jobs: Optional[int] = 1
     ):
         """
         Initialize offline STL monitor.
@@ -52,17 +83,39 @@ class OfflineSTLMonitor(BaseSTLMonitor):
         Args:
             specifications: List of STL specifications to monitor
             hw_arch: Optional hardware architecture (for signal extraction)
+            n_jobs: Number of threads evaluating specifications concurrently
+                    (default: 1, sequential with shared subformulas;
+                    None or -1: one per CPU). Specifications are independent,
+                    so with n_jobs > 1 and at least 4 specifications each one
+                    is evaluated on its own instead of through the bundle.
         """
         super().__init__(specifications)
         self.hw_arch = hw_arch
         self.extractor = SignalExtractor(hw_arch)
 
-    def evaluate(self, stats_dict: Dict) -> List[Dict]:
+        if n_jobs is None or n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        self.n_jobs = min(n_jobs, len(specifications)) if len(specifications) >= _PARALLEL_MIN_SPECS else 1
+
+        # Only signals some specification reads are extracted
+        self.required_signals = frozenset().union(*(spec.signal_name_set for spec in specifications))
+
+        # Shared subformula evaluation only pays off with several specifications
+        use_bundle = len(specifications) >= 2 and self.n_jobs == 1
+        self.bundle = SpecificationBundle(specifications) if use_bundle else None
+
+    def evaluate(self, stats_dict: Dict, config=None) -> List[Dict]:
         """
         Evaluate all STL specifications on completed simulation.
 
+        One monitor can be reused across a sweep: the specifications and their
+        shared subformula bundle are built once, and each configuration is
+        passed here instead of to the constructor.
+
         Args:
             stats_dict: Statistics dictionary from accelerator.get_statistics()
+            config: Optional hardware architecture the statistics belong to
+                    (replaces the one given at construction)
 
         Returns:
             List of evaluation results, one per specification.
@@ -79,33 +132,75 @@ class OfflineSTLMonitor(BaseSTLMonitor):
         logger = get_logger()
         debugger = get_debugger()
 
+        if config is not None:
+            self.hw_arch = config
+            self.extractor.hw_arch = config
+
         logger.info(f"Starting offline STL monitoring ({len(self.specifications)} specifications)")
 
-        # Extract all signals from statistics
+        # Extract the signals the specifications read from statistics
         try:
-            all_signals = self.extractor.extract_signals(stats_dict)
+            all_signals = self.extractor.extract_signals_filtered(stats_dict, self.required_signals)
             logger.info(f"  Extracted {len(all_signals)} signals from statistics")
-            logger.debug(f"  Available signals: {', '.join(list(all_signals.keys())[:10])}...")
+            if logger.is_debug_enabled():
+                logger.debug(f"  Extracted signals: {', '.join(list(all_signals.keys())[:10])}...")
         except Exception as e:
             error_msg = f"Failed to extract signals from statistics: {e}"
             logger.error(error_msg)
             debugger.add_error(error_msg, context={'num_specs': len(self.specifications)})
             raise RuntimeError(error_msg)
 
-        # Evaluate each specification
+        # Evaluate all bundled specifications at once; on any failure fall back to
+        # per-specification evaluation, which reports errors in detail
+        bundled = None
+        if self.bundle is not None:
+            try:
+                bundled = self.bundle.evaluate_all(all_signals)
+            except Exception as e:
+                logger.debug(f"  Bundled evaluation failed, evaluating individually: {e}")
+
+        # Evaluate the specifications concurrently, in order; errors are
+        # re-raised below so they are reported like sequential failures
+        evaluated = None
+        if self.n_jobs > 1:
+            logger.debug(f"  Evaluating specifications on {self.n_jobs} threads")
+            groups = {}
+            for i, spec in enumerate(self.specifications):
+                groups.setdefault((spec.formula, spec.signal_names), []).append(i)
+            evaluated = [None] * len(self.specifications)
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                outcomes = executor.map(
+                    lambda indices: _evaluate_group([self.specifications[i] for i in indices], all_signals),
+                    groups.values()
+                )
+                for indices, group_outcomes in zip(groups.values(), outcomes):
+                    for i, outcome in zip(indices, group_outcomes):
+                        evaluated[i] = outcome
+
+        # Evaluate each specification; messages are only formatted when their
+        # level is enabled
         results = []
+        num_specs = len(self.specifications)
+        debug_enabled = logger.is_debug_enabled()
+        info_enabled = logger.is_enabled_for(LogLevel.INFO)
+        warning_enabled = logger.is_enabled_for(LogLevel.WARNING)
         for i, spec in enumerate(self.specifications):
-            logger.debug(f"\nEvaluating specification {i+1}/{len(self.specifications)}: {spec.name}")
+            if debug_enabled:
+                logger.debug(f"\nEvaluating specification {i+1}/{num_specs}: {spec.name}")
 
             try:
-                # Get required signals for this specification
-                required_signals = {
-                    name: all_signals[name]
-                    for name in spec.signal_names
-                }
-
-                # Evaluate specification
-                robustness = spec.evaluate(required_signals)
+                # Evaluate specification. Specifications only read their own
+                # signals, so they get the extracted dict as-is instead of a
+                # per-specification copy
+                if bundled is not None:
+                    robustness = bundled[i]
+                elif evaluated is not None:
+                    robustness, error = evaluated[i]
+                    if error is not None:
+                        raise error
+                else:
+                    _check_signals(spec, all_signals)
+                    robustness = spec.evaluate(all_signals)
 
                 # Store result
                 result = {
@@ -120,18 +215,20 @@ class OfflineSTLMonitor(BaseSTLMonitor):
                 results.append(result)
 
                 if robustness >= 0:
-                    logger.info(f"  ✓ {spec.name}: SATISFIED (ρ = {robustness:.6f})")
-                else:
+                    if info_enabled:
+                        logger.info(f"  ✓ {spec.name}: SATISFIED (ρ = {robustness:.6f})")
+                elif warning_enabled:
                     logger.warning(f"  ✗ {spec.name}: VIOLATED (ρ = {robustness:.6f})")
 
             except KeyError as e:
                 error_msg = f"Required signal not available for specification '{spec.name}': {e}"
+                available_signals = self.extractor.get_available_signals(stats_dict)
                 logger.error(error_msg)
-                logger.error(f"  Available signals: {list(all_signals.keys())}")
+                logger.error(f"  Available signals: {available_signals}")
                 debugger.add_error(error_msg, context={
                     'specification': spec.name,
                     'required_signals': spec.signal_names,
-                    'available_signals': list(all_signals.keys())
+                    'available_signals': available_signals
                 })
                 raise ValueError(error_msg)
             except Exception as e:
@@ -149,26 +246,27 @@ class OfflineSTLMonitor(BaseSTLMonitor):
                 raise RuntimeError(error_msg)
 
         # Store results and mark as evaluated
-        self.results = results
-        self._evaluated = True
+        self._finalize_results(results)
 
         # Summary
-        satisfied_count = sum(1 for r in results if r['satisfied'])
-        violated_count = len(results) - satisfied_count
+        if info_enabled:
+            satisfied_count = len(self._satisfied_list)
+            violated_count = len(results) - satisfied_count
 
-        logger.info(f"\n=== Monitoring Summary ===")
-        logger.info(f"  Total specifications: {len(results)}")
-        logger.info(f"  Satisfied: {satisfied_count}")
-        logger.info(f"  Violated: {violated_count}")
+            logger.info(f"\n=== Monitoring Summary ===")
+            logger.info(f"  Total specifications: {len(results)}")
+            logger.info(f"  Satisfied: {satisfied_count}")
+            logger.info(f"  Violated: {violated_count}")
 
         return results
 
-    def evaluate_and_report(self, stats_dict: Dict) -> Dict:
+    def evaluate_and_report(self, stats_dict: Dict, config=None) -> Dict:
         """
         Evaluate specifications and return a comprehensive report.
 
         Args:
             stats_dict: Statistics dictionary from accelerator.get_statistics()
+            config: Optional hardware architecture the statistics belong to
 
         Returns:
             Dictionary containing:
@@ -176,7 +274,7 @@ class OfflineSTLMonitor(BaseSTLMonitor):
             - summary: Summary statistics
             - all_satisfied: Boolean flag
         """
-        results = self.evaluate(stats_dict)
+        results = self.evaluate(stats_dict, config)
         summary = self.get_summary()
 
         return {
@@ -211,16 +309,17 @@ class OfflineSTLMonitor(BaseSTLMonitor):
         Returns:
             Dictionary mapping specification names to availability flags
         """
-        available_signals = set(self.extractor.get_available_signals(stats_dict))
+        # Names only: no signal arrays are built for the check
+        available_signals = self.extractor.get_available_signal_names(stats_dict)
 
         validation = {}
         for spec in self.specifications:
-            required_signals = set(spec.signal_names)
-            is_valid = required_signals.issubset(available_signals)
+            required_signals = spec.signal_name_set
+            missing_signals = required_signals - available_signals
             validation[spec.name] = {
-                'valid': is_valid,
+                'valid': not missing_signals,
                 'required_signals': list(required_signals),
-                'missing_signals': list(required_signals - available_signals)
+                'missing_signals': list(missing_signals)
             }
 
         return validation
@@ -0,0 +1,176 @@
+"""
+Numba-compiled kernels for signal transformations.
+
+numba is an optional dependency. When it is not installed, NUMBA_AVAILABLE
+is False and signal_builder.py and signal_extractor.py use their NumPy
+implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many samples, NumPy's column fills beat the kernel call overhead
+KERNEL_MIN_SAMPLES = 1024
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def moving_average(values, half):
+        """
+        Centered moving average with windows truncated at the edges.
+
+        Keeps a running sum of the finite samples in the window: each step
+        adds the sample entering the window and subtracts the one leaving it.
+        NaN and +/-inf samples are counted instead of summed, so they only
+        affect the windows that contain them (as with a direct sum).
+
+        Args:
+            values: 1-D array of sample values
+            half: Half window size; the window of sample i is [i - half, i + half]
+
+        Returns:
+            np.ndarray: Averaged values (float64)
+        """
+        n = values.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        running_sum = 0.0
+        # Non-finite samples currently in the window
+        num_nan = 0
+        num_pos_inf = 0
+        num_neg_inf = 0
+        for k in range(-half, n):
+            enter = k + half
+            if enter < n:
+                v = values[enter]
+                if v != v:
+                    num_nan += 1
+                elif v == np.inf:
+                    num_pos_inf += 1
+                elif v == -np.inf:
+                    num_neg_inf += 1
+                else:
+                    running_sum += v
+            leave = k - half - 1
+            if leave >= 0:
+                v = values[leave]
+                if v != v:
+                    num_nan -= 1
+                elif v == np.inf:
+                    num_pos_inf -= 1
+                elif v == -np.inf:
+                    num_neg_inf -= 1
+                else:
+                    running_sum -= v
+            if k < 0:
+                continue
+            if num_nan > 0 or (num_pos_inf > 0 and num_neg_inf > 0):
+                out[k] = np.nan
+            elif num_pos_inf > 0:
+                out[k] = np.inf
+            elif num_neg_inf > 0:
+                out[k] = -np.inf
+            else:
+                out[k] = running_sum / (min(enter + 1, n) - max(k - half, 0))
+        return out
+
+    @njit(cache=True)
+    def value_range(values):
+        """
+        Minimum and maximum of a non-empty array in one pass.
+
+        Like ndarray.min()/max(), a NaN sample makes both results NaN.
+
+        Args:
+            values: 1-D array of sample values (non-empty)
+
+        Returns:
+            Tuple of (min, max)
+        """
+        lo = values[0]
+        hi = values[0]
+        for i in range(values.shape[0]):
+            v = values[i]
+            if v != v:
+                return np.nan, np.nan
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        return lo, hi
+
+    @njit(cache=True)
+    def value_stats(values):
+        """
+        Min, max, mean and population std of a non-empty array in one pass.
+
+        Uses Welford's running mean/variance update. Non-finite samples are
+        not handled here: the last element of the result is False if one was
+        found, and the caller should use NumPy's reductions instead.
+
+        Args:
+            values: 1-D array of sample values (non-empty)
+
+        Returns:
+            Tuple of (min, max, mean, std, all_finite)
+        """
+        lo = np.inf
+        hi = -np.inf
+        mean = 0.0
+        m2 = 0.0
+        for i in range(values.shape[0]):
+            v = float(values[i])
+            if not np.isfinite(v):
+                return 0.0, 0.0, 0.0, 0.0, False
+            if v < lo:
+                lo = v
+            if v > hi:
+                hi = v
+            delta = v - mean
+            mean += delta / (i + 1)
+            m2 += delta * (v - mean)
+        return lo, hi, mean, np.sqrt(m2 / values.shape[0]), True
+
+    @njit(cache=True)
+    def fill_constant(out, start, value):
+        """
+        Fill an (N, 2) signal with times start, start + 1, ... and a constant value.
+
+        Writes each row once, instead of one strided pass per column.
+
+        Args:
+            out: (N, 2) array to fill
+            start: Time of the first sample
+            value: Signal value
+
+        Returns:
+            np.ndarray: out
+        """
+        for i in range(out.shape[0]):
+            out[i, 0] = start + i
+            out[i, 1] = value
+        return out
+
+    @njit(cache=True)
+    def fill_step(out, initial_value, final_value, step_time):
+        """
+        Fill an (N, 2) signal with times 0, 1, ... and a step at step_time.
+
+        Args:
+            out: (N, 2) array to fill
+            initial_value: Value before step_time
+            final_value: Value from step_time on
+            step_time: Time of the step change
+
+        Returns:
+            np.ndarray: out
+        """
+        for i in range(out.shape[0]):
+            out[i, 0] = i
+            out[i, 1] = initial_value if i < step_time else final_value
+        return out
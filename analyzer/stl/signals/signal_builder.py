@@ -2,11 +2,72 @@
 Signal builder for creating custom time-series signals.
 
 Provides utilities for building and manipulating time-series signals
-for STL monitoring.
+for STL monitoring. Signals are built and returned as (N, 2) arrays of
+(time, value) rows; list-of-tuples inputs are still accepted.
 """
 
-from typing import List, Tuple, Callable
-import math
+from typing import Callable
+import numpy as np
+from ..core.robustness import RobustnessConfig, Signal, as_signal_array
+from ._kernels import NUMBA_AVAILABLE, KERNEL_MIN_SAMPLES
+if NUMBA_AVAILABLE:
+    from ._kernels import (
+        moving_average as _moving_average_kernel, value_range, fill_constant, fill_step
+    )
+
+
+def _make_signal(times: np.ndarray, values) -> np.ndarray:
+    """Stack a time column and a value column (or scalar) into an (N, 2) signal."""
+    signal = np.empty((times.shape[0], 2), dtype=RobustnessConfig.dtype())
+    signal[:, 0] = times
+    signal[:, 1] = values
+    return signal
+
+
+def _map_values(func: Callable, *columns: np.ndarray) -> np.ndarray:
+    """
+    Apply func to value columns, elementwise.
+
+    func is first called on the whole columns, which is a single vectorized
+    call for arithmetic lambdas and NumPy ufuncs. Functions that only accept
+    scalars (e.g. math.sqrt, builtin max) are applied per sample instead.
+    """
+    n = columns[0].shape[0]
+    try:
+        result = func(*columns)
+        if isinstance(result, np.ndarray) and result.shape == (n,):
+            return result
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter(map(func, *(c.tolist() for c in columns)), dtype=np.float64, count=n)
+
+
+def _moving_average_numpy(values: np.ndarray, half: int) -> np.ndarray:
+    """
+    Centered moving average from cumulative sums.
+
+    Finite samples are summed; NaN and +/-inf samples are counted separately
+    so that, as with a direct sum, they only affect the windows containing them.
+    """
+    n = values.shape[0]
+    index = np.arange(n)
+    start_idx = np.maximum(index - half, 0)
+    end_idx = np.minimum(index + half + 1, n)
+
+    def window_totals(column):
+        cumsum = np.concatenate(([0], np.cumsum(column)))
+        return cumsum[end_idx] - cumsum[start_idx]
+
+    finite = np.isfinite(values)
+    averages = window_totals(np.where(finite, values, 0.0).astype(np.float64)) / (end_idx - start_idx)
+    if not finite.all():
+        has_nan = window_totals(np.isnan(values)) > 0
+        has_pos_inf = window_totals(values == np.inf) > 0
+        has_neg_inf = window_totals(values == -np.inf) > 0
+        averages[has_pos_inf] = np.inf
+        averages[has_neg_inf] = -np.inf
+        averages[has_nan | (has_pos_inf & has_neg_inf)] = np.nan
+    return averages
 
 
 class SignalBuilder:
@@ -19,7 +80,7 @@ class SignalBuilder:
         value: float,
         duration: int,
         start_time: int = 0
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Create a constant signal.
 
@@ -29,9 +90,11 @@ class SignalBuilder:
             start_time: Start time (default: 0)
 
         Returns:
-            List of (time, value) tuples
+            (N, 2) array of (time, value) rows
         """
-        return [(float(t), value) for t in range(start_time, start_time + duration)]
+        if NUMBA_AVAILABLE and duration >= KERNEL_MIN_SAMPLES:
+            return fill_constant(np.empty((duration, 2), dtype=RobustnessConfig.dtype()), start_time, value)
+        return _make_signal(np.arange(start_time, start_time + max(duration, 0)), value)
 
     @staticmethod
     def step_signal(
@@ -39,7 +102,7 @@ class SignalBuilder:
         final_value: float,
         step_time: int,
         duration: int
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Create a step signal (changes value at step_time).
 
@@ -50,12 +113,13 @@ class SignalBuilder:
             duration: Total duration
 
         Returns:
-            List of (time, value) tuples
+            (N, 2) array of (time, value) rows
         """
-        signal = []
-        for t in range(duration):
-            value = initial_value if t < step_time else final_value
-            signal.append((float(t), value))
+        if NUMBA_AVAILABLE and duration >= KERNEL_MIN_SAMPLES:
+            signal = np.empty((duration, 2), dtype=RobustnessConfig.dtype())
+            return fill_step(signal, initial_value, final_value, step_time)
+        signal = _make_signal(np.arange(max(duration, 0)), final_value)
+        signal[:max(step_time, 0), 1] = initial_value
         return signal
 
     @staticmethod
@@ -63,7 +127,7 @@ class SignalBuilder:
         start_value: float,
         end_value: float,
         duration: int
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Create a linearly increasing/decreasing signal.
 
@@ -73,53 +137,56 @@ class SignalBuilder:
             duration: Signal duration
 
         Returns:
-            List of (time, value) tuples
+            (N, 2) array of (time, value) rows
         """
         if duration <= 1:
-            return [(0.0, start_value)]
+            return _make_signal(np.zeros(1), start_value)
 
-        slope = (end_value - start_value) / (duration - 1)
-        return [
-            (float(t), start_value + slope * t)
-            for t in range(duration)
-        ]
+        return _make_signal(np.arange(duration), np.linspace(start_value, end_value, duration))
 
     @staticmethod
     def combine_signals(
-        signal1: List[Tuple[float, float]],
-        signal2: List[Tuple[float, float]],
+        signal1: Signal,
+        signal2: Signal,
         operation: Callable[[float, float], float]
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Combine two signals using a binary operation.
 
+        The operation is called once on the two value columns, so NumPy ufuncs
+        (np.add, np.minimum, ...) and arithmetic lambdas run as a single
+        vectorized call. Scalar-only callables still work but are applied
+        sample by sample.
+
         Args:
             signal1: First signal
             signal2: Second signal
-            operation: Binary operation (e.g., lambda x, y: x + y)
+            operation: Binary operation (e.g., np.minimum or lambda x, y: x + y)
 
         Returns:
-            Combined signal
+            Combined signal, on the time grid of signal1
 
         Raises:
             ValueError: If signals have different lengths
         """
-        if len(signal1) != len(signal2):
+        signal1 = as_signal_array(signal1)
+        signal2 = as_signal_array(signal2)
+        if signal1.shape[0] != signal2.shape[0]:
             raise ValueError("Signals must have the same length")
 
-        return [
-            (t1, operation(v1, v2))
-            for (t1, v1), (t2, v2) in zip(signal1, signal2)
-        ]
+        return _make_signal(signal1[:, 0], _map_values(operation, signal1[:, 1], signal2[:, 1]))
 
     @staticmethod
     def apply_function(
-        signal: List[Tuple[float, float]],
+        signal: Signal,
         func: Callable[[float], float]
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Apply a unary function to signal values.
 
+        As in combine_signals(), ufuncs and array-aware functions are applied
+        to the whole value column at once.
+
         Args:
             signal: Input signal
             func: Unary function to apply
@@ -127,13 +194,14 @@ class SignalBuilder:
         Returns:
             Transformed signal
         """
-        return [(t, func(v)) for t, v in signal]
+        signal = as_signal_array(signal)
+        return _make_signal(signal[:, 0], _map_values(func, signal[:, 1]))
 
     @staticmethod
     def resample_signal(
-        signal: List[Tuple[float, float]],
+        signal: Signal,
         new_duration: int
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Resample signal to a different duration (simple nearest-neighbor).
 
@@ -144,29 +212,23 @@ class SignalBuilder:
         Returns:
             Resampled signal
         """
-        if not signal:
-            return []
-
-        old_duration = len(signal)
-        if old_duration == new_duration:
+        signal = as_signal_array(signal)
+        old_duration = signal.shape[0]
+        if old_duration == 0 or old_duration == new_duration:
             return signal
 
         scale = old_duration / new_duration
+        times = np.arange(new_duration)
+        old_index = np.minimum((times * scale).astype(np.int64), old_duration - 1)
 
-        resampled = []
-        for t in range(new_duration):
-            old_index = int(t * scale)
-            old_index = min(old_index, old_duration - 1)
-            resampled.append((float(t), signal[old_index][1]))
-
-        return resampled
+        return _make_signal(times, signal[old_index, 1])
 
     @staticmethod
     def normalize_signal(
-        signal: List[Tuple[float, float]],
+        signal: Signal,
         min_val: float = 0.0,
         max_val: float = 1.0
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Normalize signal values to [min_val, max_val] range.
 
@@ -178,35 +240,41 @@ class SignalBuilder:
         Returns:
             Normalized signal
         """
-        if not signal:
-            return []
+        signal = as_signal_array(signal)
+        if signal.shape[0] == 0:
+            return signal
 
-        values = [v for _, v in signal]
-        signal_min = min(values)
-        signal_max = max(values)
+        values = signal[:, 1]
+        if NUMBA_AVAILABLE:
+            signal_min, signal_max = value_range(values)
+        else:
+            signal_min, signal_max = values.min(), values.max()
 
         if signal_max == signal_min:
             # Constant signal
-            mid_val = (min_val + max_val) / 2
-            return [(t, mid_val) for t, _ in signal]
-
-        # Normalize to [min_val, max_val]
-        normalized = []
-        for t, v in signal:
-            norm_v = (v - signal_min) / (signal_max - signal_min)
-            norm_v = min_val + norm_v * (max_val - min_val)
-            normalized.append((t, norm_v))
-
+            return _make_signal(signal[:, 0], (min_val + max_val) / 2)
+
+        # Normalize to [min_val, max_val] as one affine map, applied in
+        # place in the output column (no temporaries)
+        normalized = _make_signal(signal[:, 0], values)
+        column = normalized[:, 1]
+        column -= signal_min
+        column *= (max_val - min_val) / (signal_max - signal_min)
+        column += min_val
         return normalized
 
     @staticmethod
     def moving_average(
-        signal: List[Tuple[float, float]],
+        signal: Signal,
         window_size: int
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Apply moving average filter to signal.
 
+        The window is centered on each sample and truncated at the signal
+        edges. Window sums are updated incrementally (numba) or taken from
+        cumulative sums (NumPy), so the cost does not grow with window_size.
+
         Args:
             signal: Input signal
             window_size: Size of averaging window
@@ -214,18 +282,13 @@ class SignalBuilder:
         Returns:
             Smoothed signal
         """
-        if window_size <= 1 or not signal:
+        signal = as_signal_array(signal)
+        if window_size <= 1 or signal.shape[0] == 0:
             return signal
 
-        smoothed = []
-        for i, (t, _) in enumerate(signal):
-            # Compute average over window
-            start_idx = max(0, i - window_size // 2)
-            end_idx = min(len(signal), i + window_size // 2 + 1)
-
-            window_values = [signal[j][1] for j in range(start_idx, end_idx)]
-            avg_value = sum(window_values) / len(window_values)
-
-            smoothed.append((t, avg_value))
+        if NUMBA_AVAILABLE:
+            averages = _moving_average_kernel(signal[:, 1], window_size // 2)
+        else:
+            averages = _moving_average_numpy(signal[:, 1], window_size // 2)
 
-        return smoothed
+        return _make_signal(signal[:, 0], averages)
@@ -5,8 +5,26 @@ Converts the statistics dictionary from accelerator.get_statistics()
 into time-series signals suitable for STL monitoring.
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import AbstractSet, Dict, FrozenSet, List, Tuple, Optional
+import sys
+import numpy as np
+from ..core.robustness import RobustnessConfig, Signal, as_signal_array
 from ..utils.logger import get_logger
+from ._kernels import NUMBA_AVAILABLE, KERNEL_MIN_SAMPLES
+if NUMBA_AVAILABLE:
+    from ._kernels import value_stats, fill_constant
+
+
+# Accelerator-level signals, each a constant of the statistics entry of the same name
+_GLOBAL_SIGNALS = (
+    'latency', 'energy', 'edp_latency', 'edp_cycles', 'area',
+    'avg_throughput', 'min_utilization', 'max_utilization'
+)
+
+# Per-component signal name suffixes
+_COMPUTE_SUFFIXES = ('_utilization', '_throughput', '_idle_ratio')
+_MEMORY_SUFFIXES = ('_hit_rate', '_miss_rate', '_bandwidth')
+_DRAM_SUFFIXES = ('_hit_rate', '_accesses')
 
 
 class SignalExtractor:
@@ -22,29 +40,99 @@ class SignalExtractor:
     Future enhancement: Hook into the event scheduler to capture per-cycle values.
     """
 
-    def __init__(self, hw_arch=None):
+    __slots__ = ('hw_arch', 'dtype', '_cache', '_signal_keys')
+
+    def __init__(self, hw_arch=None, dtype=None):
         """
         Initialize signal extractor.
 
         Args:
             hw_arch: Optional hardware accelerator instance (for accessing real-time data)
+            dtype: Optional NumPy dtype of the signals (default: RobustnessConfig.dtype())
         """
         self.hw_arch = hw_arch
+        self.dtype = dtype
+        # Signals of the most recently extracted statistics dictionary, as
+        # (stats_dict, cache key, signals); holding the dict keeps its id unique
+        self._cache: Optional[Tuple[Dict, tuple, Dict[str, Signal]]] = None
+        # Interned signal names per (component name, suffixes), formatted once
+        self._signal_keys: Dict[Tuple[str, tuple], Tuple[str, ...]] = {}
+
+    def _keys(self, name: str, suffixes: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Signal names of one component, formatted and interned on first use."""
+        keys = self._signal_keys.get((name, suffixes))
+        if keys is None:
+            keys = tuple(sys.intern(name + suffix) for suffix in suffixes)
+            self._signal_keys[(name, suffixes)] = keys
+        return keys
+
+    def clear_cache(self):
+        """Drop the cached signals (e.g. after modifying a statistics dictionary in place)."""
+        self._cache = None
 
     def extract_signals(
         self,
         stats_dict: Dict
-    ) -> Dict[str, List[Tuple[float, float]]]:
+    ) -> Dict[str, Signal]:
         """
         Extract all available signals from statistics dictionary.
 
+        Extracting the same dictionary object again (e.g. evaluate() followed
+        by validate_specifications() in a report) reuses the signals built
+        the first time. The cache is keyed by the dictionary's identity and
+        its global_cycles; call clear_cache() after changing other entries
+        of a dictionary in place.
+
         Args:
             stats_dict: Statistics dictionary from accelerator.get_statistics()
 
         Returns:
-            Dictionary mapping signal names to time-series data [(time, value), ...]
+            Dictionary mapping signal names to (N, 2) arrays of (time, value) rows
+        """
+        dtype = self.dtype if self.dtype is not None else RobustnessConfig.dtype()
+        cache_key = (id(stats_dict), stats_dict.get('global_cycles'), np.dtype(dtype).str)
+        if self._cache is not None and self._cache[0] is stats_dict and self._cache[1] == cache_key:
+            return dict(self._cache[2])
+
+        signals = self._build_signals(stats_dict)
+        self._cache = (stats_dict, cache_key, signals)
+        return dict(signals)
+
+    def extract_signals_filtered(
+        self,
+        stats_dict: Dict,
+        wanted: AbstractSet[str]
+    ) -> Dict[str, Signal]:
         """
+        Extract only the signals whose names are in wanted.
+
+        Signals that are not wanted are never built, so monitoring a few
+        global metrics of a large accelerator does not materialize every
+        per-component signal. Wanted names that are not available are simply
+        absent from the result.
+
+        Args:
+            stats_dict: Statistics dictionary from accelerator.get_statistics()
+            wanted: Set of signal names to extract
+
+        Returns:
+            Dictionary mapping the wanted, available signal names to signals
+        """
+        if self._cache is not None and self._cache[0] is stats_dict:
+            dtype = self.dtype if self.dtype is not None else RobustnessConfig.dtype()
+            if self._cache[1] == (id(stats_dict), stats_dict.get('global_cycles'), np.dtype(dtype).str):
+                return {name: signal for name, signal in self._cache[2].items() if name in wanted}
+
+        return self._build_signals(stats_dict, wanted)
+
+    def _build_signals(
+        self,
+        stats_dict: Dict,
+        wanted: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Signal]:
+        """Build the signals of a statistics dictionary (uncached), optionally only the wanted ones."""
         logger = get_logger()
+        trace_enabled = logger.is_trace_enabled()
 
         logger.debug("Extracting signals from statistics dictionary")
 
@@ -52,135 +140,137 @@ class SignalExtractor:
 
         # Extract global metrics
         logger.trace("  Extracting global signals...")
-        global_signals = self._extract_global_signals(stats_dict)
+        global_signals = self._extract_global_signals(stats_dict, wanted)
         signals.update(global_signals)
-        logger.trace(f"    Extracted {len(global_signals)} global signals")
+        if trace_enabled:
+            logger.trace(f"    Extracted {len(global_signals)} global signals")
 
         # Extract per-component signals
         logger.trace("  Extracting compute signals...")
-        compute_signals = self._extract_compute_signals(stats_dict)
+        compute_signals = self._extract_compute_signals(stats_dict, wanted)
         signals.update(compute_signals)
-        logger.trace(f"    Extracted {len(compute_signals)} compute signals")
+        if trace_enabled:
+            logger.trace(f"    Extracted {len(compute_signals)} compute signals")
 
         logger.trace("  Extracting memory signals...")
-        memory_signals = self._extract_memory_signals(stats_dict)
+        memory_signals = self._extract_memory_signals(stats_dict, wanted)
         signals.update(memory_signals)
-        logger.trace(f"    Extracted {len(memory_signals)} memory signals")
+        if trace_enabled:
+            logger.trace(f"    Extracted {len(memory_signals)} memory signals")
 
-        logger.debug(f"  Total signals extracted: {len(signals)}")
+        if logger.is_debug_enabled():
+            logger.debug(f"  Total signals extracted: {len(signals)}")
 
         return signals
 
     def _extract_global_signals(
         self,
-        stats_dict: Dict
-    ) -> Dict[str, List[Tuple[float, float]]]:
+        stats_dict: Dict,
+        wanted: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Signal]:
         """Extract global accelerator-level signals."""
         signals = {}
         duration = stats_dict.get('global_cycles', 1)
 
         # Global performance metrics (as constant signals)
-        signals['latency'] = self._scalar_to_signal(
-            stats_dict.get('latency', 0), duration
-        )
-        signals['energy'] = self._scalar_to_signal(
-            stats_dict.get('energy', 0), duration
-        )
-        signals['edp_latency'] = self._scalar_to_signal(
-            stats_dict.get('edp_latency', 0), duration
-        )
-        signals['edp_cycles'] = self._scalar_to_signal(
-            stats_dict.get('edp_cycles', 0), duration
-        )
-        signals['area'] = self._scalar_to_signal(
-            stats_dict.get('area', 0), duration
-        )
-        signals['avg_throughput'] = self._scalar_to_signal(
-            stats_dict.get('avg_throughput', 0), duration
-        )
-        signals['min_utilization'] = self._scalar_to_signal(
-            stats_dict.get('min_utilization', 0), duration
-        )
-        signals['max_utilization'] = self._scalar_to_signal(
-            stats_dict.get('max_utilization', 0), duration
-        )
+        get = stats_dict.get
+        for name in _GLOBAL_SIGNALS:
+            if wanted is None or name in wanted:
+                signals[name] = self._scalar_to_signal(get(name, 0), duration)
 
         return signals
 
     def _extract_compute_signals(
         self,
-        stats_dict: Dict
-    ) -> Dict[str, List[Tuple[float, float]]]:
+        stats_dict: Dict,
+        wanted: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Signal]:
         """Extract per-compute-block signals."""
         signals = {}
         duration = stats_dict.get('global_cycles', 1)
 
         compute_stats = stats_dict.get('compute_stats', [])
 
+        to_signal = self._scalar_to_signal
         for comp_stat in compute_stats:
-            name = comp_stat.get('name', 'unknown')
+            get = comp_stat.get
+            utilization_key, throughput_key, idle_ratio_key = self._keys(
+                get('name', 'unknown'), _COMPUTE_SUFFIXES
+            )
 
             # Utilization
-            signals[f'{name}_utilization'] = self._scalar_to_signal(
-                comp_stat.get('utilization', 0), duration
-            )
+            if wanted is None or utilization_key in wanted:
+                signals[utilization_key] = to_signal(
+                    get('utilization', 0), duration
+                )
 
             # Throughput
-            signals[f'{name}_throughput'] = self._scalar_to_signal(
-                comp_stat.get('throughput', 0), duration
-            )
+            if wanted is None or throughput_key in wanted:
+                signals[throughput_key] = to_signal(
+                    get('throughput', 0), duration
+                )
 
             # Idle cycles ratio
-            idle_cycles = comp_stat.get('idle_cycles', 0)
-            computational_cycles = comp_stat.get('computational_cycles', 0)
-            total_cycles = idle_cycles + computational_cycles
-            idle_ratio = idle_cycles / total_cycles if total_cycles > 0 else 0
-            signals[f'{name}_idle_ratio'] = self._scalar_to_signal(
-                idle_ratio, duration
-            )
+            if wanted is None or idle_ratio_key in wanted:
+                idle_cycles = get('idle_cycles', 0)
+                computational_cycles = get('computational_cycles', 0)
+                total_cycles = idle_cycles + computational_cycles
+                idle_ratio = idle_cycles / total_cycles if total_cycles > 0 else 0
+                signals[idle_ratio_key] = to_signal(
+                    idle_ratio, duration
+                )
 
         return signals
 
     def _extract_memory_signals(
         self,
-        stats_dict: Dict
-    ) -> Dict[str, List[Tuple[float, float]]]:
+        stats_dict: Dict,
+        wanted: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Signal]:
         """Extract per-memory-block signals."""
         signals = {}
         duration = stats_dict.get('global_cycles', 1)
 
         # On-chip memories
+        to_signal = self._scalar_to_signal
         memory_stats = stats_dict.get('memory_stats', [])
         for mem_stat in memory_stats:
-            name = mem_stat.get('name', 'unknown')
+            get = mem_stat.get
+            hit_rate_key, miss_rate_key, bandwidth_key = self._keys(
+                get('name', 'unknown'), _MEMORY_SUFFIXES
+            )
 
             # Hit rate
-            signals[f'{name}_hit_rate'] = self._scalar_to_signal(
-                mem_stat.get('hit_rate', 0), duration
-            )
+            if wanted is None or hit_rate_key in wanted:
+                signals[hit_rate_key] = to_signal(
+                    get('hit_rate', 0), duration
+                )
 
             # Miss rate
-            signals[f'{name}_miss_rate'] = self._scalar_to_signal(
-                mem_stat.get('miss_rate', 0), duration
-            )
+            if wanted is None or miss_rate_key in wanted:
+                signals[miss_rate_key] = to_signal(
+                    get('miss_rate', 0), duration
+                )
 
             # Bandwidth utilization (if available)
-            if 'bandwidth_per_port' in mem_stat:
-                signals[f'{name}_bandwidth'] = self._scalar_to_signal(
-                    mem_stat.get('bandwidth_per_port', 0), duration
+            if 'bandwidth_per_port' in mem_stat and (wanted is None or bandwidth_key in wanted):
+                signals[bandwidth_key] = to_signal(
+                    get('bandwidth_per_port', 0), duration
                 )
 
         # DRAM statistics
         dram_stats = stats_dict.get('dram_stats', {})
         if dram_stats:
-            dram_name = dram_stats.get('name', 'dram')
+            hit_rate_key, accesses_key = self._keys(dram_stats.get('name', 'dram'), _DRAM_SUFFIXES)
 
-            signals[f'{dram_name}_hit_rate'] = self._scalar_to_signal(
-                dram_stats.get('hit_rate', 0), duration
-            )
-            signals[f'{dram_name}_accesses'] = self._scalar_to_signal(
-                dram_stats.get('accesses', 0), duration
-            )
+            if wanted is None or hit_rate_key in wanted:
+                signals[hit_rate_key] = self._scalar_to_signal(
+                    dram_stats.get('hit_rate', 0), duration
+                )
+            if wanted is None or accesses_key in wanted:
+                signals[accesses_key] = self._scalar_to_signal(
+                    dram_stats.get('accesses', 0), duration
+                )
 
         return signals
 
@@ -188,7 +278,7 @@ class SignalExtractor:
         self,
         value: float,
         duration: int
-    ) -> List[Tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Convert a scalar value to a constant time-series signal.
 
@@ -197,17 +287,24 @@ class SignalExtractor:
             duration: Signal duration (number of time steps)
 
         Returns:
-            List of (time, value) tuples representing constant signal
+            (N, 2) array of (time, value) rows representing constant signal
         """
         # Create constant signal over duration
         # Sample at regular intervals (every cycle for now)
-        return [(float(t), value) for t in range(int(duration))]
+        dtype = self.dtype if self.dtype is not None else RobustnessConfig.dtype()
+        signal = np.empty((max(int(duration), 0), 2), dtype=dtype)
+        if NUMBA_AVAILABLE and signal.shape[0] >= KERNEL_MIN_SAMPLES:
+            # One sequential pass over the rows instead of two strided column fills
+            return fill_constant(signal, 0, value)
+        signal[:, 0] = np.arange(signal.shape[0])
+        signal[:, 1] = value
+        return signal
 
     def extract_signal_subset(
         self,
         stats_dict: Dict,
         signal_names: List[str]
-    ) -> Dict[str, List[Tuple[float, float]]]:
+    ) -> Dict[str, Signal]:
         """
         Extract only specified signals.
 
@@ -234,6 +331,37 @@ class SignalExtractor:
 
         return subset
 
+    def get_available_signal_names(self, stats_dict: Dict) -> FrozenSet[str]:
+        """
+        Names of all signals available from statistics, without building them.
+
+        Uses the cached signals if this dictionary was just extracted;
+        otherwise only the component lists are scanned.
+
+        Args:
+            stats_dict: Statistics dictionary
+
+        Returns:
+            Frozen set of signal names
+        """
+        if self._cache is not None and self._cache[0] is stats_dict:
+            return frozenset(self._cache[2])
+
+        names = set(_GLOBAL_SIGNALS)
+
+        for comp_stat in stats_dict.get('compute_stats', []):
+            names.update(self._keys(comp_stat.get('name', 'unknown'), _COMPUTE_SUFFIXES))
+
+        for mem_stat in stats_dict.get('memory_stats', []):
+            keys = self._keys(mem_stat.get('name', 'unknown'), _MEMORY_SUFFIXES)
+            names.update(keys if 'bandwidth_per_port' in mem_stat else keys[:2])
+
+        dram_stats = stats_dict.get('dram_stats', {})
+        if dram_stats:
+            names.update(self._keys(dram_stats.get('name', 'dram'), _DRAM_SUFFIXES))
+
+        return frozenset(names)
+
     def get_available_signals(self, stats_dict: Dict) -> List[str]:
         """
         Get list of all available signal names from statistics.
@@ -249,29 +377,31 @@ class SignalExtractor:
 
     def signal_statistics(
         self,
-        signal: List[Tuple[float, float]]
+        signal: Signal
     ) -> Dict[str, float]:
         """
         Compute basic statistics for a signal.
 
         Args:
-            signal: Time-series signal [(time, value), ...]
+            signal: Time-series signal ((N, 2) array or [(time, value), ...])
 
         Returns:
             Dictionary with min, max, mean, std statistics
         """
-        if not signal:
-            return {'min': 0, 'max': 0, 'mean': 0, 'std': 0}
+        values = as_signal_array(signal)[:, 1]
 
-        values = [v for _, v in signal]
+        if values.size == 0:
+            return {'min': 0, 'max': 0, 'mean': 0, 'std': 0}
 
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        std = variance ** 0.5
+        if NUMBA_AVAILABLE:
+            # One pass instead of four; non-finite samples use NumPy below
+            lo, hi, mean, std, all_finite = value_stats(values)
+            if all_finite:
+                return {'min': lo, 'max': hi, 'mean': mean, 'std': std}
 
         return {
-            'min': min(values),
-            'max': max(values),
-            'mean': mean,
-            'std': std
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'mean': float(values.mean()),
+            'std': float(values.std())
         }
@@ -0,0 +1,59 @@
+"""
+Numba-compiled kernels for debugging utilities.
+
+numba is an optional dependency. When it is not installed, NUMBA_AVAILABLE
+is False and debug.py uses its NumPy implementation.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # 'nnan'/'ninf' are deliberately left out so inf/nan samples keep IEEE semantics
+    @njit(cache=True, nogil=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def signal_summary(signal):
+        """
+        Time range, value range and value mean of an (N, 2) signal in one pass.
+
+        Like NumPy's min()/max()/mean(), a NaN in a column makes that
+        column's results NaN.
+
+        Args:
+            signal: (N, 2) float64 array of (time, value) rows (non-empty)
+
+        Returns:
+            Tuple of (time_min, time_max, value_min, value_max, value_mean)
+        """
+        t_min = signal[0, 0]
+        t_max = signal[0, 0]
+        v_min = signal[0, 1]
+        v_max = signal[0, 1]
+        v_sum = 0.0
+        t_nan = False
+        v_nan = False
+        for i in range(signal.shape[0]):
+            t = signal[i, 0]
+            v = signal[i, 1]
+            if t != t:
+                t_nan = True
+            if v != v:
+                v_nan = True
+            t_min = min(t_min, t)
+            t_max = max(t_max, t)
+            v_min = min(v_min, v)
+            v_max = max(v_max, v)
+            v_sum += v
+        if t_nan:
+            t_min = np.nan
+            t_max = np.nan
+        if v_nan:
+            v_min = np.nan
+            v_max = np.nan
+        return t_min, t_max, v_min, v_max, v_sum / signal.shape[0]
@@ -5,9 +5,49 @@ Provides tools for inspecting STL specifications, signals,
 and identifying issues in constraint evaluation.
 """
 
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
+from collections import deque
+import functools
 import traceback
+import numpy as np
 from .logger import get_logger
+from ._kernels import NUMBA_AVAILABLE
+if NUMBA_AVAILABLE:
+    from ._kernels import signal_summary
+
+
+# Sentinel for signal lookups (a signal may legitimately be None, i.e. malformed)
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=512)
+def _specification_issues(
+    formula: str,
+    has_signals: bool,
+    needs_parse: bool
+) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Validity flag and issues of a specification, cached on its immutable fields.
+
+    Args:
+        formula: STL formula string
+        has_signals: Whether the specification names any signals
+        needs_parse: Whether the specification is still unparsed
+
+    Returns:
+        Tuple of (is_valid, issues)
+    """
+    issues = []
+    is_valid = True
+    if not formula:
+        issues.append("Formula is empty")
+        is_valid = False
+    if not has_signals:
+        issues.append("No signal names specified")
+        is_valid = False
+    if needs_parse:
+        issues.append("Specification not parsed (call parse() or evaluate())")
+    return is_valid, tuple(issues)
 
 
 class STLDebugger:
@@ -21,27 +61,36 @@ class STLDebugger:
     - Constraint evaluation
     """
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, max_records: Optional[int] = None):
         """
         Initialize debugger.
 
         Args:
             verbose: Enable verbose output
+            max_records: Keep only the most recent max_records errors and
+                         warnings each (default: None, keep all). Totals are
+                         still counted in num_errors/num_warnings.
         """
         self.verbose = verbose
         self.logger = get_logger()
-        self.errors = []
-        self.warnings = []
+        self.max_records = max_records
+        self.clear()
 
     def clear(self):
         """Clear accumulated errors and warnings."""
-        self.errors = []
-        self.warnings = []
+        self.errors = deque(maxlen=self.max_records)
+        self.warnings = deque(maxlen=self.max_records)
+        self.num_errors = 0
+        self.num_warnings = 0
 
     def add_error(self, message: str, context: Optional[Dict] = None):
         """
         Record an error with context.
 
+        The call stack is only captured in verbose mode, as an unformatted
+        traceback.StackSummary (call .format() for the lines); otherwise the
+        error's 'traceback' is None.
+
         Args:
             message: Error message
             context: Additional context information
@@ -49,11 +98,12 @@ class STLDebugger:
         error = {
             'message': message,
             'context': context or {},
-            'traceback': traceback.format_stack()
+            'traceback': traceback.extract_stack() if self.verbose else None
         }
         self.errors.append(error)
+        self.num_errors += 1
         self.logger.error(message)
-        if context and self.verbose:
+        if context and self.verbose and self.logger.is_debug_enabled():
             self.logger.debug(f"  Context: {context}")
 
     def add_warning(self, message: str, context: Optional[Dict] = None):
@@ -69,8 +119,9 @@ class STLDebugger:
             'context': context or {}
         }
         self.warnings.append(warning)
+        self.num_warnings += 1
         self.logger.warning(message)
-        if context and self.verbose:
+        if context and self.verbose and self.logger.is_debug_enabled():
             self.logger.debug(f"  Context: {context}")
 
     def validate_specification(self, spec) -> Dict[str, Any]:
@@ -83,33 +134,23 @@ class STLDebugger:
         Returns:
             Validation report with issues found
         """
-        self.logger.debug(f"Validating specification: {spec.name}")
-
-        issues = []
-        is_valid = True
-
-        # Check formula
-        if not spec.formula:
-            issues.append("Formula is empty")
-            is_valid = False
-        else:
-            self.logger.trace(f"  Formula: {spec.formula}")
-
-        # Check signal names
-        if not spec.signal_names:
-            issues.append("No signal names specified")
-            is_valid = False
-        else:
-            self.logger.trace(f"  Signals: {spec.signal_names}")
-
-        # Check if parsed
-        if hasattr(spec, '_parsed') and not spec._parsed:
-            issues.append("Specification not parsed (call parse() or evaluate())")
+        if self.logger.is_debug_enabled():
+            self.logger.debug(f"Validating specification: {spec.name}")
+
+        needs_parse = hasattr(spec, '_parsed') and not spec._parsed
+        is_valid, issues = _specification_issues(spec.formula, bool(spec.signal_names), needs_parse)
+
+        if self.logger.is_trace_enabled():
+            if spec.formula:
+                self.logger.trace(f"  Formula: {spec.formula}")
+            if spec.signal_names:
+                self.logger.trace(f"  Signals: {spec.signal_names}")
+        if needs_parse:
             self.logger.debug("  Specification needs parsing")
 
         return {
             'valid': is_valid,
-            'issues': issues,
+            'issues': list(issues),
             'spec_name': spec.name,
             'formula': spec.formula,
             'signals': spec.signal_names
@@ -117,7 +158,7 @@ class STLDebugger:
 
     def validate_signals(
         self,
-        signals: Dict[str, List[Tuple[float, float]]],
+        signals: Dict[str, Union[np.ndarray, List[Tuple[float, float]]]],
         required_signals: List[str]
     ) -> Dict[str, Any]:
         """
@@ -135,20 +176,32 @@ class STLDebugger:
         issues = []
         missing_signals = []
         malformed_signals = []
+        trace_enabled = self.logger.is_trace_enabled()
 
-        # Check for missing signals
+        # Check for missing signals (one dict lookup per name)
         for sig_name in required_signals:
-            if sig_name not in signals:
+            signal = signals.get(sig_name, _MISSING)
+            if signal is _MISSING:
                 missing_signals.append(sig_name)
                 issues.append(f"Missing required signal: {sig_name}")
                 self.logger.error(f"  Missing signal: {sig_name}")
             else:
-                # Validate signal format
-                signal = signals[sig_name]
-
-                if not isinstance(signal, list):
+                # Validate signal format; extracted signals are arrays, so
+                # that case is checked first
+                if isinstance(signal, np.ndarray):
+                    if signal.ndim != 2 or signal.shape[1] != 2:
+                        malformed_signals.append(sig_name)
+                        issues.append(f"Signal {sig_name} array must have shape (N, 2)")
+                        self.logger.error(f"  Signal {sig_name} has wrong shape: {signal.shape}")
+                    elif signal.shape[0] == 0:
+                        malformed_signals.append(sig_name)
+                        issues.append(f"Signal {sig_name} is empty")
+                        self.logger.warning(f"  Signal {sig_name} is empty")
+                    elif trace_enabled:
+                        self.logger.trace(f"  Signal {sig_name}: {signal.shape[0]} points, first={tuple(signal[0])}")
+                elif not isinstance(signal, list):
                     malformed_signals.append(sig_name)
-                    issues.append(f"Signal {sig_name} is not a list")
+                    issues.append(f"Signal {sig_name} is not a list or array")
                     self.logger.error(f"  Signal {sig_name} has wrong type: {type(signal)}")
                 elif len(signal) == 0:
                     malformed_signals.append(sig_name)
@@ -161,7 +214,7 @@ class STLDebugger:
                         malformed_signals.append(sig_name)
                         issues.append(f"Signal {sig_name} elements not in (time, value) format")
                         self.logger.error(f"  Signal {sig_name} malformed: {first_elem}")
-                    else:
+                    elif trace_enabled:
                         self.logger.trace(f"  Signal {sig_name}: {len(signal)} points, first={first_elem}")
 
         return {
@@ -175,22 +228,24 @@ class STLDebugger:
 
     def inspect_signal(
         self,
-        signal: List[Tuple[float, float]],
+        signal: Union[np.ndarray, List[Tuple[float, float]]],
         name: str = "signal"
     ) -> Dict[str, Any]:
         """
         Inspect a signal and return detailed statistics.
 
         Args:
-            signal: Time-series signal
+            signal: Time-series signal, as an (N, 2) array (used without copying) or (time, value) list
             name: Signal name for reporting
 
         Returns:
             Dictionary with signal statistics
         """
-        self.logger.debug(f"Inspecting signal: {name}")
+        debug_enabled = self.logger.is_debug_enabled()
+        if debug_enabled:
+            self.logger.debug(f"Inspecting signal: {name}")
 
-        if not signal:
+        if len(signal) == 0:
             self.logger.error(f"  Signal {name} is empty!")
             return {
                 'name': name,
@@ -198,37 +253,106 @@ class STLDebugger:
                 'error': 'Signal is empty'
             }
 
-        times = [t for t, _ in signal]
-        values = [v for _, v in signal]
+        signal = np.ascontiguousarray(signal, dtype=np.float64).reshape(-1, 2)
+        if NUMBA_AVAILABLE:
+            time_min, time_max, value_min, value_max, value_mean = signal_summary(signal)
+        else:
+            times = signal[:, 0]
+            values = signal[:, 1]
+            time_min, time_max = times.min(), times.max()
+            value_min, value_max, value_mean = values.min(), values.max(), values.mean()
+        return self._report_signal_stats(
+            name, signal, time_min, time_max, value_min, value_max, value_mean, debug_enabled
+        )
+
+    def inspect_signals(
+        self,
+        signals: Dict[str, Union[np.ndarray, List[Tuple[float, float]]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Inspect several signals, as inspect_signal() does for each one.
+
+        Extracted signals all share one (N, 2) shape; those are stacked and
+        reduced together in one NumPy call per statistic. Other inputs are
+        inspected one by one.
+
+        Args:
+            signals: Dictionary mapping signal names to signals
+
+        Returns:
+            Dictionary mapping signal names to inspect_signal() statistics
+        """
+        arrays = list(signals.values())
+        shape = arrays[0].shape if arrays and isinstance(arrays[0], np.ndarray) else None
+        if (len(arrays) < 2 or shape is None or len(shape) != 2 or shape[0] == 0 or shape[1] != 2
+                or not all(isinstance(a, np.ndarray) and a.shape == shape for a in arrays)):
+            return {name: self.inspect_signal(signal, name) for name, signal in signals.items()}
+
+        stacked = np.stack(arrays).astype(np.float64, copy=False)
+        times = stacked[:, :, 0]
+        values = stacked[:, :, 1]
+        time_min, time_max = times.min(axis=1), times.max(axis=1)
+        value_min, value_max, value_mean = values.min(axis=1), values.max(axis=1), values.mean(axis=1)
+
+        debug_enabled = self.logger.is_debug_enabled()
+        all_stats = {}
+        for j, name in enumerate(signals):
+            if debug_enabled:
+                self.logger.debug(f"Inspecting signal: {name}")
+            all_stats[name] = self._report_signal_stats(
+                name, stacked[j], time_min[j], time_max[j],
+                value_min[j], value_max[j], value_mean[j], debug_enabled
+            )
+        return all_stats
+
+    def _report_signal_stats(
+        self,
+        name: str,
+        signal: np.ndarray,
+        time_min: float,
+        time_max: float,
+        value_min: float,
+        value_max: float,
+        value_mean: float,
+        debug_enabled: bool
+    ) -> Dict[str, Any]:
+        """Build the inspect_signal() statistics of a non-empty (N, 2) signal and log them."""
+        value_min = float(value_min)
+        value_max = float(value_max)
 
         stats = {
             'name': name,
             'empty': False,
             'length': len(signal),
-            'time_range': (min(times), max(times)),
-            'value_range': (min(values), max(values)),
-            'value_mean': sum(values) / len(values),
-            'constant': len(set(values)) == 1,
-            'first_point': signal[0],
-            'last_point': signal[-1]
+            'time_range': (float(time_min), float(time_max)),
+            'value_range': (value_min, value_max),
+            'value_mean': float(value_mean),
+            # Reuses the range instead of comparing every sample (NaN: not constant)
+            'constant': value_min == value_max,
+            'first_point': tuple(signal[0]),
+            'last_point': tuple(signal[-1])
         }
 
-        self.logger.trace(f"  Length: {stats['length']}")
-        self.logger.trace(f"  Time range: {stats['time_range']}")
-        self.logger.trace(f"  Value range: {stats['value_range']}")
-        self.logger.trace(f"  Mean: {stats['value_mean']:.6f}")
-        self.logger.trace(f"  Constant: {stats['constant']}")
+        if self.logger.is_trace_enabled():
+            self.logger.trace(f"  Length: {stats['length']}")
+            self.logger.trace(f"  Time range: {stats['time_range']}")
+            self.logger.trace(f"  Value range: {stats['value_range']}")
+            self.logger.trace(f"  Mean: {stats['value_mean']:.6f}")
+            self.logger.trace(f"  Constant: {stats['constant']}")
 
-        if stats['constant']:
-            self.logger.debug(f"  WARNING: Signal {name} is constant (all values = {values[0]})")
+        if stats['constant'] and debug_enabled:
+            self.logger.debug(f"  WARNING: Signal {name} is constant (all values = {signal[0, 1]})")
 
         return stats
 
     def diagnose_evaluation_failure(
         self,
         spec,
-        signals: Dict[str, List[Tuple[float, float]]],
-        error: Exception
+        signals: Dict[str, Union[np.ndarray, List[Tuple[float, float]]]],
+        error: Exception,
+        signal_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+        spec_validation: Optional[Dict[str, Any]] = None,
+        signal_validation: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Diagnose why an STL evaluation failed.
@@ -237,6 +361,13 @@ class STLDebugger:
             spec: STL specification that failed
             signals: Signals that were provided
             error: Exception that was raised
+            signal_stats: Optional cache of inspect_signal() results by signal
+                          name, filled in here; share one dict across failures
+                          on the same signals to inspect each signal once
+            spec_validation: validate_specification() result for spec, if
+                             already computed (skips re-validation)
+            signal_validation: validate_signals() result for spec's signals,
+                               if already computed (skips re-validation)
 
         Returns:
             Diagnostic report
@@ -252,26 +383,32 @@ class STLDebugger:
         }
 
         # Validate specification
-        spec_validation = self.validate_specification(spec)
+        if spec_validation is None:
+            spec_validation = self.validate_specification(spec)
         if not spec_validation['valid']:
             diagnosis['likely_causes'].append("Invalid specification")
             diagnosis['spec_issues'] = spec_validation['issues']
             self.logger.error("  Specification validation failed")
 
         # Validate signals
-        signal_validation = self.validate_signals(signals, spec.signal_names)
+        if signal_validation is None:
+            signal_validation = self.validate_signals(signals, spec.signal_names)
         if not signal_validation['valid']:
             diagnosis['likely_causes'].append("Missing or malformed signals")
             diagnosis['signal_issues'] = signal_validation['issues']
             self.logger.error("  Signal validation failed")
 
         # Inspect each required signal
-        signal_stats = {}
+        if signal_stats is None:
+            signal_stats = {}
+        spec_signal_stats = {}
         for sig_name in spec.signal_names:
             if sig_name in signals:
-                signal_stats[sig_name] = self.inspect_signal(signals[sig_name], sig_name)
+                if sig_name not in signal_stats:
+                    signal_stats[sig_name] = self.inspect_signal(signals[sig_name], sig_name)
+                spec_signal_stats[sig_name] = signal_stats[sig_name]
 
-        diagnosis['signal_stats'] = signal_stats
+        diagnosis['signal_stats'] = spec_signal_stats
 
         # Error-specific diagnosis
         error_msg = str(error).lower()
@@ -310,29 +447,30 @@ class STLDebugger:
         """Print summary of all errors and warnings."""
         self.logger.section("Debug Summary")
 
-        print(f"Total Errors: {len(self.errors)}")
-        print(f"Total Warnings: {len(self.warnings)}")
+        print(f"Total Errors: {self.num_errors}")
+        print(f"Total Warnings: {self.num_warnings}")
         print()
 
         if self.errors:
-            print("ERRORS:")
-            for i, error in enumerate(self.errors, 1):
+            print("ERRORS:" if len(self.errors) == self.num_errors else f"ERRORS (last {len(self.errors)}):")
+            for i, error in enumerate(self.errors, self.num_errors - len(self.errors) + 1):
                 print(f"{i}. {error['message']}")
                 if error['context']:
                     print(f"   Context: {error['context']}")
             print()
 
         if self.warnings:
-            print("WARNINGS:")
-            for i, warning in enumerate(self.warnings, 1):
+            print("WARNINGS:" if len(self.warnings) == self.num_warnings else f"WARNINGS (last {len(self.warnings)}):")
+            for i, warning in enumerate(self.warnings, self.num_warnings - len(self.warnings) + 1):
                 print(f"{i}. {warning['message']}")
                 if warning['context']:
                     print(f"   Context: {warning['context']}")
             print()
 
 
-# Global debugger instance
-_global_debugger = STLDebugger(verbose=False)
+# Global debugger instance; long sweeps record errors for every failed
+# configuration, so only the most recent ones are kept
+_global_debugger = STLDebugger(verbose=False, max_records=1000)
 
 
 def get_debugger() -> STLDebugger:
@@ -6,11 +6,18 @@ in STL constraint evaluation and DSE.
 """
 
 from typing import Dict, List, Any
+import itertools
 from ..core.specification import STLSpecification
+from ..signals.signal_extractor import SignalExtractor
 from .debug import get_debugger
 from .logger import get_logger
 
 
+# Shared by check_signal_availability() calls; holds no per-call state
+# besides its single-entry extraction cache
+_EXTRACTOR = SignalExtractor()
+
+
 def diagnose_monitor_failure(
     monitor,
     stats_dict: Dict,
@@ -47,7 +54,8 @@ def diagnose_monitor_failure(
 
         if verbose:
             logger.info(f"Extracted {len(signals)} signals")
-            logger.debug(f"  Available signals: {', '.join(list(signals.keys())[:10])}...")
+            if logger.is_debug_enabled():
+                logger.debug(f"  Available signals: {', '.join(report['available_signals'][:10])}...")
 
     except Exception as e:
         report['signal_extraction_error'] = str(e)
@@ -55,8 +63,10 @@ def diagnose_monitor_failure(
         logger.error(f"Signal extraction failed: {e}")
         return report
 
-    # Validate each specification
+    # Validate each specification. Signal inspections are shared by all
+    # failing specifications
     spec_reports = []
+    signal_stats = {}
     for i, spec in enumerate(monitor.specifications):
         if verbose:
             logger.subsection(f"Specification {i+1}: {spec.name}")
@@ -81,14 +91,10 @@ def diagnose_monitor_failure(
 
         # Try to evaluate
         try:
-            required_signals = {
-                name: signals[name]
-                for name in spec.signal_names
-                if name in signals
-            }
-
-            if len(required_signals) == len(spec.signal_names):
-                robustness = spec.evaluate(required_signals)
+            # Specifications only read their own signals, so the extracted
+            # dict is passed as-is
+            if spec.signal_name_set.issubset(signals.keys()):
+                robustness = spec.evaluate(signals)
                 spec_report['evaluation_success'] = True
                 spec_report['robustness'] = robustness
 
@@ -108,7 +114,12 @@ def diagnose_monitor_failure(
 
             if verbose:
                 logger.error(f"  ✗ Evaluation error: {e}")
-                diagnosis = debugger.diagnose_evaluation_failure(spec, signals, e)
+                diagnosis = debugger.diagnose_evaluation_failure(
+                    spec, signals, e,
+                    signal_stats=signal_stats,
+                    spec_validation=spec_validation,
+                    signal_validation=signal_validation
+                )
                 spec_report['diagnosis'] = diagnosis
 
         spec_reports.append(spec_report)
@@ -158,21 +169,18 @@ def check_signal_availability(
     Returns:
         Availability report
     """
-    from ..signals.signal_extractor import SignalExtractor
-
     logger = get_logger()
 
     if verbose:
         logger.section("Signal Availability Check")
 
-    extractor = SignalExtractor()
-    available_signals = extractor.get_available_signals(stats_dict)
-
+    # Names only: no signal arrays are built for the check
+    available_set = _EXTRACTOR.get_available_signal_names(stats_dict)
     missing = []
     available = []
 
     for sig_name in required_signals:
-        if sig_name in available_signals:
+        if sig_name in available_set:
             available.append(sig_name)
         else:
             missing.append(sig_name)
@@ -182,11 +190,11 @@ def check_signal_availability(
         'available_signals': available,
         'missing_signals': missing,
         'all_available': len(missing) == 0,
-        'total_signals_in_stats': len(available_signals)
+        'total_signals_in_stats': len(available_set)
     }
 
     if verbose:
-        logger.info(f"Total signals in statistics: {len(available_signals)}")
+        logger.info(f"Total signals in statistics: {len(available_set)}")
         logger.info(f"Required signals: {len(required_signals)}")
         logger.info(f"  Available: {len(available)}")
         logger.info(f"  Missing: {len(missing)}")
@@ -197,9 +205,13 @@ def check_signal_availability(
                 logger.error(f"  - {sig}")
 
             logger.info("\nSuggested alternatives:")
-            # Suggest similar signal names
+            # Suggest similar signal names, in extraction order; available
+            # names are lowercased once
+            available_signals = _EXTRACTOR.get_available_signals(stats_dict)
+            available_lower = [(s, s.lower()) for s in available_signals]
             for sig in missing:
-                similar = [s for s in available_signals if sig.lower() in s.lower() or s.lower() in sig.lower()]
+                sig_lower = sig.lower()
+                similar = [s for s, s_lower in available_lower if sig_lower in s_lower or s_lower in sig_lower]
                 if similar:
                     logger.info(f"  {sig} → Maybe: {', '.join(similar[:3])}")
 
@@ -258,7 +270,7 @@ def validate_dse_configuration(
 
 
 def print_signal_statistics(
-    signals: Dict[str, List],
+    signals: Dict[str, Any],
     max_signals: int = 20
 ):
     """
@@ -273,12 +285,16 @@ def print_signal_statistics(
 
     logger.section(f"Signal Statistics ({len(signals)} signals)")
 
-    for i, (name, signal) in enumerate(signals.items()):
+    # Statistics of all displayed signals are computed in one batch
+    shown = dict(itertools.islice(signals.items(), max(max_signals, 0)))
+    all_stats = debugger.inspect_signals(shown)
+
+    for i, name in enumerate(signals):
         if i >= max_signals:
             logger.info(f"\n... and {len(signals) - max_signals} more signals")
             break
 
-        stats = debugger.inspect_signal(signal, name)
+        stats = all_stats[name]
 
         if not stats['empty']:
             logger.info(f"\n{i+1}. {name}")
@@ -21,6 +21,17 @@ class LogLevel(IntEnum):
     TRACE = 5       # Maximum verbosity with trace information
 
 
+# Plain-int copies of the LogLevel values, for the per-call level checks
+_ERROR = int(LogLevel.ERROR)
+_WARNING = int(LogLevel.WARNING)
+_INFO = int(LogLevel.INFO)
+_DEBUG = int(LogLevel.DEBUG)
+_TRACE = int(LogLevel.TRACE)
+
+_SECTION_SEPARATOR = "=" * 60
+_SUBSECTION_SEPARATOR = "-" * 60
+
+
 class STLLogger:
     """
     Centralized logger for STL operations.
@@ -47,11 +58,36 @@ class STLLogger:
         self.level = level
         self.output = output or sys.stdout
         self._indent_level = 0
+        # Message prefixes keyed by (name, level name, indent level)
+        self._prefixes = {}
+
+    @property
+    def level(self) -> LogLevel:
+        """Logging level."""
+        return LogLevel(self._level)
+
+    @level.setter
+    def level(self, level: LogLevel):
+        # Kept as a plain int: level checks run on every log call, and int
+        # comparisons skip IntEnum's method dispatch
+        self._level = int(level)
 
     def set_level(self, level: LogLevel):
         """Set logging level."""
         self.level = level
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Whether messages of the given level are emitted (check before building costly messages)."""
+        return self._level >= level
+
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are emitted (check before building costly messages)."""
+        return self._level >= _DEBUG
+
+    def is_trace_enabled(self) -> bool:
+        """Whether trace messages are emitted (check before building costly messages)."""
+        return self._level >= _TRACE
+
     def indent(self):
         """Increase indentation level."""
         self._indent_level += 1
@@ -65,55 +101,52 @@ class STLLogger:
         self._indent_level = 0
 
     def _format_message(self, level_name: str, message: str) -> str:
-        """Format log message with level and indentation."""
-        indent = "  " * self._indent_level
-        return f"[{self.name}] {level_name}: {indent}{message}"
+        """Format log message with level and indentation (prefixes are built once and cached)."""
+        key = (self.name, level_name, self._indent_level)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix = self._prefixes[key] = f"[{self.name}] {level_name}: {'  ' * self._indent_level}"
+        return prefix + message
 
     def error(self, message: str, **kwargs):
         """Log error message."""
-        if self.level >= LogLevel.ERROR:
+        if self._level >= _ERROR:
             formatted = self._format_message("ERROR", message)
             print(formatted, file=self.output, **kwargs)
 
     def warning(self, message: str, **kwargs):
         """Log warning message."""
-        if self.level >= LogLevel.WARNING:
+        if self._level >= _WARNING:
             formatted = self._format_message("WARNING", message)
             print(formatted, file=self.output, **kwargs)
 
     def info(self, message: str, **kwargs):
         """Log info message."""
-        if self.level >= LogLevel.INFO:
+        if self._level >= _INFO:
             formatted = self._format_message("INFO", message)
             print(formatted, file=self.output, **kwargs)
 
     def debug(self, message: str, **kwargs):
         """Log debug message."""
-        if self.level >= LogLevel.DEBUG:
+        if self._level >= _DEBUG:
             formatted = self._format_message("DEBUG", message)
             print(formatted, file=self.output, **kwargs)
 
     def trace(self, message: str, **kwargs):
         """Log trace message (maximum verbosity)."""
-        if self.level >= LogLevel.TRACE:
+        if self._level >= _TRACE:
             formatted = self._format_message("TRACE", message)
             print(formatted, file=self.output, **kwargs)
 
     def section(self, title: str):
-        """Log a section header."""
-        if self.level >= LogLevel.INFO:
-            separator = "=" * 60
-            print(f"\n{separator}", file=self.output)
-            print(f"  {title}", file=self.output)
-            print(f"{separator}\n", file=self.output)
+        """Log a section header (written in one call)."""
+        if self._level >= _INFO:
+            print(f"\n{_SECTION_SEPARATOR}\n  {title}\n{_SECTION_SEPARATOR}\n", file=self.output)
 
     def subsection(self, title: str):
-        """Log a subsection header."""
-        if self.level >= LogLevel.INFO:
-            separator = "-" * 60
-            print(f"\n{separator}", file=self.output)
-            print(f"  {title}", file=self.output)
-            print(f"{separator}", file=self.output)
+        """Log a subsection header (written in one call)."""
+        if self._level >= _INFO:
+            print(f"\n{_SUBSECTION_SEPARATOR}\n  {title}\n{_SUBSECTION_SEPARATOR}", file=self.output)
 
 
 # Global logger instance
@@ -6,6 +6,35 @@ Generates human-readable reports in various formats.
 
 from typing import List, Dict, Optional
 from datetime import datetime
+import io
+import itertools
+import sys
+
+
+# Fixed report text, built once at import
+_RULE_80 = "=" * 80
+_DASH_80 = "-" * 80
+_RULE_100 = "=" * 100
+_DASH_100 = "-" * 100
+_TEXT_REPORT_BANNER = f"{_RULE_80}\nSTL MONITORING REPORT\n{_RULE_80}\n"
+_DSE_TEXT_REPORT_BANNER = f"{_RULE_80}\nDESIGN SPACE EXPLORATION REPORT\n{_RULE_80}\n"
+_DSE_MD_TABLE_HEADER = (
+    "| Rank | Config | Min Rob. | Avg Rob. | All Sat? | Viol. | Latency | Energy | Area |\n"
+    "|------|--------|----------|----------|----------|-------|---------|--------|------|\n"
+)
+_DSE_MD_ROW = "| {} | {} | {:.4f} | {:.4f} | {} | {} | {:.2e} | {:.2e} | {:.2f} |\n"
+_DSE_MD_ROW_NO_STATS = "| {} | {} | {:.4f} | {:.4f} | {} | {} | N/A | N/A | N/A |\n"
+
+
+def _timestamp() -> str:
+    """Generation time shown in report headers."""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _write_report(filename: str, report: str):
+    """Write a report as UTF-8 in one binary write (no text-layer encoding per chunk)."""
+    with open(filename, 'wb') as f:
+        f.write(report.encode('utf-8'))
 
 
 def generate_stl_report(
@@ -24,93 +53,93 @@ def generate_stl_report(
     Returns:
         Report string (if filename is None)
     """
+    timestamp = _timestamp()
     if format == 'txt':
-        report = _generate_text_report(results)
+        report = _generate_text_report(results, timestamp)
     elif format == 'md':
-        report = _generate_markdown_report(results)
+        report = _generate_markdown_report(results, timestamp)
     else:
         raise ValueError(f"Unsupported format: {format}")
 
     if filename:
-        with open(filename, 'w') as f:
-            f.write(report)
+        _write_report(filename, report)
         print(f"Report saved to {filename}")
         return None
     else:
         return report
 
 
-def _generate_text_report(results: List[Dict]) -> str:
+def _generate_text_report(results: List[Dict], timestamp: str) -> str:
     """Generate plain text report."""
-    lines = []
-
-    lines.append("=" * 80)
-    lines.append("STL MONITORING REPORT")
-    lines.append("=" * 80)
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"Total Specifications: {len(results)}")
-    lines.append("")
-
-    # Summary
-    satisfied = sum(1 for r in results if r['satisfied'])
+    # Individual results, written first so the summary is counted in the
+    # same pass
+    items = io.StringIO()
+    satisfied = 0
+    for i, result in enumerate(results, 1):
+        satisfied += bool(result['satisfied'])
+        items.write(
+            f"\n{i}. {result['name']}\n"
+            f"   Formula: {result['specification']}\n"
+            f"   Robustness: {result['robustness']:.6f}\n"
+            f"   Status: {'SATISFIED' if result['satisfied'] else 'VIOLATED'}\n"
+            f"   Signals used: {', '.join(result['signals_used'])}\n"
+        )
     violated = len(results) - satisfied
 
-    lines.append("SUMMARY:")
-    lines.append(f"  Satisfied: {satisfied}")
-    lines.append(f"  Violated: {violated}")
-    lines.append("")
+    buf = io.StringIO()
+    write = buf.write
 
-    # Individual results
-    lines.append("SPECIFICATION RESULTS:")
-    lines.append("-" * 80)
+    write(_TEXT_REPORT_BANNER)
+    write(f"Generated: {timestamp}\n")
+    write(f"Total Specifications: {len(results)}\n\n")
 
-    for i, result in enumerate(results, 1):
-        lines.append(f"\n{i}. {result['name']}")
-        lines.append(f"   Formula: {result['specification']}")
-        lines.append(f"   Robustness: {result['robustness']:.6f}")
-        lines.append(f"   Status: {'SATISFIED' if result['satisfied'] else 'VIOLATED'}")
-        lines.append(f"   Signals used: {', '.join(result['signals_used'])}")
+    # Summary
+    write("SUMMARY:\n")
+    write(f"  Satisfied: {satisfied}\n")
+    write(f"  Violated: {violated}\n\n")
 
-    lines.append("\n" + "=" * 80)
+    write("SPECIFICATION RESULTS:\n")
+    write(_DASH_80 + "\n")
+    write(items.getvalue())
+    write("\n" + _RULE_80)
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _generate_markdown_report(results: List[Dict]) -> str:
+def _generate_markdown_report(results: List[Dict], timestamp: str) -> str:
     """Generate markdown report."""
-    lines = []
-
-    lines.append("# STL Monitoring Report")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Total Specifications:** {len(results)}")
-    lines.append("")
-
-    # Summary
-    satisfied = sum(1 for r in results if r['satisfied'])
+    # Individual results, written first so the summary is counted in the
+    # same pass
+    items = io.StringIO()
+    satisfied = 0
+    for i, result in enumerate(results, 1):
+        satisfied += bool(result['satisfied'])
+        status_icon = "✅" if result['satisfied'] else "❌"
+        items.write(
+            f"\n### {i}. {result['name']} {status_icon}\n\n"
+            f"- **Formula:** `{result['specification']}`\n"
+            f"- **Robustness:** {result['robustness']:.6f}\n"
+            f"- **Status:** {'SATISFIED' if result['satisfied'] else 'VIOLATED'}\n"
+            f"- **Signals:** {', '.join(result['signals_used'])}\n"
+        )
     violated = len(results) - satisfied
 
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **Satisfied:** {satisfied}")
-    lines.append(f"- **Violated:** {violated}")
-    lines.append("")
+    buf = io.StringIO()
+    write = buf.write
 
-    # Individual results
-    lines.append("## Specification Results")
-    lines.append("")
+    write("# STL Monitoring Report\n\n")
+    write(f"**Generated:** {timestamp}\n")
+    write(f"**Total Specifications:** {len(results)}\n\n")
 
-    for i, result in enumerate(results, 1):
-        status_icon = "✅" if result['satisfied'] else "❌"
-        lines.append(f"### {i}. {result['name']} {status_icon}")
-        lines.append("")
-        lines.append(f"- **Formula:** `{result['specification']}`")
-        lines.append(f"- **Robustness:** {result['robustness']:.6f}")
-        lines.append(f"- **Status:** {'SATISFIED' if result['satisfied'] else 'VIOLATED'}")
-        lines.append(f"- **Signals:** {', '.join(result['signals_used'])}")
-        lines.append("")
+    # Summary
+    write("## Summary\n\n")
+    write(f"- **Satisfied:** {satisfied}\n")
+    write(f"- **Violated:** {violated}\n\n")
+
+    write("## Specification Results\n")
+    write(items.getvalue())
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_dse_report(
@@ -131,16 +160,16 @@ def generate_dse_report(
     Returns:
         Report string (if filename is None)
     """
+    timestamp = _timestamp()
     if format == 'txt':
-        report = _generate_dse_text_report(dse_results, include_violations)
+        report = _generate_dse_text_report(dse_results, include_violations, timestamp)
     elif format == 'md':
-        report = _generate_dse_markdown_report(dse_results, include_violations)
+        report = _generate_dse_markdown_report(dse_results, include_violations, timestamp)
     else:
         raise ValueError(f"Unsupported format: {format}")
 
     if filename:
-        with open(filename, 'w') as f:
-            f.write(report)
+        _write_report(filename, report)
         print(f"DSE report saved to {filename}")
         return None
     else:
@@ -149,115 +178,111 @@ def generate_dse_report(
 
 def _generate_dse_text_report(
     dse_results: List[Dict],
-    include_violations: bool
+    include_violations: bool,
+    timestamp: str
 ) -> str:
     """Generate plain text DSE report."""
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
 
-    lines.append("=" * 80)
-    lines.append("DESIGN SPACE EXPLORATION REPORT")
-    lines.append("=" * 80)
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"Total Configurations: {len(dse_results)}")
-    lines.append("")
+    write(_DSE_TEXT_REPORT_BANNER)
+    write(f"Generated: {timestamp}\n")
+    write(f"Total Configurations: {len(dse_results)}\n\n")
 
     # Summary
     satisfying = sum(1 for r in dse_results if r.get('satisfies_all', False))
-    lines.append("SUMMARY:")
-    lines.append(f"  Configurations satisfying all constraints: {satisfying}")
-    lines.append(f"  Configurations with violations: {len(dse_results) - satisfying}")
-    lines.append("")
+    write("SUMMARY:\n")
+    write(f"  Configurations satisfying all constraints: {satisfying}\n")
+    write(f"  Configurations with violations: {len(dse_results) - satisfying}\n\n")
 
     # Top configurations
-    lines.append("TOP CONFIGURATIONS (by minimum robustness):")
-    lines.append("-" * 80)
-
-    for i, result in enumerate(dse_results[:10], 1):  # Top 10
-        lines.append(f"\nRank {i}: {result['config_name']}")
-        lines.append(f"  Min Robustness: {result['min_robustness']:.6f}")
-        lines.append(f"  Avg Robustness: {result['avg_robustness']:.6f}")
-        lines.append(f"  Satisfies All: {result['satisfies_all']}")
-        lines.append(f"  Violations: {result['num_violations']}")
-
-        if 'stats' in result:
-            stats = result['stats']
-            lines.append(f"  Latency: {stats.get('latency', 'N/A'):.6e} s")
-            lines.append(f"  Energy: {stats.get('energy', 'N/A'):.6e} pJ")
-            lines.append(f"  Area: {stats.get('area', 'N/A'):.2f} mm²")
-
-        if include_violations and result['num_violations'] > 0:
-            lines.append("  Violated Constraints:")
+    write("TOP CONFIGURATIONS (by minimum robustness):\n")
+    write(_DASH_80 + "\n")
+
+    for i, result in enumerate(itertools.islice(dse_results, 10), 1):  # Top 10
+        num_violations = result['num_violations']
+        stats = result.get('stats')
+        write(
+            f"\nRank {i}: {result['config_name']}\n"
+            f"  Min Robustness: {result['min_robustness']:.6f}\n"
+            f"  Avg Robustness: {result['avg_robustness']:.6f}\n"
+            f"  Satisfies All: {result['satisfies_all']}\n"
+            f"  Violations: {num_violations}\n"
+        )
+
+        if stats is not None:
+            write(
+                f"  Latency: {stats.get('latency', 'N/A'):.6e} s\n"
+                f"  Energy: {stats.get('energy', 'N/A'):.6e} pJ\n"
+                f"  Area: {stats.get('area', 'N/A'):.2f} mm²\n"
+            )
+
+        if include_violations and num_violations > 0:
+            write("  Violated Constraints:\n")
             for stl_result in result.get('stl_results', []):
                 if not stl_result['satisfied']:
-                    lines.append(f"    - {stl_result['name']}: {stl_result['robustness']:.6f}")
+                    write(f"    - {stl_result['name']}: {stl_result['robustness']:.6f}\n")
 
-    lines.append("\n" + "=" * 80)
+    write("\n" + _RULE_80)
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def _generate_dse_markdown_report(
     dse_results: List[Dict],
-    include_violations: bool
+    include_violations: bool,
+    timestamp: str
 ) -> str:
     """Generate markdown DSE report."""
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
 
-    lines.append("# Design Space Exploration Report")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Total Configurations:** {len(dse_results)}")
-    lines.append("")
+    write("# Design Space Exploration Report\n\n")
+    write(f"**Generated:** {timestamp}\n")
+    write(f"**Total Configurations:** {len(dse_results)}\n\n")
 
     # Summary
     satisfying = sum(1 for r in dse_results if r.get('satisfies_all', False))
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **Configurations satisfying all constraints:** {satisfying}")
-    lines.append(f"- **Configurations with violations:** {len(dse_results) - satisfying}")
-    lines.append("")
+    write("## Summary\n\n")
+    write(f"- **Configurations satisfying all constraints:** {satisfying}\n")
+    write(f"- **Configurations with violations:** {len(dse_results) - satisfying}\n\n")
 
     # Top configurations table
-    lines.append("## Top Configurations")
-    lines.append("")
-    lines.append("| Rank | Config | Min Rob. | Avg Rob. | All Sat? | Viol. | Latency | Energy | Area |")
-    lines.append("|------|--------|----------|----------|----------|-------|---------|--------|------|")
-
-    for i, result in enumerate(dse_results[:10], 1):  # Top 10
-        config_name = result['config_name']
-        min_rob = f"{result['min_robustness']:.4f}"
-        avg_rob = f"{result['avg_robustness']:.4f}"
-        all_sat = "✅" if result['satisfies_all'] else "❌"
-        viol = str(result['num_violations'])
-
-        if 'stats' in result:
-            stats = result['stats']
-            latency = f"{stats.get('latency', 0):.2e}"
-            energy = f"{stats.get('energy', 0):.2e}"
-            area = f"{stats.get('area', 0):.2f}"
+    write("## Top Configurations\n\n")
+    write(_DSE_MD_TABLE_HEADER)
+
+    for i, result in enumerate(itertools.islice(dse_results, 10), 1):  # Top 10
+        stats = result.get('stats')
+        if stats is not None:
+            template = _DSE_MD_ROW
+            latency = stats.get('latency', 0)
+            energy = stats.get('energy', 0)
+            area = stats.get('area', 0)
         else:
-            latency = energy = area = "N/A"
+            template = _DSE_MD_ROW_NO_STATS
+            latency = energy = area = None
 
-        lines.append(f"| {i} | {config_name} | {min_rob} | {avg_rob} | {all_sat} | {viol} | {latency} | {energy} | {area} |")
-
-    lines.append("")
+        write(template.format(
+            i, result['config_name'], result['min_robustness'], result['avg_robustness'],
+            "✅" if result['satisfies_all'] else "❌", result['num_violations'],
+            latency, energy, area
+        ))
 
     # Detailed violations (if requested)
     if include_violations:
-        lines.append("## Detailed Constraint Violations")
-        lines.append("")
+        write("\n## Detailed Constraint Violations\n")
 
-        for i, result in enumerate(dse_results[:5], 1):  # Top 5
+        for i, result in enumerate(itertools.islice(dse_results, 5), 1):  # Top 5
             if result['num_violations'] > 0:
-                lines.append(f"### {i}. {result['config_name']}")
-                lines.append("")
+                write(f"\n### {i}. {result['config_name']}\n\n")
                 for stl_result in result.get('stl_results', []):
                     if not stl_result['satisfied']:
-                        lines.append(f"- **{stl_result['name']}**: {stl_result['robustness']:.6f}")
-                        lines.append(f"  - Formula: `{stl_result['specification']}`")
-                lines.append("")
+                        write(
+                            f"- **{stl_result['name']}**: {stl_result['robustness']:.6f}\n"
+                            f"  - Formula: `{stl_result['specification']}`\n"
+                        )
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def print_comparison_table(
@@ -274,26 +299,26 @@ def print_comparison_table(
     if config_names is None:
         config_names = comparison['configs']
 
-    print("\n" + "=" * 100)
-    print("CONFIGURATION COMPARISON")
-    print("=" * 100)
+    out = io.StringIO()
+    write = out.write
+
+    write(f"\n{_RULE_100}\nCONFIGURATION COMPARISON\n{_RULE_100}\n")
 
-    # Print header
-    header = f"{'Metric':<25} | " + " | ".join(f"{name:<15}" for name in config_names)
-    print(header)
-    print("-" * 100)
+    # Header
+    write(f"{'Metric':<25} | " + " | ".join(f"{name:<15}" for name in config_names) + "\n")
+    write(_DASH_100 + "\n")
 
-    # Print metrics
+    # Metrics
     for metric, values in comparison['metrics'].items():
-        row = f"{metric:<25} | "
-        for config_name in config_names:
-            value = values.get(config_name, 'N/A')
-            if isinstance(value, float):
-                row += f"{value:<15.6e} | "
-            elif isinstance(value, bool):
-                row += f"{str(value):<15} | "
-            else:
-                row += f"{str(value):<15} | "
-        print(row)
-
-    print("=" * 100 + "\n")
+        # Floats (including NumPy floats) in scientific notation, anything
+        # else (bools, ints, 'N/A' for missing) as its string
+        cells = [
+            f"{value:<15.6e}" if isinstance(value, float) else f"{str(value):<15}"
+            for value in map(values.get, config_names, itertools.repeat('N/A'))
+        ]
+        write(f"{metric:<25} | " + "".join(cell + " | " for cell in cells) + "\n")
+
+    write(_RULE_100 + "\n\n")
+
+    # The whole table goes out in one write
+    sys.stdout.write(out.getvalue())
@@ -4,12 +4,108 @@ Visualization utilities for STL monitoring and analysis.
 Provides functions for plotting signals, robustness values, and DSE results.
 """
 
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Union
 import warnings
+import numpy as np
+
+
+# matplotlib.pyplot once imported; _pyplot_missing records a failed import so
+# later calls neither retry it nor pay for the exception
+_pyplot = None
+_pyplot_missing = False
+
+
+def _get_pyplot(what: str):
+    """
+    Return matplotlib.pyplot, importing it on first use.
+
+    Args:
+        what: What the caller plots, for the warning if matplotlib is missing
+
+    Returns:
+        The pyplot module, or None (with a warning) if matplotlib is not installed
+    """
+    global _pyplot, _pyplot_missing
+    if _pyplot is None and not _pyplot_missing:
+        try:
+            import matplotlib.pyplot as plt
+            _pyplot = plt
+        except ImportError:
+            _pyplot_missing = True
+    if _pyplot is None:
+        warnings.warn(f"matplotlib not installed. Cannot plot {what}.")
+    return _pyplot
+
+
+def _new_figure(plt, figsize: Tuple[int, int], filename: Optional[str]):
+    """
+    Create a figure with one axes.
+
+    Figures that are only saved are standalone Agg figures: they skip
+    pyplot's backend selection and global figure registry (so they can be
+    drawn from worker threads). Figures to display go through pyplot.
+
+    Args:
+        plt: The pyplot module
+        figsize: Figure size (width, height)
+        filename: File the figure will be saved to, or None to display it
+
+    Returns:
+        Tuple of (figure, axes)
+    """
+    if filename:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots()
+    return plt.subplots(figsize=figsize)
+
+
+def _finish_figure(plt, fig, filename: Optional[str]):
+    """Save a figure from _new_figure() to filename, or show and close it."""
+    if filename:
+        fig.savefig(filename, dpi=300, bbox_inches='tight')
+        print(f"Plot saved to {filename}")
+    else:
+        plt.show()
+        plt.close(fig)
+
+
+# Longer signals are decimated before plotting
+_PLOT_MAX_POINTS = 2000
+
+
+def _decimate_min_max(signal: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Reduce an (N, 2) signal to about max_points rows, keeping its envelope.
+
+    The signal is split into buckets of consecutive samples and only the
+    minimum and maximum sample of each bucket are kept, in time order, so
+    spikes stay visible. Samples after the last full bucket are kept as is.
+
+    Args:
+        signal: (N, 2) array of (time, value) rows
+        max_points: Approximate number of rows to keep
+
+    Returns:
+        (M, 2) array of the kept rows
+    """
+    n = signal.shape[0]
+    bucket = -(-2 * n // max_points)
+    num_buckets = n // bucket
+    values = signal[:num_buckets * bucket, 1].reshape(num_buckets, bucket)
+    offsets = np.arange(num_buckets) * bucket
+    keep = np.concatenate((
+        offsets + values.argmin(axis=1),
+        offsets + values.argmax(axis=1),
+        np.arange(num_buckets * bucket, n)
+    ))
+    return signal[np.unique(keep)]
 
 
 def plot_signals(
-    signals: Dict[str, List[Tuple[float, float]]],
+    signals: Dict[str, Union[np.ndarray, List[Tuple[float, float]]]],
     title: str = "Signal Plot",
     filename: Optional[str] = None,
     figsize: Tuple[int, int] = (12, 6)
@@ -18,7 +114,7 @@ def plot_signals(
     Plot time-series signals.
 
     Args:
-        signals: Dictionary mapping signal names to [(time, value), ...] data
+        signals: Dictionary mapping signal names to (N, 2) arrays or [(time, value), ...] data
         title: Plot title
         filename: Optional filename to save plot (if None, displays interactively)
         figsize: Figure size (width, height)
@@ -26,18 +122,20 @@ def plot_signals(
     Note:
         Requires matplotlib. If not installed, prints warning and returns.
     """
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError:
-        warnings.warn("matplotlib not installed. Cannot plot signals.")
+    plt = _get_pyplot("signals")
+    if plt is None:
         return
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(plt, figsize, filename)
 
     for signal_name, data in signals.items():
-        times = [t for t, _ in data]
-        values = [v for _, v in data]
-        ax.plot(times, values, label=signal_name, marker='o', markersize=2)
+        data = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+        if data.shape[0] > _PLOT_MAX_POINTS:
+            # Per-sample markers would be unreadable and dominate rendering
+            data = _decimate_min_max(data, _PLOT_MAX_POINTS)
+            ax.plot(data[:, 0], data[:, 1], label=signal_name)
+        else:
+            ax.plot(data[:, 0], data[:, 1], label=signal_name, marker='o', markersize=2)
 
     ax.set_xlabel('Time (cycles)')
     ax.set_ylabel('Value')
@@ -45,13 +143,7 @@ def plot_signals(
     ax.legend()
     ax.grid(True, alpha=0.3)
 
-    if filename:
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"Plot saved to {filename}")
-    else:
-        plt.show()
-
-    plt.close()
+    _finish_figure(plt, fig, filename)
 
 
 def plot_robustness(
@@ -70,19 +162,17 @@ def plot_robustness(
         figsize: Figure size
 
     Note:
-        Requires matplotlib.
+        Requires matplotlib (3.4 or newer).
     """
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError:
-        warnings.warn("matplotlib not installed. Cannot plot robustness.")
+    plt = _get_pyplot("robustness")
+    if plt is None:
         return
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(plt, figsize, filename)
 
     spec_names = [r['name'] for r in results]
-    robustness_values = [r['robustness'] for r in results]
-    colors = ['green' if r >= 0 else 'red' for r in robustness_values]
+    robustness_values = np.fromiter((r['robustness'] for r in results), dtype=np.float64, count=len(results))
+    colors = np.where(robustness_values >= 0, 'green', 'red')
 
     bars = ax.bar(range(len(spec_names)), robustness_values, color=colors, alpha=0.7)
 
@@ -94,23 +184,12 @@ def plot_robustness(
     ax.axhline(y=0, color='black', linestyle='--', linewidth=1)
     ax.grid(True, axis='y', alpha=0.3)
 
-    # Add value labels on bars
-    for i, (bar, value) in enumerate(zip(bars, robustness_values)):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{value:.3f}',
-                ha='center', va='bottom' if height >= 0 else 'top',
-                fontsize=8)
+    # Add value labels at the end of each bar (above positive, below negative)
+    ax.bar_label(bars, labels=[f'{value:.3f}' for value in robustness_values], fontsize=8)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    if filename:
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"Plot saved to {filename}")
-    else:
-        plt.show()
-
-    plt.close()
+    _finish_figure(plt, fig, filename)
 
 
 def plot_dse_comparison(
@@ -137,30 +216,38 @@ def plot_dse_comparison(
     Note:
         Requires matplotlib.
     """
-    try:
-        import matplotlib.pyplot as plt
-        import matplotlib.cm as cm
-        from matplotlib.colors import Normalize
-    except ImportError:
-        warnings.warn("matplotlib not installed. Cannot plot DSE comparison.")
+    plt = _get_pyplot("DSE comparison")
+    if plt is None:
         return
+    import matplotlib.cm as cm
+    from matplotlib.colors import Normalize
 
     # Filter to top-k if specified
     if top_k:
         dse_results = dse_results[:top_k]
 
-    # Extract data
-    x_values = [r['stats'].get(x_metric, 0) for r in dse_results if 'stats' in r]
-    y_values = [r['stats'].get(y_metric, 0) for r in dse_results if 'stats' in r]
-    config_names = [r['config_name'] for r in dse_results if 'stats' in r]
+    # Extract data of the results with stats in one pass
+    x_values = []
+    y_values = []
+    config_names = []
+    min_robustness = []
+    satisfies_all = []
+    for r in dse_results:
+        stats = r.get('stats')
+        if stats is None:
+            continue
+        x_values.append(stats.get(x_metric, 0))
+        y_values.append(stats.get(y_metric, 0))
+        config_names.append(r['config_name'])
+        min_robustness.append(r.get('min_robustness', 0))
+        satisfies_all.append(r.get('satisfies_all', False))
 
     if color_by == 'min_robustness':
-        colors = [r.get('min_robustness', 0) for r in dse_results if 'stats' in r]
+        colors = np.asarray(min_robustness, dtype=np.float64)
         cmap = cm.RdYlGn
-        norm = Normalize(vmin=min(colors), vmax=max(colors))
+        norm = Normalize(vmin=colors.min(), vmax=colors.max())
     elif color_by == 'satisfies_all':
-        colors = ['green' if r.get('satisfies_all', False) else 'red'
-                  for r in dse_results if 'stats' in r]
+        colors = np.where(np.asarray(satisfies_all, dtype=bool), 'green', 'red')
         cmap = None
         norm = None
     else:
@@ -168,12 +255,12 @@ def plot_dse_comparison(
         cmap = None
         norm = None
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(plt, figsize, filename)
 
     if cmap:
         scatter = ax.scatter(x_values, y_values, c=colors, cmap=cmap, norm=norm,
                             s=100, alpha=0.6, edgecolors='black', linewidth=1)
-        plt.colorbar(scatter, ax=ax, label=color_by)
+        fig.colorbar(scatter, ax=ax, label=color_by)
     else:
         scatter = ax.scatter(x_values, y_values, c=colors, s=100, alpha=0.6,
                             edgecolors='black', linewidth=1)
@@ -188,15 +275,21 @@ def plot_dse_comparison(
     ax.set_title(f'Design Space Exploration: {x_metric} vs {y_metric}')
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    if filename:
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"Plot saved to {filename}")
-    else:
-        plt.show()
+    _finish_figure(plt, fig, filename)
 
-    plt.close()
+
+def _metric_columns(dse_results: List[Dict], x_metric: str, y_metric: str) -> Tuple[List, List]:
+    """Two stats metrics (missing: 0) of the results that have stats, in one pass."""
+    x_values = []
+    y_values = []
+    for r in dse_results:
+        stats = r.get('stats')
+        if stats is not None:
+            x_values.append(stats.get(x_metric, 0))
+            y_values.append(stats.get(y_metric, 0))
+    return x_values, y_values
 
 
 def plot_pareto_frontier(
@@ -221,32 +314,28 @@ def plot_pareto_frontier(
     Note:
         Requires matplotlib.
     """
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError:
-        warnings.warn("matplotlib not installed. Cannot plot Pareto frontier.")
+    plt = _get_pyplot("Pareto frontier")
+    if plt is None:
         return
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(plt, figsize, filename)
 
     # Plot all configurations
-    all_x = [r['stats'].get(x_metric, 0) for r in dse_results if 'stats' in r]
-    all_y = [r['stats'].get(y_metric, 0) for r in dse_results if 'stats' in r]
+    all_x, all_y = _metric_columns(dse_results, x_metric, y_metric)
     ax.scatter(all_x, all_y, c='lightgray', s=100, alpha=0.5,
                edgecolors='black', linewidth=1, label='All configs')
 
     # Plot Pareto frontier
-    pareto_x = [r['stats'].get(x_metric, 0) for r in pareto_configs if 'stats' in r]
-    pareto_y = [r['stats'].get(y_metric, 0) for r in pareto_configs if 'stats' in r]
+    pareto_x, pareto_y = _metric_columns(pareto_configs, x_metric, y_metric)
     ax.scatter(pareto_x, pareto_y, c='red', s=150, alpha=0.8,
                edgecolors='black', linewidth=2, label='Pareto optimal', marker='*')
 
     # Sort Pareto points and draw line
     if len(pareto_x) > 1:
-        pareto_points = sorted(zip(pareto_x, pareto_y))
-        pareto_x_sorted = [p[0] for p in pareto_points]
-        pareto_y_sorted = [p[1] for p in pareto_points]
-        ax.plot(pareto_x_sorted, pareto_y_sorted, 'r--', alpha=0.5, linewidth=1)
+        pareto_x = np.asarray(pareto_x, dtype=np.float64)
+        pareto_y = np.asarray(pareto_y, dtype=np.float64)
+        order = np.lexsort((pareto_y, pareto_x))  # by x, ties by y
+        ax.plot(pareto_x[order], pareto_y[order], 'r--', alpha=0.5, linewidth=1)
 
     ax.set_xlabel(x_metric)
     ax.set_ylabel(y_metric)
@@ -254,12 +343,6 @@ def plot_pareto_frontier(
     ax.legend()
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    if filename:
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"Plot saved to {filename}")
-    else:
-        plt.show()
+    fig.tight_layout()
 
-    plt.close()
+    _finish_figure(plt, fig, filename)
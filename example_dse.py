@@ -37,6 +37,9 @@ from analyzer.stl import (
 from analyzer.stl.dse import ParetoFrontier, RobustnessRanker
 from analyzer.stl.utils import generate_dse_report
 
+# Shared memory size (MB) reported per unit of depth
+_SHARED_MB_PER_DEPTH = (2048 * 8) / (1024 ** 2)
+
 # =========================================================================
 # OPTIONAL: Enable Debug Mode for DSE
 # =========================================================================
@@ -225,7 +228,7 @@ def main():
         configs.append(config)
         print(f"   Created: {name}")
         print(f"     - Matmul: {num_matmul}x {matmul_size}×{matmul_size}")
-        print(f"     - Shared mem: {shared_depth * 2048 * 8 / (1024**2):.1f} MB")
+        print(f"     - Shared mem: {shared_depth * _SHARED_MB_PER_DEPTH:.1f} MB")
 
     print()
     print(f"   Total configurations: {len(configs)}")
@@ -235,7 +238,7 @@ def main():
     # 4. RUN STL-GUIDED DSE
     # =========================================================================
     print("4. Running STL-guided design space exploration...")
-    print("   (This will simulate all configurations)")
+    print("   (This will simulate all configurations, one worker process per CPU)")
     print()
 
     dse = ConstraintBasedDSE(
@@ -244,8 +247,9 @@ def main():
         data_bitwidth=8
     )
 
-    # Explore design space
-    results = dse.explore_design_space(configs, verbose=True)
+    # Explore design space. Configurations are simulated independently, so
+    # they are spread over all CPUs (n_jobs=-1)
+    results = dse.explore_design_space(configs, verbose=True, n_jobs=-1)
 
     print()
     print("   Exploration completed!")
@@ -0,0 +1,120 @@
+"""
+Regression tests for batched constraint evaluation in the DSE.
+
+evaluate_batch() over stacked signals has to agree with evaluate() per
+design: padding of shorter signals is ignored, but NaN samples propagate.
+"""
+
+import numpy as np
+import pytest
+
+import analyzer.stl.dse.constraint_checker as constraint_checker
+from analyzer.stl import ConstraintBasedDSE, PerformanceConstraints, PowerConstraints
+from analyzer.stl.constraints.composite_constraints import pareto_optimal
+from analyzer.stl.core.robustness import stack_signals
+from analyzer.stl.core.specification import STLSpecification
+
+
+SIGNAL_NAMES = ['latency', 'energy', 'area']
+
+SPECS = [
+    PowerConstraints.max_energy(10.0),
+    PerformanceConstraints.max_latency(0.5),
+    pareto_optimal(1.0, 10.0, 1.0),
+    STLSpecification("eventually[1:3](latency < 0.5)", ['latency']),
+    STLSpecification("energy > 2.0", ['energy']),
+]
+
+
+def make_designs(rng):
+    """Signals of several designs with different lengths, NaN, inf and empty signals."""
+    designs = []
+    for n, special in ((5, None), (3, np.nan), (1, None), (4, np.inf), (6, np.nan), (0, None)):
+        signals = {}
+        for name in SIGNAL_NAMES:
+            values = rng.uniform(0.0, 12.0, n)
+            if special is not None and name == 'energy':
+                values[n // 2] = special
+            signals[name] = np.column_stack((np.arange(n, dtype=np.float64), values))
+        designs.append(signals)
+    designs.append({name: np.array([[0.0, np.nan], [1.0, np.nan]]) for name in SIGNAL_NAMES})
+    return designs
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=lambda spec: spec.name)
+def test_batch_matches_per_design(spec):
+    designs = make_designs(np.random.default_rng(3))
+    signals_batch, times, lengths = stack_signals(designs, SIGNAL_NAMES)
+    expected = [spec.evaluate(signals) for signals in designs]
+    np.testing.assert_array_equal(spec.evaluate_batch(signals_batch, times, lengths), expected)
+
+
+def test_all_nan_signal_is_not_satisfied():
+    spec = PowerConstraints.max_energy(10.0)
+    signals = {'energy': np.array([[0.0, np.nan], [1.0, np.nan]])}
+    signals_batch, times, lengths = stack_signals([signals], ['energy'])
+    assert np.isnan(spec.evaluate_batch(signals_batch, times, lengths)[0])
+
+
+class _Cfg:
+    def __init__(self, name, **stats):
+        self.name = name
+        self.stats = dict({'global_cycles': 4, 'latency': 0.5, 'energy': 1.0, 'area': 1.0}, **stats)
+
+    def __str__(self):
+        return f"cfg {self.name}"
+
+    def get_statistics(self):
+        return self.stats
+
+
+class _FailingSpec(STLSpecification):
+    """max_latency(1.0) whose evaluation raises for a negative latency."""
+
+    def evaluate_batch(self, signals_batch, times=None, lengths=None):
+        if (signals_batch['latency'] < 0).any():
+            raise ValueError("negative latency")
+        return super().evaluate_batch(signals_batch, times, lengths)
+
+
+@pytest.fixture(autouse=True)
+def simulate(monkeypatch):
+    monkeypatch.setattr(constraint_checker, "_simulate_config",
+                        lambda model, config, *args, **kwargs: config.get_statistics())
+
+
+@pytest.mark.parametrize("early_exit", ['none', 'unsatisfied', 'topk'])
+def test_nan_constraint_is_kept_and_violated(early_exit):
+    dse = ConstraintBasedDSE(None, [PowerConstraints.max_energy(10.0), PerformanceConstraints.max_latency(1.0)])
+    results = dse.explore_design_space([_Cfg('ok'), _Cfg('nan', energy=float('nan'))], early_exit=early_exit,
+                                       top_k=2 if early_exit == 'topk' else None)
+    result = {r['config_name']: r for r in results}['nan']
+    assert len(result['stl_results']) == 2
+    assert not result['satisfies_all']
+    assert np.isnan(result['min_robustness'])
+    assert results[0]['config_name'] == 'ok'
+
+
+def test_failing_configuration_does_not_fail_the_batch():
+    spec = _FailingSpec("always(latency < 1.0)", ['latency'], name="max_latency")
+    dse = ConstraintBasedDSE(None, [spec])
+    results = dse.explore_design_space([_Cfg('a'), _Cfg('bad', latency=-1.0), _Cfg('b')])
+    by_name = {r['config_name']: r for r in results}
+    assert 'negative latency' in by_name['bad']['error']
+    assert by_name['a']['satisfies_all'] and by_name['b']['satisfies_all']
+
+
+def test_topk_early_exit_requires_top_k():
+    dse = ConstraintBasedDSE(None, [PerformanceConstraints.max_latency(1.0)])
+    with pytest.raises(AssertionError):
+        dse.explore_design_space([_Cfg('a')], early_exit='topk')
+
+
+def test_topk_early_exit_keeps_the_top_k():
+    constraints = [PerformanceConstraints.max_latency(1.0), PowerConstraints.max_energy(5.0)]
+    rng = np.random.default_rng(4)
+    configs = [_Cfg(f'c{i}', latency=rng.uniform(0, 2), energy=rng.uniform(0, 10)) for i in range(20)]
+    full = ConstraintBasedDSE(None, constraints).explore_design_space(configs)
+    pruned = ConstraintBasedDSE(None, constraints).explore_design_space(configs, early_exit='topk', top_k=3)
+    assert [r['config_name'] for r in pruned] == [r['config_name'] for r in full[:3]]
+    assert [r['min_robustness'] for r in pruned] == [r['min_robustness'] for r in full[:3]]
@@ -0,0 +1,91 @@
+"""
+Regression tests for SpecificationBundle on nested formulas.
+
+The bundle shares subformulas between specifications, so a formula must
+evaluate the same in a bundle as on its own, and both must match a direct
+evaluation of the discrete-time semantics.
+"""
+
+import numpy as np
+import pytest
+
+from analyzer.stl.core import bundle
+from analyzer.stl.core.bundle import SpecificationBundle
+from analyzer.stl.core.specification import STLSpecification
+
+
+N = 12
+TIMES = np.arange(N, dtype=np.float64)
+
+
+def window(series, a, b, is_max):
+    """Min/max of series over samples with time in [t + a, t + b], for every t."""
+    reduce, empty = (np.max, -np.inf) if is_max else (np.min, np.inf)
+    out = np.empty(N)
+    for i, t in enumerate(TIMES):
+        inside = (TIMES >= t + a) & (TIMES <= t + b)
+        out[i] = reduce(series[inside]) if inside.any() else empty
+    return out
+
+
+def suffix(series, is_max):
+    """Min/max of series from every sample to the end of the trace."""
+    reduce = np.max if is_max else np.min
+    return np.array([reduce(series[i:]) for i in range(N)])
+
+
+# (formula, reference robustness from the latency and energy values)
+FORMULAS = [
+    ("always(latency < 2.0)",
+     lambda lat, en: suffix(2.0 - lat, False)[0]),
+    ("always((latency < 2.0) and eventually[0:3](energy > 1.0))",
+     lambda lat, en: suffix(np.minimum(2.0 - lat, window(en - 1.0, 0, 3, True)), False)[0]),
+    ("eventually[1:4](always[0:2](latency < 2.5) or not (energy > 0.5))",
+     lambda lat, en: window(np.maximum(window(2.5 - lat, 0, 2, False), -(en - 0.5)), 1, 4, True)[0]),
+    ("always((latency > 0.1) -> eventually[0:2](energy < 1.5))",
+     lambda lat, en: suffix(np.maximum(-(lat - 0.1), window(1.5 - en, 0, 2, True)), False)[0]),
+    ("always((energy > 1.0 and latency < 2.0) or (latency < 2.0 and energy > 1.0))",
+     lambda lat, en: suffix(np.minimum(en - 1.0, 2.0 - lat), False)[0]),
+]
+
+
+@pytest.fixture
+def signals():
+    rng = np.random.default_rng(2)
+    return {
+        'latency': np.column_stack((TIMES, rng.uniform(0.0, 3.0, N))),
+        'energy': np.column_stack((TIMES, rng.uniform(0.0, 2.0, N))),
+    }
+
+
+@pytest.fixture
+def specs():
+    return [STLSpecification(formula, ['latency', 'energy'], name=f"spec_{i}")
+            for i, (formula, _) in enumerate(FORMULAS)]
+
+
+def test_bundle_matches_reference(signals, specs):
+    expected = [reference(signals['latency'][:, 1], signals['energy'][:, 1]) for _, reference in FORMULAS]
+    np.testing.assert_allclose(SpecificationBundle(specs).evaluate_all(signals), expected)
+
+
+def test_bundle_matches_per_spec(signals, specs):
+    bundled = SpecificationBundle(specs).evaluate_all(signals)
+    separate = [SpecificationBundle([spec]).evaluate_all(signals)[0] for spec in specs]
+    assert bundled == separate
+
+
+def test_bundle_shares_subformulas(specs):
+    shared = SpecificationBundle(specs).num_nodes
+    assert shared < sum(SpecificationBundle([spec]).num_nodes for spec in specs)
+
+
+def test_bundle_matches_fast_path_specification(signals):
+    spec = STLSpecification("always(latency < 2.0)", ['latency'])
+    assert SpecificationBundle([spec]).evaluate_all(signals)[0] == pytest.approx(spec.evaluate(signals))
+
+
+def test_bundle_without_numba_matches(monkeypatch, signals, specs):
+    compiled = SpecificationBundle(specs).evaluate_all(signals)
+    monkeypatch.setattr(bundle, "NUMBA_AVAILABLE", False)
+    assert SpecificationBundle(specs).evaluate_all(signals) == compiled
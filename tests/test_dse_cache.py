@@ -0,0 +1,98 @@
+"""
+Regression tests for the DSE result cache keys.
+
+A cached result or stored statistics may only be reused for a configuration
+and model that simulate identically, so every simulation-relevant field has
+to reach the key.
+"""
+
+import pytest
+
+import analyzer.stl.dse.constraint_checker as constraint_checker
+from analyzer.core.hardware.accelerator import GenericAccelerator
+from analyzer.core.hardware.matmul import MatmulArray
+from analyzer.hardware_components.memories.offchip import OffChipMemory
+from analyzer.hardware_components.memories.shared import SharedMemory
+from analyzer.model_architectures.transformers.models.vit_tiny import ViTTiny
+from analyzer.stl import ConstraintBasedDSE, PerformanceConstraints
+from analyzer.stl.dse import DSEResult
+
+
+def make_accelerator(name="acc", replacement_strategy="random", buffer_length=16, depth=1024):
+    dram = OffChipMemory(name="offchip_mem_1", width=1024, depth=4096, action_latency=70e-9,
+                         cycle_time=5e-9, bus_clock_hz=200e6, bus_bitwidth=32, ports=2,
+                         prefetch_factor=2, burst_length=4)
+    accelerator = GenericAccelerator(name=name, cycle_time=5e-9, auto_interconnect=True, dram=dram)
+    accelerator.add_matmul_block(MatmulArray(rows=8, columns=8, data_bitwidth=8, buffer_length=buffer_length,
+                                             cycle_time=5e-9, name="sa_1"))
+    accelerator.add_memory_block(SharedMemory(name="shared_mem_1", width=256, depth=depth, cycle_time=5e-9,
+                                              action_latency=5e-9, ports=2, bus_bitwidth=32, word_size=8,
+                                              replacement_strategy=replacement_strategy))
+    return accelerator
+
+
+def make_dse(model=None, **kwargs):
+    return ConstraintBasedDSE(model, [PerformanceConstraints.max_latency(1.0)], **kwargs)
+
+
+@pytest.fixture
+def simulations(monkeypatch):
+    """Replace the simulator with fixed statistics and record simulated names."""
+    simulated = []
+
+    def simulate(model, config, data_bitwidth, analyzer_factory=None, seed=None):
+        simulated.append(config.name)
+        return {'global_cycles': 4, 'latency': 0.5, 'energy': 1.0, 'area': 1.0}
+
+    monkeypatch.setattr(constraint_checker, "_simulate_config", simulate)
+    return simulated
+
+
+def test_accelerator_name_does_not_change_key():
+    dse = make_dse()
+    assert dse._cache_key(make_accelerator("a")) == dse._cache_key(make_accelerator("b"))
+
+
+@pytest.mark.parametrize("changed", [
+    {'replacement_strategy': 'lru'},
+    {'buffer_length': 32},
+    {'depth': 2048},
+])
+def test_simulation_relevant_fields_change_key(changed):
+    dse = make_dse()
+    base = make_accelerator()
+    other = make_accelerator(**changed)
+    assert dse._cache_key(base) != dse._cache_key(other)
+    assert dse._stats_key(base) != dse._stats_key(other)
+
+
+def test_model_size_changes_key():
+    accelerator = make_accelerator()
+    small = make_dse(ViTTiny(num_layers=1))
+    large = make_dse(ViTTiny(num_layers=2))
+    assert small._cache_key(accelerator) != large._cache_key(accelerator)
+    assert small._stats_key(accelerator) != large._stats_key(accelerator)
+
+
+def test_seed_changes_key():
+    accelerator = make_accelerator()
+    assert make_dse(seed=1)._stats_key(accelerator) != make_dse(seed=2)._stats_key(accelerator)
+
+
+def test_replacement_strategy_misses_result_cache(simulations):
+    dse = make_dse()
+    dse.explore_design_space([make_accelerator("a")])
+    dse.explore_design_space([make_accelerator("b")])
+    dse.explore_design_space([make_accelerator("c", replacement_strategy="lru")])
+    assert simulations == ["a", "c"]
+
+
+def test_reused_result_does_not_share_containers(simulations):
+    dse = make_dse()
+    first = dse.explore_design_space([make_accelerator("a")])[0]
+    reused = dse.explore_design_space([make_accelerator("b")])[0]
+    assert isinstance(reused, DSEResult)
+    reused['stats']['latency'] = 99.0
+    reused['stl_results'][0]['robustness'] = 99.0
+    assert first['stats']['latency'] == 0.5
+    assert first['stl_results'][0]['robustness'] == pytest.approx(0.5)
@@ -0,0 +1,47 @@
+"""
+Tests for the DSEResult mapping.
+"""
+
+import copy
+import json
+
+import pytest
+
+from analyzer.stl.dse import DSEResult
+
+
+def make_result():
+    return DSEResult(config_name='a', min_robustness=0.5, satisfies_all=True, stats={'latency': 1.0})
+
+
+def test_no_instance_dict():
+    assert not hasattr(make_result(), '__dict__')
+
+
+def test_mapping_protocol_covers_set_fields():
+    result = make_result()
+    assert list(result) == ['config_name', 'stats', 'min_robustness', 'satisfies_all']
+    assert len(result) == 4
+    assert dict(result) == result.to_dict()
+    assert dict(result.items())['min_robustness'] == 0.5
+    assert 'error' not in result and result.get('error') is None
+    with pytest.raises(KeyError):
+        result['error']
+
+
+def test_converts_like_a_dict():
+    result = make_result()
+    assert json.loads(json.dumps(dict(result))) == dict(result)
+    assert copy.deepcopy(result) == result
+    assert result == {'config_name': 'a', 'stats': {'latency': 1.0}, 'min_robustness': 0.5,
+                      'satisfies_all': True}
+
+
+def test_item_assignment_is_limited_to_fields():
+    result = make_result()
+    result['pruned'] = True
+    assert result.pruned and len(result) == 5
+    with pytest.raises(KeyError):
+        result['unknown'] = 1
+    with pytest.raises(TypeError):
+        DSEResult(unknown=1)
@@ -0,0 +1,135 @@
+"""
+Regression tests comparing ParetoFrontier with the original pairwise implementation.
+"""
+
+import numpy as np
+import pytest
+
+from analyzer.stl.dse import pareto_frontier
+from analyzer.stl.dse.pareto_frontier import ParetoFrontier
+
+
+def reference_is_dominated(point1, point2, objectives, minimize):
+    """Original is_dominated(): point2 better or equal everywhere, strictly better once."""
+    better_or_equal = strictly_better = 0
+    for obj, is_minimize in zip(objectives, minimize):
+        val1 = point1.get(obj, float('inf') if is_minimize else float('-inf'))
+        val2 = point2.get(obj, float('inf') if is_minimize else float('-inf'))
+        if (val2 < val1) if is_minimize else (val2 > val1):
+            strictly_better += 1
+            better_or_equal += 1
+        elif val2 == val1:
+            better_or_equal += 1
+    return better_or_equal == len(objectives) and strictly_better > 0
+
+
+def reference_frontier(configurations, objectives, minimize):
+    """Original O(N^2) compute_pareto_frontier()."""
+    return [
+        config for i, config in enumerate(configurations)
+        if not any(reference_is_dominated(config, other, objectives, minimize)
+                   for j, other in enumerate(configurations) if i != j)
+    ]
+
+
+def reference_crowding(configurations, objectives):
+    """Original per-objective crowding_distance()."""
+    n = len(configurations)
+    if n <= 2:
+        return {i: float('inf') for i in range(n)}
+    crowding = {i: 0.0 for i in range(n)}
+    for obj in objectives:
+        order = sorted(range(n), key=lambda i: configurations[i].get(obj, 0))
+        crowding[order[0]] = crowding[order[-1]] = float('inf')
+        values = [configurations[i].get(obj, 0) for i in range(n)]
+        obj_range = max(values) - min(values)
+        if obj_range == 0:
+            continue
+        for k in range(1, n - 1):
+            crowding[order[k]] += (configurations[order[k + 1]][obj] - configurations[order[k - 1]][obj]) / obj_range
+    return crowding
+
+
+def make_configs(n, num_objectives, seed, discrete):
+    """Configurations with one metric per objective; discrete values produce ties."""
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 6, (n, num_objectives)) if discrete else rng.random((n, num_objectives))
+    names = [f"m{k}" for k in range(num_objectives)]
+    return [dict(zip(names, row.tolist()), id=i) for i, row in enumerate(values)], names
+
+
+CASES = [
+    (n, num_objectives, discrete)
+    for n in (1, 2, 5, 40, 100)
+    for num_objectives in (1, 2, 3)
+    for discrete in (False, True)
+]
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+@pytest.mark.parametrize("n,num_objectives,discrete", CASES)
+def test_frontier_matches_pairwise(monkeypatch, use_numba, n, num_objectives, discrete):
+    if not use_numba:
+        monkeypatch.setattr(pareto_frontier, "NUMBA_AVAILABLE", False)
+    configs, objectives = make_configs(n, num_objectives, seed=n * 10 + num_objectives, discrete=discrete)
+    for minimize in ([True] * num_objectives, [k % 2 == 0 for k in range(num_objectives)]):
+        expected = [c['id'] for c in reference_frontier(configs, objectives, minimize)]
+        actual = [c['id'] for c in ParetoFrontier.compute_pareto_frontier(configs, objectives, minimize)]
+        assert actual == expected
+
+
+def test_dominates_matches_pairwise():
+    configs, objectives = make_configs(40, 3, seed=7, discrete=True)
+    minimize = [True] * 3
+    for point1 in configs:
+        for point2 in configs:
+            costs1 = tuple(point1[obj] for obj in objectives)
+            costs2 = tuple(point2[obj] for obj in objectives)
+            assert pareto_frontier.dominates(costs2, costs1) == reference_is_dominated(
+                point1, point2, objectives, minimize)
+
+
+@pytest.mark.parametrize("n,num_objectives,discrete", CASES)
+def test_layers_match_pairwise(n, num_objectives, discrete):
+    configs, objectives = make_configs(n, num_objectives, seed=n + num_objectives, discrete=discrete)
+    minimize = [True] * num_objectives
+    remaining, expected = list(configs), []
+    while remaining:
+        layer = reference_frontier(remaining, objectives, minimize)
+        expected.append([c['id'] for c in layer])
+        remaining = [c for c in remaining if c not in layer]
+    actual = ParetoFrontier.rank_by_pareto_layers(configs, objectives, minimize)
+    assert [[c['id'] for c in layer] for layer in actual] == expected
+
+
+@pytest.mark.parametrize("n,num_objectives,discrete", CASES)
+def test_crowding_matches_reference(n, num_objectives, discrete):
+    configs, objectives = make_configs(n, num_objectives, seed=n * 7 + num_objectives, discrete=discrete)
+    assert ParetoFrontier.crowding_distance(configs, objectives) == reference_crowding(configs, objectives)
+
+
+def reference_hypervolume(points, objectives, reference_point):
+    """Original 2D hypervolume() loop."""
+    obj1, obj2 = objectives
+    hv, prev_x = 0.0, reference_point[obj1]
+    for point in sorted(points, key=lambda p: p[obj1]):
+        hv += (point[obj1] - prev_x) * (reference_point[obj2] - point[obj2])
+        prev_x = point[obj1]
+    return hv
+
+
+@pytest.mark.parametrize("points,expected", [
+    ([(1, 12), (2, 11)], 17.0),
+    ([(1, 12), (2, 5)], 23.0),
+])
+def test_hypervolume_points_beyond_reference(points, expected):
+    front = [{'m0': x, 'm1': y} for x, y in points]
+    assert ParetoFrontier.hypervolume(front, ['m0', 'm1'], {'m0': 10, 'm1': 10}) == expected
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 100])
+def test_hypervolume_matches_reference(n):
+    configs, objectives = make_configs(n, 2, seed=n, discrete=False)
+    reference_point = {'m0': 0.8, 'm1': 0.9}
+    assert (ParetoFrontier.hypervolume(configs, objectives, reference_point)
+            == reference_hypervolume(configs, objectives, reference_point))
@@ -0,0 +1,59 @@
+"""
+Regression tests comparing the numba robustness kernels with their NumPy fallbacks.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from analyzer.stl.core import bundle, robustness
+from analyzer.stl.core.robustness import temporal_robustness_always, temporal_robustness_eventually
+
+
+def make_signal(rng, n, special=()):
+    """(N, 2) signal with random values and the given special values scattered in."""
+    values = rng.normal(size=n)
+    for value in special:
+        values[rng.integers(n)] = value
+    return np.column_stack((np.arange(n, dtype=np.float64), values))
+
+
+SPECIAL_VALUES = [(), (np.inf,), (-np.inf,), (np.inf, -np.inf), (np.nan,), (np.nan, np.inf)]
+
+
+@pytest.mark.parametrize("special", SPECIAL_VALUES)
+@pytest.mark.parametrize("comparison", ['<', '<=', '>', '>='])
+@pytest.mark.parametrize("operator", [temporal_robustness_always, temporal_robustness_eventually])
+def test_temporal_reduce_matches_numpy(monkeypatch, special, comparison, operator):
+    rng = np.random.default_rng(0)
+    for n in (1, 2, 17, 200):
+        signal = make_signal(rng, n, special)
+        for interval in (None, (0.0, n / 2)):
+            compiled = operator(signal, 0.25, comparison, interval)
+            with monkeypatch.context() as patch:
+                patch.setattr(robustness, "NUMBA_AVAILABLE", False)
+                fallback = operator(signal, 0.25, comparison, interval)
+            np.testing.assert_equal(compiled, fallback)
+
+
+def test_temporal_reduce_propagates_nan_after_first_sample():
+    signal = np.array([[0.0, 0.1], [1.0, 0.2], [2.0, np.nan], [3.0, 0.3]])
+    assert np.isnan(temporal_robustness_always(signal, 1.0, '<'))
+    assert np.isnan(temporal_robustness_eventually(signal, 1.0, '>'))
+
+
+@pytest.mark.parametrize("special", SPECIAL_VALUES)
+@pytest.mark.parametrize("is_max", [False, True])
+def test_sliding_reduce_matches_sparse_table(monkeypatch, special, is_max):
+    rng = np.random.default_rng(1)
+    for n in (1, 5, 64, 300):
+        values = make_signal(rng, n, special)[:, 1]
+        times = np.arange(n, dtype=np.float64)
+        for interval in ((0.0, 0.0), (0.0, 3.0), (2.0, 10.0), (n + 1.0, n + 2.0)):
+            lo, hi = bundle._window_bounds(times, interval)
+            compiled = bundle._range_reduce(values, lo, hi, is_max)
+            with monkeypatch.context() as patch:
+                patch.setattr(bundle, "NUMBA_AVAILABLE", False)
+                fallback = bundle._range_reduce(values, lo, hi, is_max)
+            np.testing.assert_array_equal(compiled, fallback)